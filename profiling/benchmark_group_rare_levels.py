@@ -0,0 +1,60 @@
+"""Check GroupRareLevelsTransformer.transform latency stays flat over many calls, as in a
+long-running scorer where each batch brings levels not seen in fit.
+
+Run from this directory with: python benchmark_group_rare_levels.py
+"""
+
+import time
+
+import numpy as np
+import pandas as pd
+
+from tubular.nominal import GroupRareLevelsTransformer
+
+
+def create_batch(
+    rng: np.random.Generator,
+    n_rows: int,
+    n_levels: int,
+    batch: int,
+) -> pd.DataFrame:
+    """Batch of mostly seen levels, with 5% of rows taking levels unique to this batch."""
+    seen = np.array([f"level_{i}" for i in range(n_levels)], dtype=object)
+    values = seen[rng.zipf(1.5, n_rows) % n_levels]
+
+    unseen = rng.random(n_rows) < 0.05
+    values[unseen] = [f"new_{batch}_{i}" for i in range(unseen.sum())]
+
+    return pd.DataFrame({"a": values, "b": pd.Categorical(values)})
+
+
+if __name__ == "__main__":
+    n_rows, n_levels, n_calls, window = 1_000, 500, 2_000, 200
+
+    rng = np.random.default_rng(0)
+
+    x = GroupRareLevelsTransformer(
+        columns=["a", "b"],
+        cut_off_percent=0.001,
+        unseen_levels_to_rare=False,
+    )
+    x.fit(create_batch(rng, 100_000, n_levels, -1))
+
+    batches = [create_batch(rng, n_rows, n_levels, i) for i in range(n_calls)]
+
+    timings = []
+    for batch in batches:
+        start = time.perf_counter()
+        x.transform(batch)
+        timings.append(time.perf_counter() - start)
+
+    first = np.median(timings[:window]) * 1e3
+    last = np.median(timings[-window:]) * 1e3
+
+    print(f"{n_calls} transforms of {n_rows} rows, each with unseen levels")
+    print(f"median of first {window} calls: {first:.2f}ms")
+    print(f" median of last {window} calls: {last:.2f}ms ({last / first:.2f}x)")
+    print(
+        "non-rare levels after all calls: "
+        f"{ {c: len(levels) for c, levels in x.non_rare_levels.items()} }",
+    )
@@ -0,0 +1,67 @@
+"""Compare the memory and time of OneHotEncodingTransformer with dense, pandas sparse and scipy CSR
+output, for 30 columns of 100 levels.
+
+Run from this directory with: python benchmark_one_hot_sparse.py
+"""
+
+import time
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+from tubular.nominal import OneHotEncodingTransformer
+
+
+def create_dataset(n_rows: int, n_columns: int, n_levels: int) -> pd.DataFrame:
+    """Columns of uniformly distributed string levels."""
+    rng = np.random.default_rng(0)
+
+    levels = np.array([f"level_{i}" for i in range(n_levels)], dtype=object)
+
+    return pd.DataFrame(
+        {f"c{i}": levels[rng.integers(0, n_levels, n_rows)] for i in range(n_columns)},
+    )
+
+
+def dummy_bytes(output: pd.DataFrame, columns: list[str]) -> int:
+    """Memory used by the dummy columns of the output of transform."""
+    return int(output.drop(columns=columns).memory_usage(index=False, deep=True).sum())
+
+
+def csr_bytes(matrix: sparse.csr_matrix) -> int:
+    """Memory used by the arrays of a scipy CSR matrix."""
+    return matrix.data.nbytes + matrix.indices.nbytes + matrix.indptr.nbytes
+
+
+if __name__ == "__main__":
+    n_rows, n_columns, n_levels = 100_000, 30, 100
+
+    df = create_dataset(n_rows, n_columns, n_levels)
+    columns = list(df.columns)
+
+    results = {}
+
+    for sparse_output in [False, True]:
+        x = OneHotEncodingTransformer(columns=columns, sparse_output=sparse_output)
+        x.fit(df)
+
+        start = time.perf_counter()
+        output = x.transform(df)
+        elapsed = time.perf_counter() - start
+
+        name = "pandas sparse" if sparse_output else "dense"
+        results[name] = (elapsed, dummy_bytes(output, columns))
+
+    start = time.perf_counter()
+    matrix = x.transform_sparse(df)
+    results["scipy CSR"] = (time.perf_counter() - start, csr_bytes(matrix))
+
+    dense_bytes = results["dense"][1]
+
+    print(f"{n_rows} rows, {n_columns} columns of {n_levels} levels")
+    for name, (elapsed, n_bytes) in results.items():
+        print(
+            f"{name:>14}: {elapsed:6.2f}s, {n_bytes / 1e6:8.1f}MB "
+            f"({100 * (1 - n_bytes / dense_bytes):.1f}% less than dense)",
+        )
@@ -200,9 +200,15 @@ def minimal_attribute_dict():
         "GroupRareLevelsTransformer": {
             "columns": ["b"],
         },
+        "HashingEncoderTransformer": {
+            "columns": ["b"],
+        },
         "InteractionTransformer": {
             "columns": ["a", "b"],
         },
+        "IterativeImputer": {
+            "columns": ["a", "b"],
+        },
         "LogTransformer": {
             "columns": ["a"],
         },
@@ -221,6 +227,11 @@ def minimal_attribute_dict():
         "ModeImputer": {
             "columns": ["b"],
         },
+        "MultiKeyMappingTransformer": {
+            "columns": ["b", "c"],
+            "mapping_table": {("f", "a"): 1.5, ("g", "b"): 2.5},
+            "value_column": "d",
+        },
         "NearestMeanResponseImputer": {
             "columns": ["b"],
         },
@@ -253,6 +264,10 @@ def minimal_attribute_dict():
             "pd_method_name": "month",
             "columns": "b",
         },
+        "SeriesDtMethodBatchTransformer": {
+            "methods": [("year", "a_year"), ("month", "a_month")],
+            "columns": ["a"],
+        },
         "SeriesStrMethodTransformer": {
             "columns": ["b"],
             "new_column_name": "a",
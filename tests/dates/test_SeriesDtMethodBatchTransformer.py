@@ -0,0 +1,291 @@
+import re
+
+import numpy as np
+import polars as pl
+import pytest
+import test_aide as ta
+
+import tests.test_data as d
+from tests.base_tests import (
+    ColumnStrListInitTests,
+    DropOriginalInitMixinTests,
+    DropOriginalTransformMixinTests,
+    GenericTransformTests,
+    OtherBaseBehaviourTests,
+)
+from tests.dates.test_BaseDatetimeTransformer import (
+    DatetimeMixinTransformTests,
+)
+from tubular.dates import SeriesDtMethodBatchTransformer, SeriesDtMethodTransformer
+
+
+class TestInit(
+    ColumnStrListInitTests,
+    DropOriginalInitMixinTests,
+):
+    """Tests for SeriesDtMethodBatchTransformer.init()."""
+
+    @classmethod
+    def setup_class(cls):
+        cls.transformer_name = "SeriesDtMethodBatchTransformer"
+
+    def test_more_than_one_column_error(self):
+        """Test that an exception is raised if more than one column is passed."""
+        bad_columns = ["b", "c"]
+        with pytest.raises(
+            ValueError,
+            match=rf"SeriesDtMethodBatchTransformer: column should be a str or list of len 1, got {re.escape(str(bad_columns))}",
+        ):
+            SeriesDtMethodBatchTransformer(
+                methods=[("year", "a")],
+                columns=bad_columns,
+            )
+
+    @pytest.mark.parametrize("bad_methods", [[], ("year", "a"), "year", None])
+    def test_methods_not_list_error(self, bad_methods):
+        """Test that an exception is raised if methods is not a non-empty list."""
+        with pytest.raises(
+            TypeError,
+            match="SeriesDtMethodBatchTransformer: methods should be a non-empty list of tuples",
+        ):
+            SeriesDtMethodBatchTransformer(methods=bad_methods, columns="b")
+
+    @pytest.mark.parametrize(
+        "bad_method",
+        ["year", ("year",), ("year", "a", {}, "b")],
+    )
+    def test_methods_element_error(self, bad_method):
+        """Test that an exception is raised if an element of methods is not a tuple of len 2 or 3."""
+        with pytest.raises(
+            TypeError,
+            match=re.escape(
+                f"SeriesDtMethodBatchTransformer: methods should contain (pd_method_name, new_column_name) or (pd_method_name, new_column_name, pd_method_kwargs) tuples, got {bad_method} in position 1",
+            ),
+        ):
+            SeriesDtMethodBatchTransformer(
+                methods=[("month", "b"), bad_method],
+                columns="b",
+            )
+
+    def test_invalid_input_type_errors(self):
+        """Test that an exceptions are raised for invalid types inside methods."""
+        with pytest.raises(
+            TypeError,
+            match=r"SeriesDtMethodBatchTransformer: unexpected type \(\<class 'int'\>\) for pd_method_name in position 0, expecting str",
+        ):
+            SeriesDtMethodBatchTransformer(methods=[(1, "a")], columns="b")
+
+        with pytest.raises(
+            TypeError,
+            match=r"SeriesDtMethodBatchTransformer: unexpected type \(\<class 'int'\>\) for new_column_name in position 0, expecting str",
+        ):
+            SeriesDtMethodBatchTransformer(methods=[("year", 1)], columns="b")
+
+        with pytest.raises(
+            TypeError,
+            match=r"SeriesDtMethodBatchTransformer: pd_method_kwargs should be a dict but got type \<class 'int'\> in position 0",
+        ):
+            SeriesDtMethodBatchTransformer(methods=[("year", "a", 1)], columns="b")
+
+        with pytest.raises(
+            TypeError,
+            match=r"SeriesDtMethodBatchTransformer: unexpected type \(\<class 'int'\>\) for pd_method_kwargs key in position 1 of method 0, must be str",
+        ):
+            SeriesDtMethodBatchTransformer(
+                methods=[("year", "a", {"a": 1, 2: "b"})],
+                columns="b",
+            )
+
+    def test_exception_raised_non_pandas_method_passed(self):
+        """Test and exception is raised if a non pd.Series.dt method is passed for pd_method_name."""
+        with pytest.raises(
+            AttributeError,
+            match="""SeriesDtMethodBatchTransformer: error accessing "dt.b" method on pd.Series object - pd_method_name should be a pd.Series.dt method""",
+        ):
+            SeriesDtMethodBatchTransformer(
+                methods=[("year", "a"), ("b", "c")],
+                columns="b",
+            )
+
+    def test_duplicate_new_column_names_error(self):
+        """Test an exception is raised if two methods write to the same column."""
+        with pytest.raises(
+            ValueError,
+            match=re.escape(
+                "SeriesDtMethodBatchTransformer: new column names in methods should be unique, got ['a', 'a']",
+            ),
+        ):
+            SeriesDtMethodBatchTransformer(
+                methods=[("year", "a"), ("month", "a")],
+                columns="b",
+            )
+
+
+class TestTransform(
+    DatetimeMixinTransformTests,
+    DropOriginalTransformMixinTests,
+    GenericTransformTests,
+):
+    """Tests for SeriesDtMethodBatchTransformer.transform()."""
+
+    @classmethod
+    def setup_class(cls):
+        cls.transformer_name = "SeriesDtMethodBatchTransformer"
+
+    def expected_df_1():
+        """Expected output of test_expected_output_no_overwrite."""
+        df = d.create_datediff_test_df()
+
+        df["a_year"] = np.array(
+            [1993, 2000, 2018, 2018, 2018, 2018, 2018, 1985],
+            dtype=np.int32,
+        )
+        df["a_month"] = np.array([9, 3, 11, 10, 10, 10, 12, 7], dtype=np.int32)
+        df["b_new"] = df["a"].dt.to_period("M")
+
+        return df
+
+    def expected_df_2():
+        """Expected output of test_expected_output_overwrite."""
+        df = d.create_datediff_test_df()
+
+        df["a_month"] = np.array([9, 3, 11, 10, 10, 10, 12, 7], dtype=np.int32)
+        df["a"] = np.array(
+            [1993, 2000, 2018, 2018, 2018, 2018, 2018, 1985],
+            dtype=np.int32,
+        )
+
+        return df
+
+    @pytest.mark.parametrize(
+        ("df", "expected"),
+        ta.pandas.adjusted_dataframe_params(
+            d.create_datediff_test_df(),
+            expected_df_1(),
+        ),
+    )
+    def test_expected_output_no_overwrite(self, df, expected):
+        """Test output from transform gives expected results, when not overwriting the original column."""
+        x = SeriesDtMethodBatchTransformer(
+            methods=[
+                ("year", "a_year"),
+                ("month", "a_month", None),
+                ("to_period", "b_new", {"freq": "M"}),
+            ],
+            columns="a",
+        )
+
+        df_transformed = x.transform(df)
+
+        ta.equality.assert_frame_equal_msg(
+            actual=df_transformed,
+            expected=expected,
+            msg_tag="Unexpected values in SeriesDtMethodBatchTransformer.transform, not overwriting original column",
+        )
+
+    @pytest.mark.parametrize(
+        ("df", "expected"),
+        ta.pandas.adjusted_dataframe_params(
+            d.create_datediff_test_df(),
+            expected_df_2(),
+        ),
+    )
+    def test_expected_output_overwrite(self, df, expected):
+        """Test output from transform gives expected results, when overwriting the original column."""
+        x = SeriesDtMethodBatchTransformer(
+            methods=[("year", "a"), ("month", "a_month")],
+            columns="a",
+        )
+
+        df_transformed = x.transform(df)
+
+        ta.equality.assert_frame_equal_msg(
+            actual=df_transformed,
+            expected=expected,
+            msg_tag="Unexpected values in SeriesDtMethodBatchTransformer.transform, overwriting original column",
+        )
+
+    def test_output_matches_stacked_series_dt_transformers(self):
+        """Test output is the same as applying one SeriesDtMethodTransformer per method."""
+        df = d.create_datediff_test_df()
+
+        methods = [
+            ("year", "a_year"),
+            ("quarter", "a_quarter"),
+            ("dayofweek", "a_dayofweek"),
+            ("hour", "a_hour"),
+            ("strftime", "a_str", {"date_format": "%Y-%m"}),
+        ]
+
+        expected = df
+        for method in methods:
+            expected = SeriesDtMethodTransformer(
+                pd_method_name=method[0],
+                new_column_name=method[1],
+                pd_method_kwargs=method[2] if len(method) == 3 else None,
+                columns="a",
+            ).transform(expected)
+
+        x = SeriesDtMethodBatchTransformer(methods=methods, columns="a")
+
+        ta.equality.assert_frame_equal_msg(
+            actual=x.transform(df),
+            expected=expected,
+            msg_tag="SeriesDtMethodBatchTransformer output differs from stacked SeriesDtMethodTransformers",
+        )
+
+    def test_polars_expected_output(self):
+        """Test transform on a polars DataFrame gives the same values as for pandas."""
+        df = d.create_is_between_dates_df_2().drop(columns=["b", "c"])
+        df["a"] = df["a"].dt.tz_localize(None)
+
+        x = SeriesDtMethodBatchTransformer(
+            methods=[
+                ("year", "a_year"),
+                ("month", "a_month"),
+                ("dayofyear", "a_dayofyear"),
+            ],
+            columns="a",
+        )
+
+        expected = pl.from_pandas(x.transform(df)).cast(
+            {"a_year": pl.Int32, "a_month": pl.Int8, "a_dayofyear": pl.Int16},
+        )
+
+        df_transformed = x.transform(pl.from_pandas(df))
+
+        assert isinstance(
+            df_transformed,
+            pl.DataFrame,
+        ), "polars input should give polars output"
+
+        pl.testing.assert_frame_equal(df_transformed, expected)
+
+    def test_polars_unsupported_method_error(self):
+        """Test an exception is raised for polars input if a method has no polars equivalent."""
+        df = d.create_is_between_dates_df_1(library="polars")
+
+        x = SeriesDtMethodBatchTransformer(
+            methods=[("year", "a_year"), ("to_period", "a_period", {"freq": "M"})],
+            columns="a",
+        )
+
+        with pytest.raises(
+            ValueError,
+            match=re.escape(
+                "SeriesDtMethodBatchTransformer: methods ['to_period'] are only supported for pandas inputs",
+            ),
+        ):
+            x.transform(df)
+
+
+class TestOtherBaseBehaviour(OtherBaseBehaviourTests):
+    """
+    Class to run tests for BaseTransformerBehaviour outside the three standard methods.
+
+    May need to overwite specific tests in this class if the tested transformer modifies this behaviour.
+    """
+
+    @classmethod
+    def setup_class(cls):
+        cls.transformer_name = "SeriesDtMethodBatchTransformer"
@@ -1,4 +1,8 @@
+import re
+
+import narwhals as nw
 import pandas as pd
+import polars as pl
 import pytest
 
 from tests.base_tests import (
@@ -89,6 +93,122 @@ class TestTransform(GenericImputerTransformTests, GenericTransformTests):
         assert df["a"].dtype == "int8"
         assert df["b"].dtype == "float16"
 
+    def test_impute_value_preserve_dtype_polars(self):
+        """Test dtypes of polars columns are preserved after imputation."""
+        df = pl.DataFrame(
+            {
+                "a": pl.Series([1, None, 3], dtype=pl.Int8),
+                "b": pl.Series([1.0, 2.0, None], dtype=pl.Float32),
+            },
+        )
+
+        x = ArbitraryImputer(impute_value=1, columns=["a", "b"])
+
+        df_transformed = x.transform(df)
+
+        expected = pl.DataFrame(
+            {
+                "a": pl.Series([1, 1, 3], dtype=pl.Int8),
+                "b": pl.Series([1.0, 2.0, 1.0], dtype=pl.Float32),
+            },
+        )
+
+        pl.testing.assert_frame_equal(df_transformed, expected)
+
+    @pytest.mark.parametrize("library", ["pandas", "polars"])
+    def test_impute_value_cast_to_each_dtype(self, library):
+        """Test the impute value is cast to the dtype of each column, including columns sharing a dtype."""
+        df = pd.DataFrame(
+            {
+                "a": pd.Series([1, None, 3], dtype="Int8"),
+                "b": pd.Series([None, 2, 3], dtype="Int8"),
+                "c": pd.Series([1.5, None, 2.5], dtype="float32"),
+                "d": pd.Series([1.0, 2.0, 3.0], dtype="float64"),
+            },
+        )
+        if library == "polars":
+            df = pl.from_pandas(df)
+
+        x = ArbitraryImputer(impute_value=2.0, columns=["a", "b", "c", "d"])
+
+        df_transformed = nw.from_native(x.transform(df))
+
+        assert df_transformed.schema == nw.from_native(df).schema, "dtypes changed"
+
+        assert df_transformed.to_dict(as_series=False) == {
+            "a": [1, 2, 3],
+            "b": [2, 2, 3],
+            "c": [1.5, 2.0, 2.5],
+            "d": [1.0, 2.0, 3.0],
+        }, "nulls not imputed"
+
+    @pytest.mark.parametrize("library", ["pandas", "polars"])
+    @pytest.mark.parametrize("dtype", ["int64", "Int8"])
+    def test_impute_value_changed_by_cast_error(self, library, dtype):
+        """Test an exception is raised if casting the impute value to the column dtype would
+        change it, e.g. a float into an integer column."""
+        df = pd.DataFrame(
+            {
+                "a": pd.Series(
+                    [1, 2, 3] if dtype == "int64" else [1, None, 3],
+                    dtype=dtype,
+                ),
+            },
+        )
+        if library == "polars":
+            df = pl.from_pandas(df)
+
+        x = ArbitraryImputer(impute_value=2.7, columns=["a"])
+
+        with pytest.raises(
+            TypeError,
+            match=re.escape(
+                "ArbitraryImputer: impute value 2.7 cannot be filled into column a",
+            ),
+        ):
+            x.transform(df)
+
+    @pytest.mark.parametrize(
+        ("values", "impute_value", "expected"),
+        [
+            ([True, None], False, [True, False]),
+            (["a", None], 1, ["a", 1]),
+        ],
+    )
+    def test_pandas_object_column_filled_with_impute_value(
+        self,
+        values,
+        impute_value,
+        expected,
+    ):
+        """Test pandas object columns, of non-strings or strings, are filled with the impute value
+        as it is rather than cast to the narwhals dtype of the column."""
+        df = pd.DataFrame({"e": pd.Series(values, dtype=object)})
+
+        x = ArbitraryImputer(impute_value=impute_value, columns=["e"])
+
+        df_transformed = x.transform(df)
+
+        assert df_transformed["e"].tolist() == expected, "nulls not imputed as expected"
+        assert type(df_transformed["e"][1]) is type(
+            impute_value,
+        ), "impute value type changed"
+
+    def test_pandas_categories_not_added_to_input(self):
+        """Test the impute value is not added to the categories of the input X in place."""
+        df = pd.DataFrame({"a": pd.Series(["x", None], dtype="category")})
+
+        x = ArbitraryImputer(impute_value="y", columns=["a"])
+
+        df_transformed = x.transform(df)
+
+        assert list(df["a"].cat.categories) == ["x"], "input X categories modified"
+        assert list(df_transformed["a"].cat.categories) == [
+            "x",
+            "y",
+        ], "impute value not added as category"
+        assert df_transformed["a"].tolist() == ["x", "y"], "nulls not imputed"
+
 
 class TestOtherBaseBehaviour(OtherBaseBehaviourTests):
     """
@@ -1,3 +1,4 @@
+import re
 from copy import deepcopy
 
 import narwhals as nw
@@ -340,6 +341,197 @@ class GenericImputerTransformTestsWeight:
         ), f"Impute values changed in transform for {self.transformer_name}"
 
 
+class GroupByImputerInitTests:
+    """Tests for init of imputers supporting the group_by argument."""
+
+    @pytest.mark.parametrize("bad_group_by", [1, [], ["b", 1], {"b": 1}])
+    def test_group_by_type_error(
+        self,
+        bad_group_by,
+        minimal_attribute_dict,
+        uninitialized_transformers,
+    ):
+        """Test an error is raised if group_by is not a str, non-empty list of str or None."""
+        args = minimal_attribute_dict[self.transformer_name].copy()
+        args["group_by"] = bad_group_by
+
+        with pytest.raises(
+            TypeError,
+            match=f"{self.transformer_name}: group_by should be a str, a non-empty list of str or None",
+        ):
+            uninitialized_transformers[self.transformer_name](**args)
+
+    def test_group_by_in_columns_error(
+        self,
+        minimal_attribute_dict,
+        uninitialized_transformers,
+    ):
+        """Test an error is raised if a group_by column is also being imputed."""
+        args = minimal_attribute_dict[self.transformer_name].copy()
+        args["columns"] = ["a", "b"]
+        args["group_by"] = "b"
+
+        with pytest.raises(
+            ValueError,
+            match=re.escape(
+                f"{self.transformer_name}: group_by columns cannot also be imputed, got ['b']",
+            ),
+        ):
+            uninitialized_transformers[self.transformer_name](**args)
+
+    def test_group_by_str_to_list(
+        self,
+        minimal_attribute_dict,
+        uninitialized_transformers,
+    ):
+        """Test a str group_by is stored as a list."""
+        args = minimal_attribute_dict[self.transformer_name].copy()
+        args["columns"] = ["a"]
+        args["group_by"] = "b"
+
+        transformer = uninitialized_transformers[self.transformer_name](**args)
+
+        assert transformer.group_by == ["b"], "group_by not stored as a list"
+
+
+class GroupByImputerTests:
+    """Tests for fit and transform of imputers supporting the group_by argument.
+
+    Each group in the fit data has a single non null value, so the group mean, median
+    and mode are all equal to it.
+    """
+
+    @staticmethod
+    def create_group_fit_df(library="pandas"):
+        df = pd.DataFrame(
+            {
+                "g": ["x", "x", "y", "y", None, "z", "y"],
+                "a": [1.0, None, 3.0, None, 5.0, None, 3.0],
+                "w": [1, 2, 3, 4, 5, 6, 7],
+            },
+            index=[6, 5, 4, 3, 2, 1, 0],
+        )
+
+        return df if library == "pandas" else pl.from_pandas(df)
+
+    @staticmethod
+    def create_group_transform_df(library="pandas"):
+        df = pd.DataFrame(
+            {
+                "g": ["y", "x", "z", "q", None, "x"],
+                "a": [None, None, None, None, None, 10.0],
+                "w": [1, 1, 1, 1, 1, 1],
+            },
+            index=[3, 4, 5, 6, 7, 8],
+        )
+
+        return df if library == "pandas" else pl.from_pandas(df)
+
+    @pytest.mark.parametrize("library", ["pandas", "polars"])
+    @pytest.mark.parametrize("weights_column", [None, "w"])
+    def test_group_impute_values(
+        self,
+        library,
+        weights_column,
+        uninitialized_transformers,
+    ):
+        """Test the learnt group values, groups with only nulls and null groups are not learnt from."""
+        transformer = uninitialized_transformers[self.transformer_name](
+            columns="a",
+            group_by="g",
+            weights_column=weights_column,
+        )
+
+        transformer.fit(self.create_group_fit_df(library))
+
+        actual = nw.from_native(transformer.group_impute_values_)
+
+        assert actual["g"].to_list() == [
+            "x",
+            "y",
+            "z",
+        ], f"{self.transformer_name}: unexpected groups in group_impute_values_"
+
+        assert actual["a"].fill_null(-1).to_list() == [
+            1.0,
+            3.0,
+            -1,
+        ], f"{self.transformer_name}: unexpected values in group_impute_values_"
+
+    @pytest.mark.parametrize("library", ["pandas", "polars"])
+    @pytest.mark.parametrize("weights_column", [None, "w"])
+    def test_group_transform_output(
+        self,
+        library,
+        weights_column,
+        uninitialized_transformers,
+    ):
+        """Test nulls are imputed with group values, falling back to impute_values_ for unseen, null-valued or null groups."""
+        transformer = uninitialized_transformers[self.transformer_name](
+            columns="a",
+            group_by="g",
+            weights_column=weights_column,
+        )
+
+        transformer.fit(self.create_group_fit_df(library))
+
+        df = self.create_group_transform_df(library)
+
+        overall = transformer.impute_values_["a"]
+
+        expected = self.create_group_transform_df()
+        expected["a"] = [3.0, 1.0, overall, overall, overall, 10.0]
+        if library == "polars":
+            expected = pl.from_pandas(expected)
+
+        u.assert_frame_equal_dispatch(transformer.transform(df), expected)
+
+    @pytest.mark.parametrize(
+        ("fit_library", "library"),
+        [("pandas", "polars"), ("polars", "pandas")],
+    )
+    def test_group_transform_output_other_library(
+        self,
+        fit_library,
+        library,
+        uninitialized_transformers,
+    ):
+        """Test transforming with a different library to fit gives the same output, including
+        for groups with only nulls in fit, which must stay null rather than become NaN."""
+        transformer = uninitialized_transformers[self.transformer_name](
+            columns="a",
+            group_by="g",
+        )
+
+        transformer.fit(self.create_group_fit_df(fit_library))
+
+        df = self.create_group_transform_df(library)
+
+        overall = transformer.impute_values_["a"]
+
+        expected = self.create_group_transform_df()
+        expected["a"] = [3.0, 1.0, overall, overall, overall, 10.0]
+        if library == "polars":
+            expected = pl.from_pandas(expected)
+
+        u.assert_frame_equal_dispatch(transformer.transform(df), expected)
+
+    def test_group_by_column_missing_error(self, uninitialized_transformers):
+        """Test an error is raised in transform if a group_by column is not present."""
+        transformer = uninitialized_transformers[self.transformer_name](
+            columns="a",
+            group_by="g",
+        )
+
+        transformer.fit(self.create_group_fit_df())
+
+        with pytest.raises(
+            ValueError,
+            match=f"{self.transformer_name}: group_by column g is not in X",
+        ):
+            transformer.transform(self.create_group_transform_df().drop(columns="g"))
+
+
 class TestInit(ColumnStrListInitTests):
     """Generic tests for transformer.init()."""
 
@@ -0,0 +1,235 @@
+import re
+
+import narwhals as nw
+import numpy as np
+import pandas as pd
+import polars as pl
+import pytest
+from sklearn.linear_model import LinearRegression
+
+import tests.test_data as d
+from tests import utils as u
+from tests.base_tests import (
+    ColumnStrListInitTests,
+    GenericFitTests,
+    GenericTransformTests,
+    OtherBaseBehaviourTests,
+)
+from tubular.imputers import IterativeImputer
+
+
+def create_linear_df(library="pandas"):
+    """Create DataFrame where b = 2a + 1 exactly, with nulls in both columns."""
+    df_dict = {
+        "a": [1.0, 2.0, 3.0, None, 5.0, 6.0, 7.0, 8.0],
+        "b": [3.0, 5.0, 7.0, 9.0, None, 13.0, 15.0, 17.0],
+        "c": ["a", "b", "c", "d", "e", "f", "g", "h"],
+    }
+
+    return u.dataframe_init_dispatch(df_dict, library)
+
+
+class TestInit(ColumnStrListInitTests):
+    """Tests for IterativeImputer.init()."""
+
+    @classmethod
+    def setup_class(cls):
+        cls.transformer_name = "IterativeImputer"
+
+    def test_single_column_error(self):
+        """Test an error is raised if only one column is passed."""
+        with pytest.raises(
+            ValueError,
+            match="IterativeImputer: at least 2 columns are required",
+        ):
+            IterativeImputer(columns="a")
+
+    def test_estimator_type_error(self):
+        """Test an error is raised if estimator does not have fit and predict methods."""
+        with pytest.raises(
+            TypeError,
+            match="IterativeImputer: estimator should be None or have fit and predict methods",
+        ):
+            IterativeImputer(columns=["a", "b"], estimator="linear")
+
+    @pytest.mark.parametrize("max_iter", [0, 1.5, True])
+    def test_max_iter_error(self, max_iter):
+        """Test an error is raised if max_iter is not a positive int."""
+        with pytest.raises(
+            ValueError,
+            match="IterativeImputer: max_iter should be a positive int",
+        ):
+            IterativeImputer(columns=["a", "b"], max_iter=max_iter)
+
+    @pytest.mark.parametrize("tol", [-1, "1"])
+    def test_tol_error(self, tol):
+        """Test an error is raised if tol is not a non-negative number."""
+        with pytest.raises(
+            ValueError,
+            match="IterativeImputer: tol should be a non-negative float",
+        ):
+            IterativeImputer(columns=["a", "b"], tol=tol)
+
+    def test_n_jobs_error(self):
+        """Test an error is raised if n_jobs is not None or an int."""
+        with pytest.raises(
+            TypeError,
+            match="IterativeImputer: n_jobs should be None or an int",
+        ):
+            IterativeImputer(columns=["a", "b"], n_jobs="2")
+
+
+class TestFit(GenericFitTests):
+    """Tests for IterativeImputer.fit()."""
+
+    @classmethod
+    def setup_class(cls):
+        cls.transformer_name = "IterativeImputer"
+
+    @pytest.mark.parametrize("library", ["pandas", "polars"])
+    def test_non_numeric_error(self, library):
+        """Test an error is raised if a column is not numeric."""
+        df = create_linear_df(library)
+
+        with pytest.raises(
+            TypeError,
+            match=re.escape(
+                "IterativeImputer: The following columns are not numeric in X; ['c']",
+            ),
+        ):
+            IterativeImputer(columns=["a", "c"]).fit(df)
+
+    @pytest.mark.parametrize("library", ["pandas", "polars"])
+    def test_all_null_column_error(self, library):
+        """Test an error is raised if a column has only nulls."""
+        df = nw.from_native(create_linear_df(library))
+        df = df.with_columns(nw.col("a").is_null().cast(nw.Float64).alias("d"))
+        df = df.with_columns(
+            nw.when(nw.col("d") > 1).then(nw.col("d")).alias("d"),
+        ).to_native()
+
+        with pytest.raises(
+            ValueError,
+            match=re.escape("IterativeImputer: columns ['d'] have no non null values"),
+        ):
+            IterativeImputer(columns=["a", "d"]).fit(df)
+
+    @pytest.mark.parametrize("library", ["pandas", "polars"])
+    def test_learnt_values(self, library):
+        """Test the mean fill values, models and iteration attributes learnt in fit."""
+        df = create_linear_df(library)
+
+        x = IterativeImputer(
+            columns=["a", "b"],
+            estimator=LinearRegression(),
+            max_iter=5,
+        )
+
+        x.fit(df)
+
+        assert x.impute_values_ == pytest.approx(
+            {"a": 32 / 7, "b": 69 / 7},
+        ), "impute_values_ attribute"
+
+        assert set(x.estimators_) == {"a", "b"}, "estimators_ attribute keys"
+
+        # the imputed value of a in row 3 is used in fitting, so b = 2a + 1 is approximate
+        assert x.estimators_["b"].coef_ == pytest.approx(
+            [2],
+            rel=1e-3,
+        ), "model for b not learnt from a"
+
+        assert x.n_iter_ == len(
+            x.iteration_times_,
+        ), "one time should be recorded per iteration"
+
+        assert 1 <= x.n_iter_ <= 5, "n_iter_ should be between 1 and max_iter"
+
+    def test_early_stopping(self):
+        """Test fit stops after one iteration when there are no nulls to update."""
+        df = d.create_numeric_df_1()
+
+        x = IterativeImputer(columns=["a", "b"], max_iter=10)
+
+        x.fit(df)
+
+        assert x.n_iter_ == 1, "fit should stop when imputed values do not change"
+
+    def test_n_jobs_same_result(self):
+        """Test fitting the column models in separate processes gives the same result."""
+        df = create_linear_df()
+
+        x1 = IterativeImputer(columns=["a", "b"], estimator=LinearRegression())
+        x2 = IterativeImputer(
+            columns=["a", "b"],
+            estimator=LinearRegression(),
+            n_jobs=2,
+        )
+
+        u.assert_frame_equal_dispatch(
+            x1.fit_transform(df),
+            x2.fit_transform(df),
+        )
+
+
+class TestTransform(GenericTransformTests):
+    """Tests for IterativeImputer.transform()."""
+
+    @classmethod
+    def setup_class(cls):
+        cls.transformer_name = "IterativeImputer"
+
+    @pytest.mark.parametrize("library", ["pandas", "polars"])
+    def test_expected_output(self, library):
+        """Test nulls are imputed with model predictions and other values are unchanged."""
+        df = create_linear_df(library)
+
+        x = IterativeImputer(
+            columns=["a", "b"],
+            estimator=LinearRegression(),
+            max_iter=20,
+            tol=0,
+        )
+
+        df_transformed = x.fit_transform(df)
+
+        expected = create_linear_df()
+        expected["a"] = [1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0]
+        expected["b"] = [3.0, 5.0, 7.0, 9.0, 11.0, 13.0, 15.0, 17.0]
+
+        if library == "polars":
+            expected = pl.from_pandas(expected)
+
+        u.assert_frame_equal_dispatch(df_transformed, expected)
+
+    def test_no_nulls_unchanged(self):
+        """Test rows without nulls are returned unchanged, with the original index."""
+        df = create_linear_df()
+        x = IterativeImputer(columns=["a", "b"]).fit(df)
+
+        df_no_nulls = df.dropna().set_index(pd.Index([10, 11, 12, 13, 14, 15]))
+
+        u.assert_frame_equal_dispatch(x.transform(df_no_nulls), df_no_nulls)
+
+    def test_unseen_null_pattern(self):
+        """Test a row with every column null is filled from the means and models."""
+        df = create_linear_df()
+        x = IterativeImputer(columns=["a", "b"], estimator=LinearRegression()).fit(df)
+
+        df_transformed = x.transform(
+            pd.DataFrame({"a": [np.nan], "b": [np.nan], "c": ["x"]}),
+        )
+
+        assert not df_transformed[["a", "b"]].isna().any().any(), "nulls remain"
+
+
+class TestOtherBaseBehaviour(OtherBaseBehaviourTests):
+    """
+    Class to run tests for BaseTransformerBehaviour outside the three standard methods.
+
+    May need to overwite specific tests in this class if the tested transformer modifies this behaviour.
+    """
+
+    @classmethod
+    def setup_class(cls):
+        cls.transformer_name = "IterativeImputer"
@@ -1,4 +1,5 @@
 import numpy as np
+import pytest
 import test_aide as ta
 
 import tests.test_data as d
@@ -13,11 +14,17 @@ from tests.base_tests import (
 from tests.imputers.test_BaseImputer import (
     GenericImputerTransformTests,
     GenericImputerTransformTestsWeight,
+    GroupByImputerInitTests,
+    GroupByImputerTests,
 )
 from tubular.imputers import MeanImputer
 
 
-class TestInit(WeightColumnInitMixinTests, ColumnStrListInitTests):
+class TestInit(
+    WeightColumnInitMixinTests,
+    ColumnStrListInitTests,
+    GroupByImputerInitTests,
+):
     """Generic tests for transformer.init()."""
 
     @classmethod
@@ -71,8 +78,28 @@ class TestFit(WeightColumnFitMixinTests, GenericFitTests):
             msg="impute_values_ attribute",
         )
 
+    @pytest.mark.parametrize(
+        ("weights_column", "expected"),
+        [
+            (None, {"a": 13 / 4, "b": 15 / 5}),
+            ("c", {"a": (3 + 4 + 16 + 36) / (3 + 2 + 4 + 6), "b": 42 / 18}),
+        ],
+    )
+    def test_learnt_values_polars(self, weights_column, expected):
+        """Test that the impute values learnt during fit on a polars DataFrame are expected."""
+        df = d.create_df_9(library="polars")
+
+        x = MeanImputer(columns=["a", "b"], weights_column=weights_column)
+
+        x.fit(df)
+
+        assert x.impute_values_ == pytest.approx(
+            expected,
+        ), "impute_values_ attribute not as expected for polars input"
+
 
 class TestTransform(
+    GroupByImputerTests,
     GenericTransformTests,
     GenericImputerTransformTestsWeight,
     GenericImputerTransformTests,
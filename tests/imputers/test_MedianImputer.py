@@ -1,5 +1,8 @@
+import narwhals as nw
 import numpy as np
 import pandas as pd
+import polars as pl
+import pytest
 import test_aide as ta
 
 import tests.test_data as d
@@ -14,11 +17,17 @@ from tests.base_tests import (
 from tests.imputers.test_BaseImputer import (
     GenericImputerTransformTests,
     GenericImputerTransformTestsWeight,
+    GroupByImputerInitTests,
+    GroupByImputerTests,
 )
 from tubular.imputers import MedianImputer
 
 
-class TestInit(ColumnStrListInitTests, WeightColumnInitMixinTests):
+class TestInit(
+    ColumnStrListInitTests,
+    WeightColumnInitMixinTests,
+    GroupByImputerInitTests,
+):
     """Generic tests for transformer.init()."""
 
     @classmethod
@@ -83,6 +92,70 @@ class TestFit(WeightColumnFitMixinTests, GenericFitTests):
             msg="impute_values_ attribute",
         )
 
+    def test_learnt_values_weighted_nulls_in_other_columns(self):
+        """Test that nulls in one column do not affect the weighted median of another column."""
+        df = d.create_df_9()
+
+        x = MedianImputer(columns=["a", "b"], weights_column="c")
+
+        x.fit(df)
+
+        ta.classes.test_object_attributes(
+            obj=x,
+            expected_attributes={
+                "impute_values_": {
+                    # a sorted: 1 (w3), 2 (w2), 4 (w4), 6 (w6), cutoff 7.5
+                    "a": np.float64(4),
+                    # b sorted: 1 (w6), 2 (w5), 3 (w4), 4 (w1), 5 (w2), cutoff 9
+                    "b": np.float64(2),
+                },
+            },
+            msg="impute_values_ attribute",
+        )
+
+    @pytest.mark.parametrize(
+        ("weights_column", "expected"),
+        [
+            (None, {"a": 3.0, "b": 3.0}),
+            ("c", {"a": 4, "b": 2}),
+        ],
+    )
+    def test_learnt_values_polars(self, weights_column, expected):
+        """Test that the impute values learnt during fit on a polars DataFrame are expected."""
+        df = d.create_df_9(library="polars")
+
+        x = MedianImputer(columns=["a", "b"], weights_column=weights_column)
+
+        x.fit(df)
+
+        assert (
+            x.impute_values_ == expected
+        ), "impute_values_ attribute not as expected for polars input"
+
+    @pytest.mark.parametrize("library", ["pandas", "polars"])
+    def test_learnt_group_values_weighted(self, library):
+        """Test the weighted median is calculated within each group."""
+        df = pd.DataFrame(
+            {
+                "g": ["x", "x", "x", "y", "y", "y"],
+                "a": [3.0, 1.0, 2.0, 5.0, None, 4.0],
+                "w": [1, 1, 3, 1, 10, 2],
+            },
+        )
+        if library == "polars":
+            df = pl.from_pandas(df)
+
+        x = MedianImputer(columns="a", weights_column="w", group_by="g")
+
+        x.fit(df)
+
+        # x sorted: 1 (w1), 2 (w3), 3 (w1), cutoff 2.5
+        # y sorted: 4 (w2), 5 (w1), cutoff 1.5 - null row weight not counted
+        assert nw.from_native(x.group_impute_values_)["a"].to_list() == [
+            2.0,
+            4.0,
+        ], "group_impute_values_ attribute not as expected"
+
     def test_fit_not_changing_data(self):
         """Test fit does not change X."""
         df = d.create_df_1()
@@ -99,6 +172,7 @@ class TestFit(WeightColumnFitMixinTests, GenericFitTests):
 
 
 class TestTransform(
+    GroupByImputerTests,
     GenericImputerTransformTests,
     GenericImputerTransformTestsWeight,
     GenericTransformTests,
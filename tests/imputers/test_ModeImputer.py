@@ -1,5 +1,7 @@
+import narwhals as nw
 import numpy as np
 import pandas as pd
+import polars as pl
 import pytest
 import test_aide as ta
 
@@ -15,11 +17,17 @@ from tests.base_tests import (
 from tests.imputers.test_BaseImputer import (
     GenericImputerTransformTests,
     GenericImputerTransformTestsWeight,
+    GroupByImputerInitTests,
+    GroupByImputerTests,
 )
 from tubular.imputers import ModeImputer
 
 
-class TestInit(ColumnStrListInitTests, WeightColumnInitMixinTests):
+class TestInit(
+    ColumnStrListInitTests,
+    WeightColumnInitMixinTests,
+    GroupByImputerInitTests,
+):
     """Generic tests for transformer.init()."""
 
     @classmethod
@@ -99,8 +107,62 @@ class TestFit(WeightColumnFitMixinTests, GenericFitTests):
             msg="impute_values_ attribute",
         )
 
+    @pytest.mark.parametrize(
+        ("weights_column", "expected"),
+        [
+            (None, {"a": 1.0, "b": "a", "c": "a", "d": 1.0}),
+            ("weights_column", {"a": 5.0, "b": "e", "c": "f", "d": 1.0}),
+        ],
+    )
+    def test_learnt_values_polars(self, weights_column, expected):
+        """Test that the impute values learnt during fit on a polars DataFrame are expected."""
+        df = d.create_weighted_imputers_test_df(library="polars")
+
+        x = ModeImputer(columns=["a", "b", "c", "d"], weights_column=weights_column)
+
+        x.fit(df)
+
+        assert (
+            x.impute_values_ == expected
+        ), "impute_values_ attribute not as expected for polars input"
+
+    def test_warning_mode_is_nan_polars(self):
+        """Test that warning is raised when mode is null for a polars DataFrame."""
+        df = pl.DataFrame({"a": [None, None, None], "b": [1, 2, 3]})
+
+        x = ModeImputer(columns=["a"])
+
+        with pytest.warns(Warning, match="ModeImputer: The Mode of column a is NaN."):
+            x.fit(df)
+
+    @pytest.mark.parametrize("library", ["pandas", "polars"])
+    @pytest.mark.parametrize(
+        ("weights_column", "expected"),
+        [(None, ["p", "r"]), ("w", ["q", "s"])],
+    )
+    def test_learnt_group_values(self, library, weights_column, expected):
+        """Test the mode is calculated within each group, with ties going to the first level in sorted order."""
+        df = pd.DataFrame(
+            {
+                "g": ["x", "x", "x", "y", "y", "y"],
+                "b": ["q", "p", "p", "s", "r", None],
+                "w": [3, 1, 1, 2, 1, 5],
+            },
+        )
+        if library == "polars":
+            df = pl.from_pandas(df)
+
+        x = ModeImputer(columns="b", weights_column=weights_column, group_by="g")
+
+        x.fit(df)
+
+        assert (
+            nw.from_native(x.group_impute_values_)["b"].to_list() == expected
+        ), "group_impute_values_ attribute not as expected"
+
 
 class TestTransform(
+    GroupByImputerTests,
     GenericTransformTests,
     GenericImputerTransformTestsWeight,
     GenericImputerTransformTests,
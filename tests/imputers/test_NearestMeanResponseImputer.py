@@ -2,6 +2,7 @@ import numpy as np
 import pytest
 
 import tests.test_data as d
+from tests import utils as u
 from tests.base_tests import (
     ColumnStrListInitTests,
     GenericFitTests,
@@ -68,6 +69,26 @@ class TestFit(GenericFitTests):
             "c": np.float64(2),
         }, "impute_values_ attribute"
 
+    @pytest.mark.parametrize("library", ["pandas", "polars"])
+    def test_learnt_values_tie(self, library):
+        """Test the first level in sorted order is taken when levels are equally close."""
+        df = u.dataframe_init_dispatch(
+            {
+                "a": [3.0, 1.0, None, 2.0, 5.0],
+                "y": [4.0, 2.0, 3.0, 0.0, 4.0],
+            },
+            library=library,
+        )
+
+        transformer = NearestMeanResponseImputer(columns="a")
+
+        transformer.fit(df, df["y"])
+
+        # levels 1 and 3 both have mean response 1 away from the null level's
+        assert transformer.impute_values_ == {
+            "a": 1.0,
+        }, "impute_values_ attribute"
+
 
 class TestTransform(
     GenericTransformTests,
@@ -1,4 +1,5 @@
 import narwhals as nw
+import polars as pl
 import pytest
 
 import tests.test_data as d
@@ -18,6 +19,25 @@ class TestInit(ColumnStrListInitTests):
     def setup_class(cls):
         cls.transformer_name = "NullIndicator"
 
+    def test_packed_column_name_type_error(self):
+        """Test an error is raised if packed_column_name is not a str or None."""
+        with pytest.raises(
+            TypeError,
+            match="NullIndicator: packed_column_name should be a str or None",
+        ):
+            NullIndicator(columns=["a"], packed_column_name=1)
+
+    def test_too_many_packed_columns_error(self):
+        """Test an error is raised if more columns are passed than fit in the packed column."""
+        with pytest.raises(
+            ValueError,
+            match="NullIndicator: at most 64 columns can be packed into packed_column_name, got 65",
+        ):
+            NullIndicator(
+                columns=[f"c{i}" for i in range(65)],
+                packed_column_name="nulls",
+            )
+
 
 class TestTransform(GenericTransformTests):
     """Tests for NullIndicator.transform()."""
@@ -85,6 +105,83 @@ class TestTransform(GenericTransformTests):
             expected_df_1_common.to_native(),
         )
 
+    @pytest.mark.parametrize("library", ["pandas", "polars"])
+    def test_packed_column_correct(self, library):
+        """Test the packed column has bit i set where columns[i] is null."""
+        df = d.create_df_9(library=library)
+
+        transformer = NullIndicator(columns=["a", "b", "c"], packed_column_name="nulls")
+
+        df_transformed = nw.from_native(transformer.transform(df))
+
+        assert df_transformed.columns == [
+            "a",
+            "b",
+            "c",
+            "nulls",
+        ], "only the packed column should be added"
+
+        assert (
+            df_transformed.schema["nulls"] == nw.UInt64
+        ), "packed column should be UInt64"
+
+        # a is null in rows 2 and 4 (bit 0), b in row 0 (bit 1), c has no nulls (bit 2)
+        assert df_transformed["nulls"].to_list() == [
+            2,
+            0,
+            1,
+            0,
+            1,
+            0,
+        ], "unexpected values in packed column"
+
+    @pytest.mark.parametrize("library", ["pandas", "polars"])
+    def test_packed_high_bit(self, library):
+        """Test the 64th column sets the top bit of the packed column without overflowing."""
+        columns = [f"c{i}" for i in range(64)]
+        df_dict = {c: [1.0, 2.0] for c in columns}
+        df_dict["c63"] = [None, 2.0]
+        df = u.dataframe_init_dispatch(dataframe_dict=df_dict, library=library)
+
+        transformer = NullIndicator(columns=columns, packed_column_name="nulls")
+
+        df_transformed = nw.from_native(transformer.transform(df))
+
+        assert df_transformed["nulls"].to_list() == [1 << 63, 0]
+
+    @pytest.mark.parametrize("library", ["pandas", "polars"])
+    def test_unpack_matches_unpacked_transform(self, library):
+        """Test unpacking the packed column gives the same output as transform without packing."""
+        df = d.create_df_9(library=library)
+
+        expected = NullIndicator(columns=["a", "b", "c"]).transform(df)
+
+        transformer = NullIndicator(columns=["a", "b", "c"], packed_column_name="nulls")
+
+        actual = transformer.unpack_null_indicators(transformer.transform(df))
+
+        u.assert_frame_equal_dispatch(actual, expected)
+
+    def test_unpack_without_packed_column_name_error(self):
+        """Test an error is raised if unpack_null_indicators is called when packed_column_name is None."""
+        transformer = NullIndicator(columns=["a"])
+
+        with pytest.raises(
+            ValueError,
+            match="NullIndicator: unpack_null_indicators can only be used when packed_column_name is set",
+        ):
+            transformer.unpack_null_indicators(pl.DataFrame({"a": [1]}))
+
+    def test_unpack_packed_column_missing_error(self):
+        """Test an error is raised if the packed column is not in X."""
+        transformer = NullIndicator(columns=["a"], packed_column_name="nulls")
+
+        with pytest.raises(
+            ValueError,
+            match="NullIndicator: packed column nulls is not in X",
+        ):
+            transformer.unpack_null_indicators(pl.DataFrame({"a": [1]}))
+
 
 class TestOtherBaseBehaviour(OtherBaseBehaviourTests):
     """
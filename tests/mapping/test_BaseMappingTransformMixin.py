@@ -1,7 +1,9 @@
 import copy
 import re
 
+import numpy as np
 import pandas as pd
+import polars as pl
 import pytest
 import test_aide as ta
 
@@ -75,6 +77,68 @@ class TestTransform(GenericTransformTests):
             msg="BaseMappingTransformMixin from transform",
         )
 
+    @pytest.mark.parametrize(
+        ("mapping", "expected"),
+        [
+            ({"x": None}, [None, "y", None]),
+            ({"x": None, "y": None}, [None, None, None]),
+        ],
+    )
+    def test_polars_all_null_mapping_values(self, mapping, expected):
+        """Test mappings whose values are all null keep the dtype of the column for polars."""
+        df = pl.DataFrame({"b": ["x", "y", None]})
+
+        x = BaseMappingTransformMixin(columns=["b"])
+
+        x.mappings = {"b": mapping}
+
+        df_transformed = x.transform(df)
+
+        assert df_transformed["b"].dtype == pl.String, "column dtype not kept"
+        assert (
+            df_transformed["b"].to_list() == expected
+        ), "values not mapped to null as expected"
+
+    @pytest.mark.parametrize("null_key", [None, np.nan], ids=["None", "nan"])
+    def test_null_key_maps_all_null_rows(self, null_key):
+        """Test a null key, None or np.nan, maps null rows of either kind in an object column."""
+        df = pd.DataFrame({"b": pd.Series(["a", None, np.nan], dtype=object)})
+
+        x = BaseMappingTransformMixin(columns=["b"])
+
+        x.mappings = {"b": {null_key: "missing", "a": "x"}}
+
+        df_transformed = x.transform(df)
+
+        assert df_transformed["b"].tolist() == [
+            "x",
+            "missing",
+            "missing",
+        ], "null rows not mapped by null key"
+
+    @pytest.mark.parametrize("null_key", [None, np.nan], ids=["None", "nan"])
+    def test_null_key_maps_categorical_null_rows(self, null_key):
+        """Test a null key maps the null rows of a categorical column, adding the value as a
+        category."""
+        df = pd.DataFrame({"b": pd.Categorical(["a", None, "c", None])})
+
+        x = BaseMappingTransformMixin(columns=["b"])
+
+        x.mappings = {"b": {null_key: "missing", "a": "x"}}
+
+        df_transformed = x.transform(df)
+
+        assert isinstance(
+            df_transformed["b"].dtype,
+            pd.CategoricalDtype,
+        ), "categorical dtype not kept"
+        assert df_transformed["b"].tolist() == [
+            "x",
+            "missing",
+            "c",
+            "missing",
+        ], "categorical null rows not mapped by null key"
+
     def test_mappings_unchanged(self, mapping):
         """Test that mappings is unchanged in transform."""
         df = d.create_df_1()
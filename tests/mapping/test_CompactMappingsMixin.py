@@ -0,0 +1,197 @@
+import re
+
+import joblib
+import numpy as np
+import pandas as pd
+import pytest
+import test_aide as ta
+
+import tests.test_data as d
+from tubular.mapping import CrossColumnAddTransformer, MappingTransformer
+from tubular.nominal import (
+    MeanResponseTransformer,
+    NominalToIntegerTransformer,
+    OrdinalEncoderTransformer,
+)
+
+
+def fitted_transformers():
+    """Transformers with mappings set in init or learnt in fit, with string and numeric keys."""
+    df = d.create_df_1()
+    df["b"] = df["b"] + "é"
+    y = pd.Series([1.0, 0.0, 1.0, 0.5, 0.0, 1.0])
+
+    return [
+        MappingTransformer(
+            mappings={
+                "a": {1: "x", 2: 3, 3: None},
+                "b": {"aé": 1.5, "bé": 2.5},
+            },
+        ),
+        CrossColumnAddTransformer(
+            mappings={"b": {"aé": 1, "bé": 2}},
+            adjust_column="a",
+        ),
+        NominalToIntegerTransformer(columns=["a", "b"]).fit(df),
+        MeanResponseTransformer(columns=["a", "b"]).fit(df, y),
+        OrdinalEncoderTransformer(columns=["a", "b"]).fit(df, y),
+    ]
+
+
+def round_trip(transformer, tmp_path):
+    """Serialise and reload transformer with joblib, without memory-mapping."""
+    path = tmp_path / "transformer.pkl"
+
+    joblib.dump(transformer, path)
+
+    return joblib.load(path)
+
+
+def transform_df():
+    """Data that can be transformed by all of fitted_transformers."""
+    df = d.create_df_1()
+    df["b"] = df["b"] + "é"
+
+    return df
+
+
+@pytest.mark.parametrize(
+    "transformer",
+    fitted_transformers(),
+    ids=lambda x: type(x).__name__,
+)
+class TestCompactMappings:
+    """Tests for CompactMappingsMixin serialisation of mappings."""
+
+    def test_mappings_pickled_as_arrays(self, transformer):
+        """Test mappings are pickled as key and value arrays rather than dicts."""
+        state = transformer.__getstate__()
+
+        assert "_mappings" not in state, "mappings dict should not be pickled"
+
+        for c, arrays in state["_mapping_arrays"].items():
+            assert isinstance(
+                arrays["keys"]["data"],
+                np.ndarray,
+            ), f"keys of mapping for {c} not stored as array"
+            assert isinstance(
+                arrays["values"]["data"],
+                np.ndarray,
+            ), f"values of mapping for {c} not stored as array"
+
+    def test_mappings_unchanged_by_pickling(self, transformer, tmp_path):
+        """Test mappings rebuilt after unpickling are equal to and have the same key and value
+        types as before pickling."""
+        loaded = round_trip(transformer, tmp_path)
+
+        ta.equality.assert_equal_dispatch(
+            expected=transformer.mappings,
+            actual=loaded.mappings,
+            msg="mappings changed by pickling",
+        )
+
+        for c, mapping in transformer.mappings.items():
+            assert [type(k) for k in loaded.mappings[c]] == [
+                type(k) for k in mapping
+            ], f"types of keys in mapping for {c} changed by pickling"
+
+    def test_transform_unchanged_by_pickling(self, transformer, tmp_path):
+        """Test transform gives the same output after unpickling, without rebuilding mappings."""
+        loaded = round_trip(transformer, tmp_path)
+
+        df_transformed = loaded.transform(transform_df())
+
+        assert (
+            loaded.__dict__["_mappings"] is None
+        ), "transform should not rebuild the mappings dict"
+
+        ta.equality.assert_frame_equal_msg(
+            actual=df_transformed,
+            expected=transformer.transform(transform_df()),
+            msg_tag="transform output changed by pickling",
+        )
+
+    def test_save_load_memory_maps_arrays(self, transformer, tmp_path):
+        """Test load memory-maps the mapping arrays written by save, other than object arrays."""
+        path = tmp_path / "transformer.pkl"
+
+        transformer.save(path)
+        loaded = type(transformer).load(path)
+
+        for arrays in loaded.__dict__["_mapping_arrays"].values():
+            for side in ["keys", "values"]:
+                data = arrays[side]["data"]
+                assert isinstance(data, np.memmap) or (
+                    data.dtype == object
+                ), f"{side} array not memory-mapped"
+
+        ta.equality.assert_frame_equal_msg(
+            actual=loaded.transform(transform_df()),
+            expected=transformer.transform(transform_df()),
+            msg_tag="transform output changed by save and load",
+        )
+
+    def test_compiled_mappings_reused_until_mappings_set(self, transformer):
+        """Test the compiled key index and values of each mapping are built once, and rebuilt
+        when mappings is set again."""
+        transformer.transform(transform_df())
+
+        c = next(iter(transformer.mappings))
+
+        compiled = transformer._compiled_mapping(c)
+
+        transformer.transform(transform_df())
+
+        assert (
+            transformer._compiled_mapping(c) is compiled
+        ), "compiled mapping rebuilt in transform"
+
+        transformer.mappings = transformer.mappings
+
+        assert (
+            transformer._compiled_mapping(c) is not compiled
+        ), "compiled mapping not rebuilt when mappings set"
+
+    def test_mappings_can_be_changed_after_loading(self, transformer, tmp_path):
+        """Test changes to the rebuilt mappings dict are used in transform."""
+        loaded = round_trip(transformer, tmp_path)
+
+        c = next(iter(transformer.mappings))
+
+        loaded.mappings[c] = {}
+        loaded.mappings[c].update(transformer.mappings[c])
+
+        ta.equality.assert_frame_equal_msg(
+            actual=loaded.transform(transform_df()),
+            expected=transformer.transform(transform_df()),
+            msg_tag="transform output changed by rebuilding mappings",
+        )
+
+
+def test_unpickle_dict_mappings():
+    """Test transformers pickled with mappings held in a dict attribute can be loaded."""
+    transformer = NominalToIntegerTransformer(columns="b").fit(d.create_df_1())
+
+    state = transformer.__getstate__()
+    state["mappings"] = transformer.mappings
+    del state["_mapping_arrays"], state["_mappings_type"]
+
+    loaded = NominalToIntegerTransformer.__new__(NominalToIntegerTransformer)
+    loaded.__setstate__(state)
+
+    assert loaded.mappings == transformer.mappings, "mappings not loaded"
+
+
+def test_load_wrong_type_error(tmp_path):
+    """Test an exception is raised if the loaded object is not of the class load is called on."""
+    path = tmp_path / "transformer.pkl"
+
+    MappingTransformer(mappings={"a": {1: 2}}).save(path)
+
+    with pytest.raises(
+        TypeError,
+        match=re.escape(
+            f"NominalToIntegerTransformer: {path} does not contain a NominalToIntegerTransformer",
+        ),
+    ):
+        NominalToIntegerTransformer.load(path)
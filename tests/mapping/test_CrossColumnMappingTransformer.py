@@ -1,5 +1,6 @@
 from collections import OrderedDict
 
+import numpy as np
 import pandas as pd
 import pytest
 import test_aide as ta
@@ -118,6 +119,36 @@ class TestTransform(BaseCrossColumnMappingTransformerTransformTests):
             msg_tag="expected output from cross column mapping transformer",
         )
 
+    def test_output_matches_key_by_key_replacement(self):
+        """Test the output matches replacing the adjust column key by key, column by column, for
+        larger mappings with unmatched keys and values."""
+        rng = np.random.default_rng(0)
+
+        df = pd.DataFrame(
+            {
+                "a": rng.integers(0, 300, 1000),
+                "b": rng.integers(0, 300, 1000).astype(str),
+                "c": rng.integers(0, 10, 1000).astype(str),
+            },
+        )
+
+        mapping = OrderedDict()
+        mapping["a"] = {i: f"a{i}" for i in range(0, 400, 2)}
+        mapping["b"] = {str(i): f"b{i}" for i in range(0, 400, 3)}
+
+        expected = df.copy()
+        for i in mapping:
+            for j in mapping[i]:
+                expected["c"] = np.where(expected[i] == j, mapping[i][j], expected["c"])
+
+        x = CrossColumnMappingTransformer(mappings=mapping, adjust_column="c")
+
+        ta.equality.assert_frame_equal_msg(
+            actual=x.transform(df),
+            expected=expected,
+            msg_tag="output differs from key by key replacement",
+        )
+
     def test_mappings_unchanged(
         self,
         minimal_attribute_dict,
@@ -1,5 +1,6 @@
 import numpy as np
 import pandas as pd
+import polars as pl
 import pytest
 import test_aide as ta
 
@@ -9,6 +10,7 @@ from tests.mapping.test_BaseCrossColumnNumericTransformer import (
     BaseCrossColumnNumericTransformerInitTests,
     BaseCrossColumnNumericTransformerTransformTests,
 )
+from tubular.mapping import CrossColumnMultiplyTransformer
 
 
 class TestInit(BaseCrossColumnNumericTransformerInitTests):
@@ -108,6 +110,61 @@ class TestTransform(BaseCrossColumnNumericTransformerTransformTests):
             msg_tag="expected output from cross column multiply transformer",
         )
 
+    def test_polars_output_matches_pandas(self):
+        """Test transform on a polars DataFrame gives the same values as for pandas."""
+        df = d.create_df_5()
+
+        x = CrossColumnMultiplyTransformer(
+            mappings={"b": {"a": 1.1, "f": 1.2}, "c": {"a": 2, "e": 3}},
+            adjust_column="a",
+        )
+
+        expected = pl.from_pandas(x.transform(df.copy()))
+
+        df_transformed = x.transform(pl.from_pandas(df))
+
+        assert isinstance(
+            df_transformed,
+            pl.DataFrame,
+        ), "polars input should give polars output"
+
+        pl.testing.assert_frame_equal(df_transformed, expected)
+
+    def test_output_matches_column_by_column_adjustment(self):
+        """Test the output matches multiplying the adjust column key by key, column by column, for
+        larger mappings with unmatched keys and integer values."""
+        rng = np.random.default_rng(0)
+
+        df = pd.DataFrame(
+            {
+                "a": rng.integers(0, 300, 1000),
+                "b": rng.integers(0, 300, 1000).astype(str),
+                "c": rng.integers(0, 10, 1000),
+            },
+        )
+
+        mapping = {
+            "a": {i: i % 7 for i in range(0, 400, 2)},
+            "b": {str(i): i % 5 for i in range(0, 400, 3)},
+        }
+
+        expected = df.copy()
+        for i, column_mapping in mapping.items():
+            for j in column_mapping:
+                expected["c"] = np.where(
+                    expected[i] == j,
+                    expected["c"] * column_mapping[j],
+                    expected["c"],
+                )
+
+        x = CrossColumnMultiplyTransformer(mappings=mapping, adjust_column="c")
+
+        ta.equality.assert_frame_equal_msg(
+            actual=x.transform(df),
+            expected=expected,
+            msg_tag="output differs from column by column adjustment",
+        )
+
 
 class TestOtherBaseBehaviour(OtherBaseBehaviourTests):
     """
@@ -1,4 +1,5 @@
 import pandas as pd
+import polars as pl
 import pytest
 import test_aide as ta
 from pandas.api.types import (
@@ -26,6 +27,14 @@ class TestInit(BaseMappingTransformerInitTests):
     def setup_class(cls):
         cls.transformer_name = "MappingTransformer"
 
+    def test_check_mapping_values_type_error(self):
+        """Test an error is raised if check_mapping_values is not a bool."""
+        with pytest.raises(
+            TypeError,
+            match="MappingTransformer: check_mapping_values should be a bool",
+        ):
+            MappingTransformer(mappings={"a": {1: 2}}, check_mapping_values="yes")
+
 
 class TestFit(GenericFitTests):
     """Generic tests for transformer.fit()"""
@@ -181,6 +190,52 @@ class TestTransform(BaseMappingTransformerTransformTests):
 
         assert is_categorical_dtype(df["b"])
 
+    @pytest.mark.parametrize(
+        ("mapping", "expected_values", "expected_categories"),
+        [
+            (
+                {"a": "x", "b": "y"},
+                ["x", "y", "c", "d", None, "x"],
+                ["x", "y", "c", "d", "e"],
+            ),
+            (
+                {"a": "x", "b": "x", "c": None},
+                ["x", "x", None, "d", None, "x"],
+                ["x", "d", "e"],
+            ),
+            ({"a": 1, "b": 2}, [1, 2, "c", "d", None, 1], [1, 2, "c", "d", "e"]),
+        ],
+    )
+    def test_category_mapping_applied_to_categories(
+        self,
+        mapping,
+        expected_values,
+        expected_categories,
+    ):
+        """Test mappings for categorical columns rename the categories, merging categories mapped
+        to the same value and removing categories mapped to null, and keep rows as categorical."""
+        df = pd.DataFrame(
+            {
+                "b": pd.Categorical(
+                    ["a", "b", "c", "d", None, "a"],
+                    categories=["a", "b", "c", "d", "e"],
+                ),
+            },
+        )
+
+        x = MappingTransformer(mappings={"b": mapping})
+
+        df_transformed = x.transform(df, suppress_dtype_warning=True)
+
+        ta.equality.assert_series_equal_msg(
+            actual=df_transformed["b"],
+            expected=pd.Series(
+                pd.Categorical(expected_values, categories=expected_categories),
+                name="b",
+            ),
+            msg_tag="categories not mapped as expected",
+        )
+
     @pytest.mark.parametrize(
         ("mapping", "mapped_col"),
         [({"a": {99: "99", 98: "98"}}, "a"), ({"b": {"z": 99, "y": 98}}, "b")],
@@ -211,6 +266,77 @@ class TestTransform(BaseMappingTransformerTransformTests):
         ):
             x.transform(df)
 
+    def test_check_mapping_values_false_no_warnings(self, recwarn):
+        """Test no warnings about mapping values are raised when check_mapping_values is False."""
+        df = d.create_df_1()
+
+        x = MappingTransformer(
+            mappings={"a": {99: 98}, "b": {"a": "z", "y": "x"}},
+            check_mapping_values=False,
+        )
+
+        x.transform(df)
+
+        assert (
+            len(recwarn) == 0
+        ), "MappingTransformer: warning raised with check_mapping_values=False"
+
+    def test_nulls_and_unmapped_values_unchanged(self):
+        """Test nulls and values without a mapping are unchanged, including when mapped values are a different type."""
+        df = pd.DataFrame({"a": [1.0, None, 3.0, 1.0], "b": ["x", None, "y", "z"]})
+
+        x = MappingTransformer(mappings={"a": {1.0: 10.0}, "b": {"x": 1, "z": 2}})
+
+        df_transformed = x.transform(df)
+
+        expected = pd.DataFrame(
+            {"a": [10.0, None, 3.0, 10.0], "b": [1, None, "y", 2]},
+        )
+
+        ta.equality.assert_frame_equal_msg(
+            actual=df_transformed,
+            expected=expected,
+            msg_tag="nulls or unmapped values changed",
+        )
+
+    def test_polars_expected_output(self):
+        """Test transform on a polars DataFrame, with unmapped values and nulls unchanged."""
+        df = pl.DataFrame({"a": [1, 2, 3, None], "b": ["x", "y", "z", "x"]})
+
+        x = MappingTransformer(mappings={"a": {1: 10, 2: 20}, "b": {"x": "X"}})
+
+        df_transformed = x.transform(df)
+
+        expected = pl.DataFrame({"a": [10, 20, 3, None], "b": ["X", "y", "z", "X"]})
+
+        pl.testing.assert_frame_equal(df_transformed, expected)
+
+    def test_polars_dtype_change_warning(self):
+        """Test the dtype change warning is raised for polars inputs."""
+        df = pl.DataFrame({"a": [1, 2, 3], "b": [1.5, 2.5, 3.5]}).cast(
+            {"b": pl.Float32},
+        )
+
+        x = MappingTransformer(mappings={"b": {1.5: 1, 2.5: 2}})
+
+        with pytest.warns(
+            UserWarning,
+            match="MappingTransformer: This mapping changes b dtype from Float32 to Float64",
+        ):
+            x.transform(df)
+
+    def test_polars_incompatible_dtypes_error(self):
+        """Test an error is raised for polars inputs if mapped and unmapped values cannot share a dtype."""
+        df = pl.DataFrame({"a": [1, 2, 3]})
+
+        x = MappingTransformer(mappings={"a": {1: "one"}})
+
+        with pytest.raises(
+            TypeError,
+            match=r"MappingTransformer: mapping values for a \(String\) cannot be combined with the unmapped values of a \(Int64\) in one column",
+        ):
+            x.transform(df)
+
 
 class TestOtherBaseBehaviour(OtherBaseBehaviourTests):
     """
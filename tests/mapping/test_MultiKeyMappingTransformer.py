@@ -0,0 +1,389 @@
+import re
+
+import numpy as np
+import pandas as pd
+import polars as pl
+import pytest
+import test_aide as ta
+
+import tests.test_data as d
+from tests.base_tests import (
+    ColumnStrListInitTests,
+    GenericTransformTests,
+    OtherBaseBehaviourTests,
+)
+from tubular.mapping import MultiKeyMappingTransformer
+
+
+def repeat_first_row(table):
+    """Return table with its first row repeated at the end."""
+    if isinstance(table, pd.DataFrame):
+        return pd.concat([table, table.head(1)], ignore_index=True)
+
+    return pl.concat([table, table.head(1)])
+
+
+def to_list(series):
+    """Return the values of a pandas or polars Series as a list."""
+    return series.tolist() if isinstance(series, pd.Series) else series.to_list()
+
+
+class TestInit(ColumnStrListInitTests):
+    """Tests for MultiKeyMappingTransformer.init()."""
+
+    @classmethod
+    def setup_class(cls):
+        cls.transformer_name = "MultiKeyMappingTransformer"
+
+    def test_dict_converted_to_table(self):
+        """Test a dict of key tuples is stored as a columnar pandas DataFrame."""
+        x = MultiKeyMappingTransformer(
+            columns=["b", "c"],
+            mapping_table={("f", "a"): 1.5, ("g", "b"): 2.5},
+            value_column="d",
+        )
+
+        ta.equality.assert_frame_equal_msg(
+            actual=x.mapping_table,
+            expected=pd.DataFrame(
+                {"b": ["f", "g"], "c": ["a", "b"], "d": [1.5, 2.5]},
+            ),
+            msg_tag="mapping_table not converted to expected DataFrame",
+        )
+
+    def test_new_column_name_defaults_to_value_column(self):
+        """Test new_column_name is value_column if not specified."""
+        x = MultiKeyMappingTransformer(
+            columns=["b", "c"],
+            mapping_table={("f", "a"): 1.5},
+            value_column="d",
+        )
+
+        assert (
+            x.new_column_name == "d"
+        ), "new_column_name should default to value_column"
+
+    @pytest.mark.parametrize("new_column_name", [1, True, ["e"]])
+    def test_new_column_name_type_error(self, new_column_name):
+        """Test an exception is raised if new_column_name is not a str or None."""
+        with pytest.raises(
+            TypeError,
+            match="MultiKeyMappingTransformer: new_column_name should be str",
+        ):
+            MultiKeyMappingTransformer(
+                columns=["b", "c"],
+                mapping_table={("f", "a"): 1.5},
+                value_column="d",
+                new_column_name=new_column_name,
+            )
+
+    @pytest.mark.parametrize("value_column", [1, None, ["d"]])
+    def test_value_column_type_error(self, value_column):
+        """Test an exception is raised if value_column is not a str."""
+        with pytest.raises(
+            TypeError,
+            match="MultiKeyMappingTransformer: value_column should be str",
+        ):
+            MultiKeyMappingTransformer(
+                columns=["b", "c"],
+                mapping_table={("f", "a"): 1.5},
+                value_column=value_column,
+            )
+
+    def test_value_column_in_columns_error(self):
+        """Test an exception is raised if value_column is also a key column."""
+        with pytest.raises(
+            ValueError,
+            match=re.escape(
+                "MultiKeyMappingTransformer: value_column (c) should not be one of the key columns",
+            ),
+        ):
+            MultiKeyMappingTransformer(
+                columns=["b", "c"],
+                mapping_table={("f", "a"): 1.5},
+                value_column="c",
+            )
+
+    @pytest.mark.parametrize("mapping_table", [1, [("f", "a", 1.5)], "table"])
+    def test_mapping_table_type_error(self, mapping_table):
+        """Test an exception is raised if mapping_table is not a DataFrame or dict."""
+        with pytest.raises(
+            TypeError,
+            match="MultiKeyMappingTransformer: mapping_table should be a pd.DataFrame, pl.DataFrame or dict with tuple keys",
+        ):
+            MultiKeyMappingTransformer(
+                columns=["b", "c"],
+                mapping_table=mapping_table,
+                value_column="d",
+            )
+
+    @pytest.mark.parametrize("key", ["f", ("f",), ("f", "a", "x")])
+    def test_dict_key_error(self, key):
+        """Test an exception is raised if dict keys are not tuples with a value per key column."""
+        with pytest.raises(
+            ValueError,
+            match=re.escape(
+                f"MultiKeyMappingTransformer: keys of mapping_table should be tuples of length 2, got {key}",
+            ),
+        ):
+            MultiKeyMappingTransformer(
+                columns=["b", "c"],
+                mapping_table={key: 1.5},
+                value_column="d",
+            )
+
+    @pytest.mark.parametrize("library", ["pandas", "polars"])
+    def test_table_columns_missing_error(self, library):
+        """Test an exception is raised if key or value columns are not in mapping_table."""
+        table = d.create_object_df(library=library)
+
+        with pytest.raises(
+            ValueError,
+            match=re.escape(
+                "MultiKeyMappingTransformer: columns ['e', 'd'] are not in mapping_table",
+            ),
+        ):
+            MultiKeyMappingTransformer(
+                columns=["b", "e"],
+                mapping_table=table,
+                value_column="d",
+            )
+
+    @pytest.mark.parametrize("library", ["pandas", "polars"])
+    def test_duplicate_keys_error(self, library):
+        """Test an exception is raised if mapping_table has repeated combinations of keys."""
+        table = d.create_object_df(library=library)
+
+        with pytest.raises(
+            ValueError,
+            match=re.escape(
+                "MultiKeyMappingTransformer: mapping_table has more than one row for some combinations of ['b']",
+            ),
+        ):
+            MultiKeyMappingTransformer(
+                columns=["b"],
+                mapping_table=repeat_first_row(table),
+                value_column="a",
+            )
+
+
+class TestTransform(GenericTransformTests):
+    """Tests for MultiKeyMappingTransformer.transform()."""
+
+    @classmethod
+    def setup_class(cls):
+        cls.transformer_name = "MultiKeyMappingTransformer"
+
+    @staticmethod
+    def create_table():
+        """Rating table keyed by region and age band, with a null value and a null key."""
+        return {
+            ("north", "18-25"): 1.5,
+            ("north", "26-40"): 1.2,
+            ("south", "18-25"): 1.1,
+            ("south", "26-40"): None,
+            ("east", None): 3.0,
+        }
+
+    @staticmethod
+    def create_df(library="pandas"):
+        """Data with matched, unmatched and null keys."""
+        df_dict = {
+            "region": ["north", "south", "north", "west", "east", None, "south"],
+            "age_band": ["18-25", "18-25", "26-40", "18-25", None, "18-25", "26-40"],
+            "a": [1, 2, 3, 4, 5, 6, 7],
+        }
+
+        df = pd.DataFrame(df_dict, index=[10, 9, 8, 7, 6, 5, 4])
+
+        if library == "polars":
+            df = pl.from_pandas(df)
+
+        return df
+
+    @pytest.mark.parametrize("library", ["pandas", "polars"])
+    @pytest.mark.parametrize(
+        ("default", "expected_values"),
+        [
+            (None, [1.5, 1.1, 1.2, None, None, None, None]),
+            (1.0, [1.5, 1.1, 1.2, 1.0, 1.0, 1.0, None]),
+        ],
+    )
+    def test_expected_output(self, library, default, expected_values):
+        """Test values are looked up for each row, with default for misses and null keys but not
+        for null values in the table."""
+        df = self.create_df(library=library)
+
+        x = MultiKeyMappingTransformer(
+            columns=["region", "age_band"],
+            mapping_table=self.create_table(),
+            value_column="rate",
+            new_column_name="region_age_rate",
+            default=default,
+        )
+
+        df_transformed = x.transform(df)
+
+        expected = self.create_df()
+        expected["region_age_rate"] = np.array(expected_values, dtype=float)
+
+        if library == "polars":
+            expected = pl.from_pandas(expected)
+            pl.testing.assert_frame_equal(df_transformed, expected)
+        else:
+            ta.equality.assert_frame_equal_msg(
+                actual=df_transformed,
+                expected=expected,
+                msg_tag="Unexpected values in MultiKeyMappingTransformer.transform",
+            )
+
+    @pytest.mark.parametrize("table_library", ["pandas", "polars"])
+    @pytest.mark.parametrize("library", ["pandas", "polars"])
+    def test_table_and_X_libraries_can_differ(self, library, table_library):
+        """Test a table of either library can be applied to X of either library, with categorical
+        and narrower integer keys."""
+        table = pd.DataFrame(
+            {"b": ["f", "g", "h"], "a": [1, 2, 4], "rate": [0.5, 0.6, 0.7]},
+        )
+        if table_library == "polars":
+            table = pl.from_pandas(table)
+
+        df = d.create_object_df()
+        df["a"] = df["a"].astype("int32")
+        df["b"] = df["b"].astype("category")
+        if library == "polars":
+            df = pl.from_pandas(df)
+
+        x = MultiKeyMappingTransformer(
+            columns=["b", "a"],
+            mapping_table=table,
+            value_column="rate",
+            default=0.0,
+        )
+
+        df_transformed = x.transform(df)
+
+        assert to_list(df_transformed["rate"]) == [
+            0.5,
+            0.6,
+            0.0,
+            0.0,
+            0.0,
+        ], "Unexpected values when table and X differ in library or key dtypes"
+
+    @pytest.mark.parametrize("library", ["pandas", "polars"])
+    def test_string_default(self, library):
+        """Test a string default fills unmatched rows rather than being read as a column name."""
+        df = self.create_df(library=library)
+
+        x = MultiKeyMappingTransformer(
+            columns=["region", "age_band"],
+            mapping_table={
+                ("north", "18-25"): "young",
+                ("north", "26-40"): "middle",
+                ("south", "18-25"): "young",
+            },
+            value_column="band_label",
+            default="other",
+        )
+
+        df_transformed = x.transform(df)
+
+        assert to_list(df_transformed["band_label"]) == [
+            "young",
+            "young",
+            "middle",
+            "other",
+            "other",
+            "other",
+            "other",
+        ], "Unexpected values with a string default"
+
+    @pytest.mark.parametrize("table_library", ["pandas", "polars"])
+    @pytest.mark.parametrize("library", ["pandas", "polars"])
+    def test_lossy_key_cast_error(self, library, table_library):
+        """Test an error is raised if table keys would change when cast to the dtypes of X, rather
+        than 1.5 matching rows where a is 1."""
+        table = pd.DataFrame({"a": [1.5, 2.0], "rate": [10.0, 20.0]})
+        if table_library == "polars":
+            table = pl.from_pandas(table)
+
+        df = d.create_df_1(library=library)
+
+        x = MultiKeyMappingTransformer(
+            columns=["a"],
+            mapping_table=table,
+            value_column="rate",
+            default=0.0,
+        )
+
+        with pytest.raises(
+            ValueError,
+            match=re.escape(
+                "MultiKeyMappingTransformer: keys of mapping_table column a (Float64) cannot be cast to the dtype of X (Int64) without changing their values",
+            ),
+        ):
+            x.transform(df)
+
+    @pytest.mark.parametrize("library", ["pandas", "polars"])
+    def test_lossless_key_cast(self, library):
+        """Test whole float table keys are matched to int columns of X."""
+        table = pd.DataFrame({"a": [1.0, 3.0], "rate": [10.0, 30.0]})
+
+        df = d.create_df_1(library=library)
+
+        x = MultiKeyMappingTransformer(
+            columns=["a"],
+            mapping_table=table,
+            value_column="rate",
+            default=0.0,
+        )
+
+        assert to_list(x.transform(df)["rate"]) == [
+            10.0,
+            0.0,
+            30.0,
+            0.0,
+            0.0,
+            0.0,
+        ], "Unexpected values for float table keys cast to int"
+
+    def test_output_matches_dict_lookup(self):
+        """Test the join gives the same values as looking up each row's key tuple in a dict."""
+        rng = np.random.default_rng(0)
+
+        table = {
+            (f"r{i}", j): float(i * 10 + j) for i in range(20) for j in range(0, 10, 2)
+        }
+
+        df = pd.DataFrame(
+            {
+                "region": [f"r{i}" for i in rng.integers(0, 25, 1000)],
+                "band": rng.integers(0, 10, 1000),
+            },
+        )
+
+        x = MultiKeyMappingTransformer(
+            columns=["region", "band"],
+            mapping_table=table,
+            value_column="rate",
+            default=-1.0,
+        )
+
+        expected = [table.get((r, b), -1.0) for r, b in zip(df["region"], df["band"])]
+
+        assert (
+            x.transform(df)["rate"].tolist() == expected
+        ), "output differs from dict lookup"
+
+
+class TestOtherBaseBehaviour(OtherBaseBehaviourTests):
+    """
+    Class to run tests for BaseTransformerBehaviour outside the three standard methods.
+
+    May need to overwite specific tests in this class if the tested transformer modifies this behaviour.
+    """
+
+    @classmethod
+    def setup_class(cls):
+        cls.transformer_name = "MultiKeyMappingTransformer"
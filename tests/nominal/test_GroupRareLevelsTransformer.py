@@ -1,5 +1,6 @@
 import numpy as np
 import pandas as pd
+import polars as pl
 import pytest
 import test_aide as ta
 from test_BaseNominalTransformer import GenericNominalTransformTests
@@ -81,7 +82,10 @@ class TestFit(GenericFitTests, WeightColumnFitMixinTests):
         ta.classes.test_object_attributes(
             obj=x,
             expected_attributes={
-                "non_rare_levels": {"b": [None, "a"], "c": ["a", "c", "e"]},
+                "non_rare_levels": {
+                    "b": frozenset([None, "a"]),
+                    "c": frozenset(["a", "c", "e"]),
+                },
             },
             msg="non_rare_levels attribute",
         )
@@ -100,7 +104,7 @@ class TestFit(GenericFitTests, WeightColumnFitMixinTests):
 
         ta.classes.test_object_attributes(
             obj=x,
-            expected_attributes={"non_rare_levels": {"b": ["a", np.nan]}},
+            expected_attributes={"non_rare_levels": {"b": frozenset(["a", None])}},
             msg="non_rare_levels attribute",
         )
 
@@ -118,10 +122,74 @@ class TestFit(GenericFitTests, WeightColumnFitMixinTests):
 
         ta.classes.test_object_attributes(
             obj=x,
-            expected_attributes={"non_rare_levels": {"c": ["f", "g"]}},
+            expected_attributes={"non_rare_levels": {"c": frozenset(["f", "g"])}},
             msg="non_rare_levels attribute",
         )
 
+    @pytest.mark.parametrize("library", ["pandas", "polars"])
+    @pytest.mark.parametrize(
+        ("weights_column", "expected_non_rare", "expected_rare"),
+        [
+            # b counts: a 3, null 3, d/e/f/g 1 each
+            (None, {"a", None}, ["d", "e", "f", "g"]),
+            # b weights: a 6, null 8, d 2, e 0, f 2, g 2 out of 20
+            ("a", {"a", None}, ["d", "e", "f", "g"]),
+        ],
+    )
+    def test_learnt_values_include_nulls(
+        self,
+        library,
+        weights_column,
+        expected_non_rare,
+        expected_rare,
+    ):
+        """Test null is counted as a level, with or without weights, and that the levels learnt
+        are the same for pandas and polars."""
+        df = d.create_df_6()
+        if library == "polars":
+            df = pl.from_pandas(df)
+
+        x = GroupRareLevelsTransformer(
+            columns=["b"],
+            cut_off_percent=0.2,
+            weights_column=weights_column,
+            unseen_levels_to_rare=False,
+        )
+
+        x.fit(df)
+
+        assert x.non_rare_levels == {
+            "b": frozenset(expected_non_rare),
+        }, "non_rare_levels attribute not as expected"
+        assert x.rare_levels_record_ == {
+            "b": expected_rare,
+        }, "rare_levels_record_ attribute not as expected"
+        assert x.training_data_levels == {
+            "b": frozenset(expected_non_rare) | frozenset(expected_rare),
+        }, "training_data_levels attribute not as expected"
+
+    @pytest.mark.parametrize("weights_column", [None, "w"])
+    def test_none_and_nan_counted_as_one_level(self, weights_column):
+        """Test None and np.nan in a pandas object column are counted as the same null level."""
+        df = pd.DataFrame(
+            {
+                "b": ["a", "a", "a", "a", None, np.nan, None, np.nan, "c", "c"],
+                "w": 1,
+            },
+        )
+
+        x = GroupRareLevelsTransformer(
+            columns="b",
+            cut_off_percent=0.3,
+            weights_column=weights_column,
+        )
+
+        x.fit(df)
+
+        assert x.non_rare_levels == {
+            "b": frozenset(["a", None]),
+        }, "None and np.nan not counted together"
+
     def test_rare_level_name_not_diff_col_type(self):
         """Test that an exception is raised if rare_level_name is of a different type with respect columns."""
         df = d.create_df_10()
@@ -147,8 +215,8 @@ class TestFit(GenericFitTests, WeightColumnFitMixinTests):
         df = d.create_df_8()
 
         expected_training_data_levels = {
-            "b": set(df["b"]),
-            "c": set(df["c"]),
+            "b": frozenset(df["b"]),
+            "c": frozenset(df["c"]),
         }
 
         x = GroupRareLevelsTransformer(columns=["b", "c"], unseen_levels_to_rare=False)
@@ -373,6 +441,186 @@ class TestTransform(GenericNominalTransformTests):
                 cat not in output_categories
             ), f"{x.classname} output columns should forget rare encoded categories, expected {cat} to be forgotten from column {column}"
 
+    def test_fitted_levels_not_modified_by_unseen_levels(self):
+        """Test transform does not add unseen levels to the fitted levels when
+        unseen_levels_to_rare is False, so repeated calls give the same output."""
+        df = d.create_df_8()
+
+        x = GroupRareLevelsTransformer(
+            columns=["b", "c"],
+            cut_off_percent=0.3,
+            unseen_levels_to_rare=False,
+        )
+        x.fit(df)
+
+        non_rare_levels = dict(x.non_rare_levels)
+        training_data_levels = dict(x.training_data_levels)
+
+        df_unseen = pd.DataFrame(
+            {
+                "b": ["w", "z", "unseen_1", "unseen_2"],
+                "c": pd.Categorical(["a", "c", "d", None]),
+            },
+        )
+
+        first = x.transform(df_unseen)
+        second = x.transform(df_unseen)
+
+        assert (
+            x.non_rare_levels == non_rare_levels
+        ), "non_rare_levels changed by transform"
+        assert (
+            x.training_data_levels == training_data_levels
+        ), "training_data_levels changed by transform"
+
+        ta.equality.assert_frame_equal_msg(
+            actual=second,
+            expected=first,
+            msg_tag="repeated transform output differs",
+        )
+
+    @pytest.mark.parametrize(
+        ("unseen_levels_to_rare", "expected_values", "expected_categories"),
+        [
+            (
+                True,
+                ["a", "rare", "rare", "rare", "e", None],
+                ["a", "e", "rare"],
+            ),
+            (
+                False,
+                ["a", "rare", "x", "y", "e", None],
+                ["a", "e", "x", "y", "rare"],
+            ),
+        ],
+    )
+    def test_categorical_categories_remapped(
+        self,
+        unseen_levels_to_rare,
+        expected_values,
+        expected_categories,
+    ):
+        """Test grouped categories are dropped and rare is added as the last category, with
+        unseen categories kept if unseen_levels_to_rare is False and nulls left as null if null
+        is a non-rare level."""
+        x = GroupRareLevelsTransformer(
+            columns="c",
+            unseen_levels_to_rare=unseen_levels_to_rare,
+        )
+
+        x.non_rare_levels = {"c": frozenset(["a", "e", None])}
+        x.training_data_levels = {"c": frozenset(["a", "b", "e", None])}
+
+        df = pd.DataFrame(
+            {
+                "c": pd.Categorical(
+                    ["a", "b", "x", "y", "e", None],
+                    categories=["y", "x", "e", "b", "a"],
+                ),
+            },
+            index=[5, 4, 3, 2, 1, 0],
+        )
+
+        df_transformed = x.transform(df)
+
+        expected = pd.DataFrame(
+            {
+                "c": pd.Categorical(
+                    expected_values,
+                    categories=[
+                        c
+                        for c in ["y", "x", "e", "b", "a", "rare"]
+                        if c in expected_categories
+                    ],
+                ),
+            },
+            index=[5, 4, 3, 2, 1, 0],
+        )
+
+        ta.equality.assert_frame_equal_msg(
+            actual=df_transformed,
+            expected=expected,
+            msg_tag="Unexpected values in GroupRareLevelsTransformer.transform for categorical column",
+        )
+
+    @pytest.mark.parametrize("unseen_levels_to_rare", [True, False])
+    def test_categorical_output_matches_object_output(self, unseen_levels_to_rare):
+        """Test the values output for a categorical column are those output for the same
+        column as object dtype, including nulls."""
+        rng = np.random.default_rng(0)
+
+        levels = np.array(["a", "b", "c", "d", "e", None], dtype=object)
+        df_fit = pd.DataFrame({"b": levels[rng.zipf(1.5, 1000) % 5]})
+        df_fit.loc[rng.random(1000) < 0.1, "b"] = None
+        df_fit["c"] = df_fit["b"].astype("category")
+
+        x = GroupRareLevelsTransformer(
+            columns=["b", "c"],
+            cut_off_percent=0.1,
+            unseen_levels_to_rare=unseen_levels_to_rare,
+        )
+        x.fit(df_fit)
+
+        df = pd.DataFrame({"b": levels[rng.integers(0, 6, 100)]})
+        df.loc[:4, "b"] = ["f", "g", None, "a", "e"]
+        df["c"] = df["b"].astype("category")
+
+        df_transformed = x.transform(df)
+
+        assert (
+            df_transformed["c"].astype(object).where(df_transformed["c"].notna(), None)
+        ).tolist() == df_transformed[
+            "b"
+        ].tolist(), "categorical and object outputs differ"
+
+    @pytest.mark.parametrize("unseen_levels_to_rare", [True, False])
+    def test_polars_output_matches_pandas(self, unseen_levels_to_rare):
+        """Test polars output, including categorical columns, has the values of pandas output."""
+        df_fit = d.create_df_6()
+        df = df_fit.copy()
+        df["b"] = ["a", "a", "z", "d", "e", "f", "g", None, "y", None]
+
+        x = GroupRareLevelsTransformer(
+            columns=["b", "c"],
+            cut_off_percent=0.2,
+            weights_column="a",
+            unseen_levels_to_rare=unseen_levels_to_rare,
+        )
+
+        pandas_output = x.fit(df_fit).transform(df)
+        polars_output = x.fit(pl.from_pandas(df_fit)).transform(pl.from_pandas(df))
+
+        assert polars_output.schema["c"] == pl.Categorical, "categorical dtype not kept"
+
+        for c in ["b", "c"]:
+            assert (
+                polars_output[c].to_list()
+                == pandas_output[c]
+                .astype(object)
+                .where(pandas_output[c].notna(), None)
+                .tolist()
+            ), f"polars and pandas outputs differ for column {c}"
+
+    def test_rare_level_name_already_category(self):
+        """Test the rare level is not duplicated if it is already a category of the column."""
+        x = GroupRareLevelsTransformer(columns="c")
+
+        x.non_rare_levels = {"c": frozenset(["a", "rare"])}
+
+        df = pd.DataFrame({"c": pd.Categorical(["a", "rare", "b"])})
+
+        df_transformed = x.transform(df)
+
+        assert df_transformed["c"].tolist() == [
+            "a",
+            "rare",
+            "rare",
+        ], "unexpected values when rare level is a category"
+        assert list(df_transformed["c"].cat.categories) == [
+            "a",
+            "rare",
+        ], "unexpected categories when rare level is a category"
+
 
 class TestOtherBaseBehaviour(OtherBaseBehaviourTests):
     """
@@ -0,0 +1,254 @@
+import re
+
+import numpy as np
+import pandas as pd
+import polars as pl
+import pytest
+import test_aide as ta
+from scipy import sparse
+
+from tests.base_tests import (
+    ColumnStrListInitTests,
+    GenericTransformTests,
+    OtherBaseBehaviourTests,
+)
+from tubular.nominal import HashingEncoderTransformer
+
+
+def create_df(library="pandas"):
+    """Data with string, integer and categorical columns with repeated levels and a shuffled index."""
+    df = pd.DataFrame(
+        {
+            "a": ["x", "y", "z", "x", "postcode", "y"],
+            "b": [1, 2, 3, 1, 4, 2],
+            "c": pd.Categorical(["x", "y", "z", "x", "postcode", "y"]),
+        },
+        index=[10, 3, 7, 0, 1, 2],
+    )
+
+    if library == "polars":
+        df = pl.from_pandas(df)
+
+    return df
+
+
+class TestInit(ColumnStrListInitTests):
+    """Tests for HashingEncoderTransformer.init()."""
+
+    @classmethod
+    def setup_class(cls):
+        cls.transformer_name = "HashingEncoderTransformer"
+
+    @pytest.mark.parametrize("n_buckets", [0, -1, 1.5, "8", True])
+    def test_n_buckets_value_error(self, n_buckets):
+        """Test an exception is raised if n_buckets is not a positive int."""
+        with pytest.raises(
+            ValueError,
+            match="HashingEncoderTransformer: n_buckets should be a positive int",
+        ):
+            HashingEncoderTransformer(columns="a", n_buckets=n_buckets)
+
+    def test_alternate_sign_type_error(self):
+        """Test an exception is raised if alternate_sign is not a bool."""
+        with pytest.raises(
+            TypeError,
+            match="HashingEncoderTransformer: alternate_sign should be a bool",
+        ):
+            HashingEncoderTransformer(columns="a", alternate_sign=1)
+
+
+class TestTransform(GenericTransformTests):
+    """Tests for HashingEncoderTransformer.transform()."""
+
+    @classmethod
+    def setup_class(cls):
+        cls.transformer_name = "HashingEncoderTransformer"
+
+    def test_expected_output(self):
+        """Test each value is replaced by its hash modulo n_buckets."""
+        df = create_df()
+
+        x = HashingEncoderTransformer(columns=["a", "b"], n_buckets=7)
+
+        df_transformed = x.transform(df)
+
+        expected = df.copy()
+        for c in ["a", "b"]:
+            expected[c] = (
+                pd.util.hash_array(
+                    df[c].astype(str).to_numpy(dtype=object),
+                    categorize=False,
+                )
+                % 7
+            ).astype(np.int64)
+
+        ta.equality.assert_frame_equal_msg(
+            actual=df_transformed,
+            expected=expected,
+            msg_tag="Unexpected values in HashingEncoderTransformer.transform",
+        )
+
+    def test_equal_levels_share_buckets(self):
+        """Test a level is put in the same bucket wherever it appears, and that buckets do not
+        depend on the other rows of X."""
+        df = create_df()
+
+        x = HashingEncoderTransformer(columns=["a", "b"], n_buckets=1000)
+
+        df_transformed = x.transform(df)
+        df_single_rows = pd.concat(
+            [x.transform(df.iloc[[i]]) for i in range(df.shape[0])],
+        )
+
+        ta.equality.assert_frame_equal_msg(
+            actual=df_single_rows,
+            expected=df_transformed,
+            msg_tag="buckets depend on the other rows of X",
+        )
+
+        assert (
+            df_transformed["a"].iloc[0] == df_transformed["a"].iloc[3]
+        ), "repeated level hashed to different buckets"
+
+    @pytest.mark.parametrize("library", ["pandas", "polars"])
+    def test_categorical_column_matches_string_column(self, library):
+        """Test categorical columns are hashed the same as the equivalent string columns."""
+        df = create_df(library=library)
+
+        x = HashingEncoderTransformer(columns=["a", "c"], n_buckets=16)
+
+        df_transformed = x.transform(df)
+
+        assert list(df_transformed["a"]) == list(
+            df_transformed["c"],
+        ), "categorical column hashed differently to string column"
+
+    def test_polars_output_matches_pandas(self):
+        """Test polars inputs are put in the same buckets as pandas inputs."""
+        x = HashingEncoderTransformer(columns=["a", "b", "c"], n_buckets=16)
+
+        df_transformed = x.transform(create_df())
+        df_transformed_polars = x.transform(create_df(library="polars"))
+
+        pl.testing.assert_frame_equal(
+            df_transformed_polars,
+            pl.from_pandas(df_transformed),
+            check_dtypes=False,
+        )
+        assert df_transformed_polars["a"].dtype == pl.Int64, "output not Int64"
+
+    @pytest.mark.parametrize("library", ["pandas", "polars"])
+    def test_nulls_error(self, library):
+        """Test an exception is raised if a column to encode has nulls."""
+        df = create_df()
+        df.loc[3, "a"] = None
+
+        if library == "polars":
+            df = pl.from_pandas(df)
+
+        x = HashingEncoderTransformer(columns=["a", "b"])
+
+        with pytest.raises(
+            ValueError,
+            match=re.escape(
+                "HashingEncoderTransformer: column a has nulls - replace before proceeding",
+            ),
+        ):
+            x.transform(df)
+
+
+class TestTransformSparse:
+    """Tests for HashingEncoderTransformer.transform_sparse()."""
+
+    @pytest.mark.parametrize("library", ["pandas", "polars"])
+    def test_matrix_matches_bucket_indices(self, library):
+        """Test the matrix has a 1 in the column of each row's bucket, in a block per column."""
+        df = create_df(library=library)
+
+        x = HashingEncoderTransformer(columns=["a", "b"], n_buckets=8)
+
+        matrix = x.transform_sparse(df)
+        buckets = x.transform(df)
+
+        expected = np.zeros((6, 16))
+        for i, c in enumerate(["a", "b"]):
+            expected[np.arange(6), np.asarray(buckets[c]) + i * 8] = 1
+
+        assert sparse.isspmatrix_csr(matrix), "output is not a CSR matrix"
+        assert matrix.nnz == 12, "expected one stored value per row and column"
+
+        np.testing.assert_array_equal(
+            matrix.toarray(),
+            expected,
+            err_msg="sparse matrix does not match bucket indices",
+        )
+
+    def test_alternate_sign(self):
+        """Test signed hashing gives each level a consistent sign of +1 or -1 set by its hash."""
+        df = create_df()
+
+        x = HashingEncoderTransformer(columns=["a"], n_buckets=8, alternate_sign=True)
+
+        matrix = x.transform_sparse(df)
+
+        hashes = pd.util.hash_array(
+            df["a"].to_numpy(dtype=object),
+            hash_key="hashing_sign_key",
+            categorize=False,
+        )
+        expected_signs = np.where(hashes >= 2**63, -1.0, 1.0)
+
+        np.testing.assert_array_equal(
+            matrix.sum(axis=1).A1,
+            expected_signs,
+            err_msg="unexpected signs in sparse matrix",
+        )
+
+    @pytest.mark.parametrize("n_buckets", [3, 8])
+    def test_signs_independent_of_buckets(self, n_buckets):
+        """Test levels in the same bucket can have either sign, including when n_buckets is not a
+        power of two."""
+        df = pd.DataFrame({"a": [f"level_{i}" for i in range(200)]})
+
+        x = HashingEncoderTransformer(
+            columns=["a"],
+            n_buckets=n_buckets,
+            alternate_sign=True,
+        )
+
+        matrix = x.transform_sparse(df).tocoo()
+
+        for bucket in range(n_buckets):
+            signs = set(matrix.data[matrix.col == bucket])
+
+            assert signs == {
+                -1.0,
+                1.0,
+            }, f"levels in bucket {bucket} do not have both signs"
+
+    def test_nulls_error(self):
+        """Test an exception is raised if a column to encode has nulls."""
+        df = create_df()
+        df.loc[3, "b"] = None
+
+        x = HashingEncoderTransformer(columns=["a", "b"])
+
+        with pytest.raises(
+            ValueError,
+            match=re.escape(
+                "HashingEncoderTransformer: column b has nulls - replace before proceeding",
+            ),
+        ):
+            x.transform_sparse(df)
+
+
+class TestOtherBaseBehaviour(OtherBaseBehaviourTests):
+    """
+    Class to run tests for BaseTransformerBehaviour outside the three standard methods.
+
+    May need to overwite specific tests in this class if the tested transformer modifies this behaviour.
+    """
+
+    @classmethod
+    def setup_class(cls):
+        cls.transformer_name = "HashingEncoderTransformer"
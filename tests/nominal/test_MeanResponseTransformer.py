@@ -1,7 +1,9 @@
+import re
 from itertools import product
 
 import numpy as np
 import pandas as pd
+import polars as pl
 import pytest
 import test_aide as ta
 from pandas.testing import assert_series_equal
@@ -215,6 +217,104 @@ class TestInit(ColumnStrListInitTests, WeightColumnInitMixinTests):
         ):
             MeanResponseTransformer(return_type="int")
 
+    @pytest.mark.parametrize("cv", [1, 0, 2.0, "5"])
+    def test_cv_value_error(self, cv):
+        """Test that an exception is raised if cv is not None or an int greater than 1."""
+        with pytest.raises(
+            ValueError,
+            match="MeanResponseTransformer: cv should be None or an int greater than 1",
+        ):
+            MeanResponseTransformer(cv=cv)
+
+    @pytest.mark.parametrize("random_state", [1.0, "1", [1]])
+    def test_random_state_type_error(self, random_state):
+        """Test that an exception is raised if random_state is not None or an int."""
+        with pytest.raises(
+            TypeError,
+            match="MeanResponseTransformer: random_state should be None or an int",
+        ):
+            MeanResponseTransformer(cv=3, random_state=random_state)
+
+    def test_smoothing_value_error(self):
+        """Test that an exception is raised if smoothing is not None or a known option."""
+        with pytest.raises(
+            ValueError,
+            match="MeanResponseTransformer: smoothing should be None or one of: 'm_estimate', 'empirical_bayes', 'hierarchical'",
+        ):
+            MeanResponseTransformer(smoothing="bayes")
+
+    def test_prior_with_smoothing_error(self):
+        """Test that an exception is raised if prior is set with smoothing."""
+        with pytest.raises(
+            ValueError,
+            match="MeanResponseTransformer: prior is only used when smoothing is None",
+        ):
+            MeanResponseTransformer(prior=1, smoothing="m_estimate")
+
+    @pytest.mark.parametrize("smoothing_strength", [-1, "1", None, True])
+    def test_smoothing_strength_value_error(self, smoothing_strength):
+        """Test that an exception is raised if smoothing_strength is not a non-negative number."""
+        with pytest.raises(
+            ValueError,
+            match="MeanResponseTransformer: smoothing_strength should be a non-negative int or float",
+        ):
+            MeanResponseTransformer(
+                smoothing="m_estimate",
+                smoothing_strength=smoothing_strength,
+            )
+
+    @pytest.mark.parametrize(
+        ("smoothing", "parent_column"),
+        [("hierarchical", None), ("m_estimate", "c"), (None, "c")],
+    )
+    def test_parent_column_only_with_hierarchical_error(
+        self,
+        smoothing,
+        parent_column,
+    ):
+        """Test that an exception is raised unless parent_column is set exactly when smoothing is
+        'hierarchical'."""
+        with pytest.raises(
+            ValueError,
+            match="MeanResponseTransformer: parent_column should be set if and only if smoothing is 'hierarchical'",
+        ):
+            MeanResponseTransformer(smoothing=smoothing, parent_column=parent_column)
+
+    def test_parent_column_type_error(self):
+        """Test that an exception is raised if parent_column is not a str."""
+        with pytest.raises(
+            TypeError,
+            match="MeanResponseTransformer: parent_column should be a str",
+        ):
+            MeanResponseTransformer(smoothing="hierarchical", parent_column=["c"])
+
+    def test_parent_column_in_columns_error(self):
+        """Test that an exception is raised if parent_column is one of the columns to encode."""
+        with pytest.raises(
+            ValueError,
+            match=re.escape(
+                "MeanResponseTransformer: parent_column (c) should not be one of the columns to encode",
+            ),
+        ):
+            MeanResponseTransformer(
+                columns=["b", "c"],
+                smoothing="hierarchical",
+                parent_column="c",
+            )
+
+    def test_hierarchical_with_cv_error(self):
+        """Test that an exception is raised if hierarchical smoothing is used with cv."""
+        with pytest.raises(
+            ValueError,
+            match="MeanResponseTransformer: cv is not supported with hierarchical smoothing",
+        ):
+            MeanResponseTransformer(
+                columns="b",
+                smoothing="hierarchical",
+                parent_column="c",
+                cv=3,
+            )
+
 
 class TestPriorRegularisation:
     "tests for _prior_regularisation method."
@@ -480,6 +580,37 @@ class TestFit(GenericFitTests, WeightColumnFitMixinTests):
             unobserved_value not in x.mappings
         ), "MeanResponseTransformer should ignore unobserved levels"
 
+    @pytest.mark.parametrize("weights_column", [None, "e"])
+    def test_multi_level_matches_binary_response_per_level(self, weights_column):
+        """Test encodings against each response level, learnt from one group_by per column, are the
+        same as encoding against an indicator of that level as a binary response."""
+        df = create_MeanResponseTransformer_test_df()
+
+        x = MeanResponseTransformer(
+            columns=["b", "c"],
+            level="all",
+            prior=2,
+            weights_column=weights_column,
+        )
+        x.fit(df, df["multi_level_response"])
+
+        for level in x.response_levels:
+            x_level = MeanResponseTransformer(
+                columns=["b", "c"],
+                prior=2,
+                weights_column=weights_column,
+            )
+            x_level.fit(df, (df["multi_level_response"] == level).astype(float))
+
+            assert x.global_mean[level] == pytest.approx(
+                x_level.global_mean,
+            ), f"global_mean not as expected for level {level}"
+
+            for c in x.columns:
+                assert x.mappings[c + "_" + level] == pytest.approx(
+                    x_level.mappings[c],
+                ), f"mappings not as expected for {c}_{level}"
+
 
 class TestFitBinaryResponse(GenericFitTests, WeightColumnFitMixinTests):
     """Tests for MeanResponseTransformer.fit()."""
@@ -1500,6 +1631,526 @@ class TestTransform(GenericTransformTests):
             msg="Mean response values not changed in transform",
         )
 
+    def test_categorical_column_matches_object_column(self):
+        """Test a categorical column, with nulls, unused categories and unseen levels, is encoded
+        the same as the equivalent object column."""
+        initial_df = create_MeanResponseTransformer_test_df()
+
+        x = MeanResponseTransformer(columns="b", unseen_level_handling="Mean")
+        x.fit(initial_df, initial_df["a"])
+
+        df = pd.DataFrame({"b": ["a", "z", None, "c", "a", "f", "y"]})
+
+        df_categorical = df.copy()
+        df_categorical["b"] = pd.Categorical(
+            df["b"],
+            categories=["x", "f", "a", "z", "c", "y"],
+        )
+
+        ta.equality.assert_frame_equal_msg(
+            actual=x.transform(df_categorical),
+            expected=x.transform(df),
+            msg_tag="categorical column encoded differently to object column",
+        )
+
+    @pytest.mark.parametrize(
+        ("level", "target_column", "unseen_level_handling"),
+        [
+            (None, "a", None),
+            (None, "a", "Median"),
+            ("all", "multi_level_response", "Mean"),
+            (["yellow"], "multi_level_response", 5),
+        ],
+    )
+    def test_polars_output_matches_pandas(
+        self,
+        level,
+        target_column,
+        unseen_level_handling,
+    ):
+        """Test fit and transform on polars inputs give the same output as for pandas."""
+        df = create_MeanResponseTransformer_test_df()
+
+        df_transform = create_MeanResponseTransformer_test_df_unseen_levels()
+        if unseen_level_handling is None:
+            df_transform = df
+
+        x = MeanResponseTransformer(
+            columns=["b", "c"],
+            level=level,
+            unseen_level_handling=unseen_level_handling,
+            prior=1,
+        )
+        x.fit(df, df[target_column])
+
+        expected = pl.from_pandas(x.transform(df_transform.copy()))
+
+        x_polars = MeanResponseTransformer(
+            columns=["b", "c"],
+            level=level,
+            unseen_level_handling=unseen_level_handling,
+            prior=1,
+        )
+        x_polars.fit(pl.from_pandas(df), pl.from_pandas(df[target_column]))
+
+        pl.testing.assert_frame_equal(
+            x_polars.transform(pl.from_pandas(df_transform)),
+            expected,
+        )
+
+    def test_polars_unseen_levels_error(self):
+        """Test an exception is raised for polars inputs with unseen levels if unseen_level_handling
+        is not set."""
+        df = create_MeanResponseTransformer_test_df()
+
+        x = MeanResponseTransformer(columns="b")
+        x.fit(pl.from_pandas(df), pl.from_pandas(df["a"]))
+
+        with pytest.raises(
+            ValueError,
+            match="MeanResponseTransformer: nulls would be introduced into column b from levels not present in mapping",
+        ):
+            x.transform(
+                pl.from_pandas(create_MeanResponseTransformer_test_df_unseen_levels()),
+            )
+
+
+class TestFitTransformOutOfFold:
+    """Tests for MeanResponseTransformer.fit_transform() with cv set."""
+
+    @staticmethod
+    def create_df():
+        """Data where every level of b and c appears in every fold, with a shuffled index."""
+        rng = np.random.default_rng(0)
+
+        n_rows = 300
+
+        df = pd.DataFrame(
+            {
+                "b": rng.choice(["a", "b", "c", "d"], n_rows),
+                "c": rng.choice(["x", "y", "z"], n_rows),
+                "w": rng.random(n_rows) + 0.1,
+                "a": rng.random(n_rows),
+                "multi_level_response": rng.choice(["blue", "green", "yellow"], n_rows),
+            },
+            index=rng.permutation(n_rows) + 10,
+        )
+
+        df["c"] = df["c"].astype("category")
+
+        return df
+
+    @pytest.mark.parametrize(
+        ("kwargs", "target_column"),
+        [
+            ({"prior": 2}, "a"),
+            ({"weights_column": "w", "level": "all"}, "multi_level_response"),
+            (
+                {"random_state": 3, "level": ["green"], "prior": 1},
+                "multi_level_response",
+            ),
+            ({"smoothing": "m_estimate", "weights_column": "w"}, "a"),
+            ({"smoothing": "empirical_bayes", "weights_column": "w"}, "a"),
+            (
+                {"smoothing": "empirical_bayes", "level": "all"},
+                "multi_level_response",
+            ),
+        ],
+    )
+    def test_output_matches_refitting_per_fold(self, kwargs, target_column):
+        """Test each fold is encoded as if the transformer were fit on the other folds."""
+        df = self.create_df()
+        cv = 5
+
+        x = MeanResponseTransformer(columns=["b", "c"], cv=cv, **kwargs)
+
+        df_transformed = x.fit_transform(df.copy(), df[target_column])
+
+        folds = np.arange(df.shape[0]) * cv // df.shape[0]
+        if "random_state" in kwargs:
+            folds = np.random.default_rng(kwargs["random_state"]).permutation(folds)
+
+        fold_kwargs = {k: v for k, v in kwargs.items() if k != "random_state"}
+
+        expected = []
+        for fold in range(cv):
+            df_train = df[folds != fold]
+
+            x_fold = MeanResponseTransformer(columns=["b", "c"], **fold_kwargs)
+            x_fold.fit(df_train, df_train[target_column])
+
+            expected.append(x_fold.transform(df[folds == fold].copy()))
+
+        ta.equality.assert_frame_equal_msg(
+            actual=df_transformed,
+            expected=pd.concat(expected).loc[df.index],
+            msg_tag="out-of-fold encodings differ from refitting on the other folds",
+            check_exact=False,
+        )
+
+    def test_mappings_fit_on_all_data(self):
+        """Test the mappings used by transform are learnt from all rows, not out-of-fold."""
+        df = self.create_df()
+
+        x = MeanResponseTransformer(columns=["b", "c"], prior=1, cv=4)
+        x.fit_transform(df, df["a"])
+
+        x_all = MeanResponseTransformer(columns=["b", "c"], prior=1)
+        x_all.fit(df, df["a"])
+
+        ta.equality.assert_equal_dispatch(
+            expected=x_all.mappings,
+            actual=x.mappings,
+            msg="mappings not fit on all data",
+        )
+
+    def test_level_in_one_fold_encoded_with_global_mean(self):
+        """Test rows of a level only present in their own fold get the mean of the other folds."""
+        df = pd.DataFrame(
+            {"b": ["a", "a", "b", "b", "c"], "a": [1.0, 2.0, 3.0, 4.0, 5.0]},
+        )
+
+        x = MeanResponseTransformer(columns="b", cv=5, return_type="float64")
+
+        df_transformed = x.fit_transform(df, df["a"])
+
+        expected = [2.0, 1.0, 4.0, 3.0, (1.0 + 2.0 + 3.0 + 4.0) / 4]
+
+        assert (
+            df_transformed["b"].tolist() == expected
+        ), "levels without rows in other folds not encoded with the mean of other folds"
+
+    def test_polars_output_matches_pandas(self):
+        """Test out-of-fold encoding of polars inputs gives the same values as pandas."""
+        df = self.create_df()
+
+        x = MeanResponseTransformer(columns=["b", "c"], level="all", prior=1, cv=3)
+
+        expected = pl.from_pandas(
+            x.fit_transform(df.copy(), df["multi_level_response"]).reset_index(
+                drop=True,
+            ),
+        )
+
+        df_transformed = x.fit_transform(
+            pl.from_pandas(df),
+            pl.from_pandas(df["multi_level_response"]),
+        )
+
+        pl.testing.assert_frame_equal(df_transformed, expected)
+
+    def test_null_levels_error(self):
+        """Test an exception is raised for nulls in a column if unseen_level_handling is not set."""
+        df = self.create_df()
+        df.loc[df.index[0], "b"] = None
+
+        x = MeanResponseTransformer(columns="b", cv=3)
+
+        with pytest.raises(
+            ValueError,
+            match="MeanResponseTransformer: nulls would be introduced into column b from levels not present in mapping",
+        ):
+            x.fit_transform(df, df["a"])
+
+    def test_fewer_rows_than_folds_error(self):
+        """Test an exception is raised if X has fewer rows than cv."""
+        df = self.create_df().head(3)
+
+        x = MeanResponseTransformer(columns="b", cv=4)
+
+        with pytest.raises(
+            ValueError,
+            match=re.escape(
+                "MeanResponseTransformer: X has fewer rows (3) than cv folds (4)",
+            ),
+        ):
+            x.fit_transform(df, df["a"])
+
+
+class TestFitSmoothing:
+    """Tests for MeanResponseTransformer.fit() with smoothing set."""
+
+    @staticmethod
+    def create_df():
+        """Data with levels of b nested in levels of p, other than level e which is in both."""
+        rng = np.random.default_rng(1)
+
+        n_rows = 200
+
+        df = pd.DataFrame(
+            {
+                "b": rng.choice(["a", "b", "c", "d", "e"], n_rows),
+                "w": rng.random(n_rows) + 0.1,
+                "a": rng.random(n_rows) * 10,
+                "multi_level_response": rng.choice(["blue", "green", "yellow"], n_rows),
+            },
+        )
+
+        df["p"] = df["b"].map({"a": "x", "b": "x", "c": "y", "d": "y"})
+        df.loc[df["b"] == "e", "p"] = rng.choice(["x", "y"], (df["b"] == "e").sum())
+
+        return df
+
+    @staticmethod
+    def expected_mapping(df, smoothing, m, weights_column=None, target_column="a"):
+        """Smoothed mean response of each level of b, calculated level by level."""
+        w = pd.Series(1.0, index=df.index) if weights_column is None else df["w"]
+        y = df[target_column]
+
+        global_mean = (w * y).sum() / w.sum()
+
+        def m_estimate(rows, prior_mean):
+            return ((w * y)[rows].sum() + m * prior_mean) / (w[rows].sum() + m)
+
+        parents = {
+            parent: m_estimate(df["p"] == parent, global_mean)
+            for parent in df["p"].unique()
+        }
+
+        # one-way random effects estimates of the within and between level variances
+        level_weights = w.groupby(df["b"]).sum()
+        level_means = (w * y).groupby(df["b"]).sum() / level_weights
+        n_levels = len(level_weights)
+
+        within_variance = (w * (y - df["b"].map(level_means)) ** 2).sum() / (
+            w.sum() - n_levels
+        )
+        between_variance = max(
+            (
+                (level_weights * (level_means - global_mean) ** 2).sum()
+                - (n_levels - 1) * within_variance
+            )
+            / (w.sum() - (level_weights**2).sum() / w.sum()),
+            0,
+        )
+
+        mapping = {}
+        for level in df["b"].unique():
+            rows = df["b"] == level
+            weight = w[rows].sum()
+            mean = (w * y)[rows].sum() / weight
+
+            if smoothing == "m_estimate":
+                mapping[level] = m_estimate(rows, global_mean)
+
+            elif smoothing == "hierarchical":
+                parent_mean = (
+                    sum(
+                        w[rows & (df["p"] == parent)].sum() * encoding
+                        for parent, encoding in parents.items()
+                    )
+                    / weight
+                )
+                mapping[level] = m_estimate(rows, parent_mean)
+
+            else:
+                shrinkage = (weight * between_variance) / (
+                    weight * between_variance + within_variance
+                )
+                mapping[level] = shrinkage * mean + (1 - shrinkage) * global_mean
+
+        return mapping
+
+    @pytest.mark.parametrize("weights_column", [None, "w"])
+    @pytest.mark.parametrize(
+        ("smoothing", "smoothing_strength"),
+        [
+            ("m_estimate", 5),
+            ("m_estimate", 0.5),
+            ("empirical_bayes", 1),
+            ("hierarchical", 20),
+            ("hierarchical", 0),
+        ],
+    )
+    def test_mappings_match_level_by_level_calculation(
+        self,
+        smoothing,
+        smoothing_strength,
+        weights_column,
+    ):
+        """Test the mappings equal the smoothed mean of each level calculated separately."""
+        df = self.create_df()
+
+        x = MeanResponseTransformer(
+            columns="b",
+            weights_column=weights_column,
+            smoothing=smoothing,
+            smoothing_strength=smoothing_strength,
+            parent_column="p" if smoothing == "hierarchical" else None,
+            return_type="float64",
+        )
+
+        x.fit(df, df["a"])
+
+        expected = self.expected_mapping(
+            df,
+            smoothing,
+            smoothing_strength,
+            weights_column=weights_column,
+        )
+
+        assert x.mappings["b"].keys() == expected.keys(), "unexpected levels mapped"
+
+        np.testing.assert_allclose(
+            [x.mappings["b"][level] for level in expected],
+            list(expected.values()),
+            err_msg=f"mappings not as expected for {smoothing} smoothing",
+        )
+
+    def test_empirical_bayes_shrinks_light_levels_more(self):
+        """Test levels with less weight are shrunk further towards the global mean."""
+        df = pd.DataFrame(
+            {
+                "b": ["a"] * 8 + ["b"] * 2 + ["c"] * 8,
+                "a": [2.0, 3.0] * 4 + [2.0, 3.0] + [6.0, 7.0] * 4,
+            },
+        )
+
+        x = MeanResponseTransformer(
+            columns="b",
+            smoothing="empirical_bayes",
+            return_type="float64",
+        )
+
+        x.fit(df, df["a"])
+
+        # a and b have the same mean, but b has fewer rows
+        assert (
+            2.5 < x.mappings["b"]["a"] < x.mappings["b"]["b"] < x.global_mean
+        ), "level with less weight should be shrunk further towards the global mean"
+
+    @pytest.mark.parametrize(
+        ("levels", "response"),
+        [
+            (["a", "a", "a", "a", "s1", "s2"], [0.0, 1.0, 1.0, 1.0, 10.0, -10.0]),
+            (["s1", "s2", "s3", "s4"], [0.0, 1.0, 10.0, -10.0]),
+        ],
+    )
+    def test_empirical_bayes_shrinks_singleton_levels(self, levels, response):
+        """Test levels with a single row are shrunk towards the global mean rather than encoded
+        with their response, including when every level has a single row."""
+        df = pd.DataFrame({"b": levels, "a": response})
+
+        x = MeanResponseTransformer(
+            columns="b",
+            smoothing="empirical_bayes",
+            return_type="float64",
+        )
+
+        x.fit(df, df["a"])
+
+        for level in ["s1", "s2"]:
+            value = df.loc[df["b"] == level, "a"].item()
+            encoding = x.mappings["b"][level]
+
+            assert abs(encoding - x.global_mean) < abs(
+                value - x.global_mean,
+            ), f"singleton level {level} should be shrunk towards the global mean"
+
+            assert (
+                np.sign(encoding - x.global_mean)
+                == np.sign(
+                    value - x.global_mean,
+                )
+            ), f"singleton level {level} should be shrunk no further than the global mean"
+
+    @pytest.mark.parametrize(
+        "smoothing",
+        ["m_estimate", "empirical_bayes", "hierarchical"],
+    )
+    def test_multi_level_matches_binary_response_per_level(self, smoothing):
+        """Test each response level is smoothed as if fit against an indicator of that level."""
+        df = self.create_df()
+        parent_column = "p" if smoothing == "hierarchical" else None
+
+        x = MeanResponseTransformer(
+            columns="b",
+            level="all",
+            weights_column="w",
+            smoothing=smoothing,
+            smoothing_strength=3,
+            parent_column=parent_column,
+        )
+
+        x.fit(df, df["multi_level_response"])
+
+        for level in ["blue", "green", "yellow"]:
+            x_level = MeanResponseTransformer(
+                columns="b",
+                weights_column="w",
+                smoothing=smoothing,
+                smoothing_strength=3,
+                parent_column=parent_column,
+            )
+
+            x_level.fit(df, (df["multi_level_response"] == level).astype(int))
+
+            for key, value in x_level.mappings["b"].items():
+                assert x.mappings["b_" + level][key] == pytest.approx(
+                    value,
+                ), f"mapping for {level} differs from fitting against an indicator"
+
+    @pytest.mark.parametrize(
+        "smoothing",
+        ["m_estimate", "empirical_bayes", "hierarchical"],
+    )
+    def test_polars_matches_pandas(self, smoothing):
+        """Test the mappings learnt from polars and pandas inputs are the same."""
+        df = self.create_df()
+
+        kwargs = {
+            "columns": "b",
+            "weights_column": "w",
+            "smoothing": smoothing,
+            "parent_column": "p" if smoothing == "hierarchical" else None,
+        }
+
+        x = MeanResponseTransformer(**kwargs).fit(df, df["a"])
+        x_polars = MeanResponseTransformer(**kwargs).fit(
+            pl.from_pandas(df),
+            pl.from_pandas(df["a"]),
+        )
+
+        for key, value in x.mappings["b"].items():
+            assert x_polars.mappings["b"][key] == pytest.approx(
+                value,
+            ), "polars mappings differ from pandas"
+
+    def test_parent_column_nulls_error(self):
+        """Test that an exception is raised if parent_column contains nulls."""
+        df = self.create_df()
+        df.loc[0, "p"] = None
+
+        x = MeanResponseTransformer(
+            columns="b",
+            smoothing="hierarchical",
+            parent_column="p",
+        )
+
+        with pytest.raises(
+            ValueError,
+            match=re.escape(
+                "MeanResponseTransformer: parent_column (p) contains nulls",
+            ),
+        ):
+            x.fit(df, df["a"])
+
+    def test_parent_column_not_in_X_error(self):
+        """Test that an exception is raised if parent_column is not in X."""
+        df = self.create_df()
+
+        x = MeanResponseTransformer(
+            columns="b",
+            smoothing="hierarchical",
+            parent_column="q",
+        )
+
+        with pytest.raises(
+            ValueError,
+            match=re.escape("MeanResponseTransformer: parent_column (q) is not in X"),
+        ):
+            x.fit(df, df["a"])
+
 
 class TestOtherBaseBehaviour(OtherBaseBehaviourTests):
     """
@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 import pytest
 import test_aide as ta
@@ -112,6 +113,37 @@ class TestTransform(GenericNominalTransformTests):
             msg_tag="Unexpected values in NominalToIntegerTransformer.transform",
         )
 
+    def test_categorical_column_matches_object_column(self):
+        """Test categorical columns, including null levels, are encoded with the same integers
+        as object columns."""
+        df = pd.DataFrame({"b": ["x", None, "y", "x", "z", None]})
+
+        x = NominalToIntegerTransformer(columns="b", start_encoding=3)
+
+        x.fit(df)
+
+        df_categorical = df.astype("category")
+
+        ta.equality.assert_frame_equal_msg(
+            actual=x.transform(df_categorical),
+            expected=x.transform(df),
+            msg_tag="categorical column encoded differently to object column",
+        )
+
+    def test_output_matches_dict_lookup(self):
+        """Test the integers taken by position are those looked up for each row in mappings."""
+        rng = np.random.default_rng(0)
+
+        df = pd.DataFrame({"b": [f"level_{i}" for i in rng.integers(0, 50, 1000)]})
+
+        x = NominalToIntegerTransformer(columns="b", start_encoding=-10)
+
+        x.fit(df)
+
+        assert x.transform(df)["b"].tolist() == [
+            x.mappings["b"][v] for v in df["b"]
+        ], "output differs from dict lookup"
+
 
 class TestInverseTransform(GenericNominalTransformTests, GenericTransformTests):
     """Tests for NominalToIntegerTransformer.inverse_transform()."""
@@ -184,6 +216,69 @@ class TestInverseTransform(GenericNominalTransformTests, GenericTransformTests):
             msg="Impute values not changed in inverse_transform",
         )
 
+    def test_inverse_mapping_attribute(self):
+        """Test inverse_mapping_ maps the integers of each column back to their levels."""
+        df = d.create_df_1()
+
+        x = NominalToIntegerTransformer(columns=["a", "b"], start_encoding=1)
+
+        x.fit(df)
+
+        x.inverse_transform(x.transform(df))
+
+        assert x.inverse_mapping_ == {
+            "a": {1: 1, 2: 2, 3: 3, 4: 4, 5: 5, 6: 6},
+            "b": {1: "a", 2: "b", 3: "c", 4: "d", 5: "e", 6: "f"},
+        }, "inverse_mapping_ attribute not as expected"
+
+    def test_inverse_mapping_built_once(self, tmp_path):
+        """Test inverse_mapping_ is built once rather than on every call, and without rebuilding
+        the mappings dict of a loaded transformer."""
+        df = d.create_df_1()
+
+        path = tmp_path / "transformer.pkl"
+        NominalToIntegerTransformer(columns=["a", "b"]).fit(df).save(path)
+
+        x = NominalToIntegerTransformer.load(path, mmap=False)
+
+        df_transformed = x.transform(df)
+
+        x.inverse_transform(df_transformed.copy())
+
+        inverse_mapping = x.inverse_mapping_["b"]
+
+        x.inverse_transform(df_transformed.copy())
+
+        assert (
+            x.inverse_mapping_["b"] is inverse_mapping
+        ), "inverse_mapping_ rebuilt in inverse_transform"
+
+        assert (
+            x.__dict__["_mappings"] is None
+        ), "mappings dict rebuilt by inverse_transform"
+
+    def test_round_trip_with_null_level(self):
+        """Test inverse_transform recovers null levels and levels of a categorical column."""
+        df = pd.DataFrame(
+            {"a": [2.5, None, 1.0, 2.5], "b": ["x", "y", None, "y"]},
+        )
+        df["b"] = df["b"].astype("category")
+
+        x = NominalToIntegerTransformer(columns=["a", "b"])
+
+        x.fit(df)
+
+        df_transformed_back = x.inverse_transform(x.transform(df))
+
+        expected = df.copy()
+        expected["b"] = expected["b"].astype(object)
+
+        ta.equality.assert_frame_equal_msg(
+            actual=df_transformed_back,
+            expected=expected,
+            msg_tag="transform reverse does not get back to original with null levels",
+        )
+
 
 class TestOtherBaseBehaviour(OtherBaseBehaviourTests):
     """
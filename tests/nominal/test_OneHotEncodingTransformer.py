@@ -1,7 +1,13 @@
+import re
+import warnings
+
 import numpy as np
 import pandas as pd
+import polars as pl
 import pytest
 import test_aide as ta
+from scipy import sparse
+from sklearn.preprocessing import OneHotEncoder
 from test_BaseNominalTransformer import GenericNominalTransformTests
 
 import tests.test_data as d
@@ -27,6 +33,62 @@ class TestInit(
     def setup_class(cls):
         cls.transformer_name = "OneHotEncodingTransformer"
 
+    def test_sparse_output_type_error(self):
+        """Test that an exception is raised if sparse_output is not a bool."""
+        with pytest.raises(
+            TypeError,
+            match="OneHotEncodingTransformer: sparse_output should be a bool",
+        ):
+            OneHotEncodingTransformer(columns="b", sparse_output=1)
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"drop": "first"},
+            {"categories": [["a", "b"]]},
+            {"handle_unknown": "error"},
+            {"max_categories": 5},
+        ],
+    )
+    def test_sklearn_arguments_error(self, kwargs):
+        """Test that an exception naming them is raised for arguments of sklearn's OneHotEncoder,
+        which were passed on to it by kwargs."""
+        with pytest.raises(
+            TypeError,
+            match=re.escape(
+                f"OneHotEncodingTransformer: {list(kwargs)} are arguments of sklearn's OneHotEncoder, which is no longer used so they are not supported. Levels are learnt in fit and top_k or min_frequency limit the number of levels. Unseen levels are encoded as all zeroes, or in the other_level column if top_k or min_frequency is set",
+            ),
+        ):
+            OneHotEncodingTransformer(columns="b", **kwargs)
+
+    @pytest.mark.parametrize("argument", ["max_levels", "top_k"])
+    @pytest.mark.parametrize("value", [0, -1, 1.5, "5", True])
+    def test_level_limit_value_error(self, argument, value):
+        """Test that an exception is raised if max_levels or top_k is not None or a positive int."""
+        with pytest.raises(
+            ValueError,
+            match=f"OneHotEncodingTransformer: {argument} should be None or a positive int",
+        ):
+            OneHotEncodingTransformer(columns="b", **{argument: value})
+
+    @pytest.mark.parametrize("min_frequency", [0, -2, 0.0, 1.0, 1.5, "0.1", True])
+    def test_min_frequency_value_error(self, min_frequency):
+        """Test that an exception is raised if min_frequency is not None, a positive int or a
+        float between 0 and 1."""
+        with pytest.raises(
+            ValueError,
+            match="OneHotEncodingTransformer: min_frequency should be None, a positive int or a float between 0 and 1",
+        ):
+            OneHotEncodingTransformer(columns="b", min_frequency=min_frequency)
+
+    def test_other_level_type_error(self):
+        """Test that an exception is raised if other_level is not a str."""
+        with pytest.raises(
+            TypeError,
+            match="OneHotEncodingTransformer: other_level should be a str",
+        ):
+            OneHotEncodingTransformer(columns="b", top_k=2, other_level=1)
+
 
 class TestFit(GenericFitTests):
     """Generic tests for transformer.fit()"""
@@ -60,6 +122,104 @@ class TestFit(GenericFitTests):
         ):
             x.fit(df)
 
+    @pytest.mark.parametrize("library", ["pandas", "polars"])
+    def test_levels_and_dummy_columns_learnt(self, library):
+        """Test the sorted levels of each column and the names of their dummy columns are learnt."""
+        df = d.create_df_7()
+        if library == "polars":
+            df = pl.from_pandas(df)
+
+        x = OneHotEncodingTransformer(columns=["a", "c"], separator="|")
+        x.fit(df)
+
+        assert [list(levels) for levels in x.categories_] == [
+            [1, 2, 3, 4],
+            ["a", "b", "c"],
+        ], "categories_ not as expected"
+
+        assert x.dummy_columns_ == {
+            "a": ["a|1", "a|2", "a|3", "a|4"],
+            "c": ["c|a", "c|b", "c|c"],
+        }, "dummy_columns_ not as expected"
+
+    def test_max_levels_configurable(self):
+        """Test the level limit is set by max_levels, and can be removed with None."""
+        df = pd.DataFrame({"b": list(range(150))})
+
+        x = OneHotEncodingTransformer(columns="b", max_levels=None).fit(df)
+
+        assert len(x.categories_[0]) == 150, "levels not all kept with max_levels=None"
+
+        with pytest.raises(
+            ValueError,
+            match="OneHotEncodingTransformer: column b has over 10 unique values - consider another type of encoding",
+        ):
+            OneHotEncodingTransformer(columns="b", max_levels=10).fit(df)
+
+    @pytest.mark.parametrize("library", ["pandas", "polars"])
+    @pytest.mark.parametrize(
+        ("kwargs", "expected_levels"),
+        [
+            # counts: a 4, b 3, c 3, d 2, e 1 - ties broken by level
+            ({"top_k": 2}, ["a", "b"]),
+            ({"top_k": 3}, ["a", "b", "c"]),
+            ({"min_frequency": 3}, ["a", "b", "c"]),
+            ({"min_frequency": 0.3}, ["a"]),
+            ({"min_frequency": 2, "top_k": 10}, ["a", "b", "c", "d"]),
+            ({"min_frequency": 2, "top_k": 1}, ["a"]),
+        ],
+    )
+    def test_levels_pruned(self, library, kwargs, expected_levels):
+        """Test only the most frequent levels, or those above min_frequency, are kept, with an
+        other indicator column."""
+        df = pd.DataFrame(
+            {"b": pd.Categorical(list("eddcccbbbaaaa"), categories=list("abcdez"))},
+        )
+        if library == "polars":
+            df = pl.from_pandas(df)
+
+        x = OneHotEncodingTransformer(columns="b", other_level="rare", **kwargs)
+        x.fit(df)
+
+        assert list(x.categories_[0]) == expected_levels, "unexpected levels kept"
+        assert x.dummy_columns_["b"] == [f"b_{lvl}" for lvl in expected_levels] + [
+            "b_rare",
+        ], "unexpected dummy columns"
+
+    def test_max_levels_applied_after_pruning(self):
+        """Test max_levels limits the number of levels kept after pruning, not before."""
+        df = pd.DataFrame({"b": list(range(150)) + [0, 1]})
+
+        x = OneHotEncodingTransformer(columns="b", max_levels=5, top_k=5).fit(df)
+
+        assert list(x.categories_[0]) == [0, 1, 2, 3, 4], "unexpected levels kept"
+
+    def test_other_level_is_kept_level_error(self):
+        """Test that an exception is raised if other_level is a level with its own dummy column."""
+        df = pd.DataFrame({"b": ["other", "other", "x", "y"]})
+
+        x = OneHotEncodingTransformer(columns="b", top_k=2)
+
+        with pytest.raises(
+            ValueError,
+            match=re.escape(
+                "OneHotEncodingTransformer: other_level (other) is a level of column b with its own dummy column",
+            ),
+        ):
+            x.fit(df)
+
+    def test_nulls_in_X_error_polars(self):
+        """Test that an exception is raised if a polars X has nulls in column to be fit on."""
+        df = pl.from_pandas(d.create_df_2())
+
+        x = OneHotEncodingTransformer(columns=["b", "c"])
+
+        with pytest.raises(
+            ValueError,
+            match="OneHotEncodingTransformer: column b has nulls - replace before proceeding",
+        ):
+            x.fit(df)
+
 
 class TestTransform(
     DropOriginalTransformMixinTests,
@@ -263,3 +423,253 @@ class TestTransform(
             actual=df_transformed,
             msg="unseen category rows not encoded as 0s",
         )
+
+    @pytest.mark.parametrize("separator", ["_", "|"])
+    def test_sparse_output_matches_dense(self, separator):
+        """Test sparse_output gives the same values and columns as dense output, with dummies
+        stored as SparseDtype columns."""
+        df_train = d.create_df_7()
+        df_test = d.create_df_8()
+        df_test.index = [5, 3, 1, 0, 2]
+
+        kwargs = {"columns": ["a", "b", "c"], "separator": separator}
+
+        x = OneHotEncodingTransformer(**kwargs).fit(df_train)
+        x_sparse = OneHotEncodingTransformer(sparse_output=True, **kwargs).fit(
+            df_train,
+        )
+
+        with pytest.warns(UserWarning, match="unseen categories"):
+            df_transformed = x.transform(df_test)
+
+        with pytest.warns(UserWarning, match="unseen categories"):
+            df_transformed_sparse = x_sparse.transform(df_test)
+
+        dummy_columns = [c for c in df_transformed.columns if c not in df_test.columns]
+
+        for c in dummy_columns:
+            assert df_transformed_sparse[c].dtype == pd.SparseDtype(
+                np.int8,
+                0,
+            ), f"{c} not a sparse column"
+
+        ta.equality.assert_frame_equal_msg(
+            actual=df_transformed_sparse.astype(
+                dict.fromkeys(dummy_columns, np.int8),
+            ),
+            expected=df_transformed,
+            msg_tag="sparse output differs from dense output",
+        )
+
+
+class TestTransformNative:
+    """Tests for OneHotEncodingTransformer.transform() against sklearn and with polars inputs."""
+
+    @staticmethod
+    def create_df(n_rows=500, seed=0):
+        """Data with string, integer and categorical columns and a shuffled index."""
+        rng = np.random.default_rng(seed)
+
+        return pd.DataFrame(
+            {
+                "a": rng.integers(0, 6, n_rows),
+                "b": rng.choice(["u", "v", "w", "x"], n_rows),
+                "c": pd.Categorical(
+                    rng.choice(["p", "q", "r"], n_rows),
+                    categories=["r", "q", "p", "s"],
+                ),
+                "d": rng.random(n_rows),
+            },
+            index=rng.permutation(n_rows) + 3,
+        )
+
+    def test_output_matches_sklearn(self):
+        """Test the dummies match sklearn's OneHotEncoder, including for unseen levels."""
+        df_train = self.create_df()
+        df_test = self.create_df(seed=1)
+        df_train = df_train[(df_train["a"] != 5) & (df_train["b"] != "x")]
+
+        columns = ["a", "b", "c"]
+
+        x = OneHotEncodingTransformer(columns=columns).fit(df_train)
+
+        with pytest.warns(UserWarning, match="unseen categories"):
+            df_transformed = x.transform(df_test)
+
+        encoder = OneHotEncoder(
+            sparse_output=False,
+            handle_unknown="ignore",
+            dtype=np.int8,
+        ).fit(df_train[columns])
+
+        expected = pd.DataFrame(
+            encoder.transform(df_test[columns]),
+            columns=encoder.get_feature_names_out(columns),
+            index=df_test.index,
+        )
+
+        ta.equality.assert_frame_equal_msg(
+            actual=df_transformed,
+            expected=pd.concat([df_test, expected], axis=1),
+            msg_tag="output differs from sklearn OneHotEncoder",
+        )
+
+    @pytest.mark.parametrize("separator", ["_", "|"])
+    def test_polars_output_matches_pandas(self, separator):
+        """Test polars inputs give the same dummies as pandas inputs, with dtype set by dtype."""
+        df_train = self.create_df()
+        df_test = self.create_df(seed=1)
+        df_test.loc[df_test.index[0], "b"] = "y"
+
+        kwargs = {
+            "columns": ["a", "b", "c"],
+            "separator": separator,
+            "drop_original": True,
+            "dtype": np.float32,
+        }
+
+        x = OneHotEncodingTransformer(**kwargs).fit(df_train)
+        x_polars = OneHotEncodingTransformer(**kwargs).fit(pl.from_pandas(df_train))
+
+        with pytest.warns(UserWarning, match=re.escape("unseen categories: {'y'}")):
+            df_transformed = x.transform(df_test)
+
+        with pytest.warns(UserWarning, match=re.escape("unseen categories: {'y'}")):
+            df_transformed_polars = x_polars.transform(pl.from_pandas(df_test))
+
+        pl.testing.assert_frame_equal(
+            df_transformed_polars,
+            pl.from_pandas(df_transformed.reset_index(drop=True)),
+        )
+
+    @pytest.mark.parametrize("library", ["pandas", "polars"])
+    def test_nulls_error(self, library):
+        """Test that an exception is raised for nulls in transform, including in categorical
+        columns."""
+        df = self.create_df()
+
+        x = OneHotEncodingTransformer(columns=["a", "c"]).fit(df)
+
+        df.loc[df.index[2], "c"] = None
+        if library == "polars":
+            df = pl.from_pandas(df)
+
+        with pytest.raises(
+            ValueError,
+            match="OneHotEncodingTransformer: column c has nulls - replace before proceeding",
+        ):
+            x.transform(df)
+
+    @pytest.mark.parametrize("library", ["pandas", "polars"])
+    def test_pruned_and_unseen_levels_encoded_as_other(self, library):
+        """Test levels pruned in fit and levels not seen in fit are encoded in the other column,
+        without warning about unseen levels."""
+        df_train = pd.DataFrame({"b": list("aaabbc"), "c": list("xxxyyy")})
+        df_test = pd.DataFrame({"b": list("abcd"), "c": list("xyzx")})
+
+        if library == "polars":
+            df_train, df_test = pl.from_pandas(df_train), pl.from_pandas(df_test)
+
+        x = OneHotEncodingTransformer(
+            columns=["b", "c"],
+            top_k=2,
+            drop_original=True,
+        ).fit(df_train)
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            df_transformed = x.transform(df_test)
+
+        expected = pd.DataFrame(
+            {
+                "b_a": [1, 0, 0, 0],
+                "b_b": [0, 1, 0, 0],
+                "b_other": [0, 0, 1, 1],
+                "c_x": [1, 0, 0, 1],
+                "c_y": [0, 1, 0, 0],
+                "c_other": [0, 0, 1, 0],
+            },
+            dtype=np.int8,
+        )
+
+        if library == "polars":
+            pl.testing.assert_frame_equal(df_transformed, pl.from_pandas(expected))
+        else:
+            ta.equality.assert_frame_equal_msg(
+                actual=df_transformed,
+                expected=expected,
+                msg_tag="pruned and unseen levels not encoded as other",
+            )
+
+        np.testing.assert_array_equal(
+            x.transform_sparse(df_test).toarray(),
+            expected.to_numpy(),
+            err_msg="pruned and unseen levels not encoded as other in transform_sparse",
+        )
+
+    def test_sparse_output_polars_error(self):
+        """Test that an exception is raised if sparse_output is used with a polars DataFrame."""
+        df = pl.from_pandas(self.create_df())
+
+        x = OneHotEncodingTransformer(columns=["b"], sparse_output=True).fit(df)
+
+        with pytest.raises(
+            ValueError,
+            match="OneHotEncodingTransformer: sparse_output is only supported for pandas DataFrames, use transform_sparse for other inputs",
+        ):
+            x.transform(df)
+
+
+class TestTransformSparse:
+    """Tests for OneHotEncodingTransformer.transform_sparse()."""
+
+    def test_matrix_matches_dummy_columns(self):
+        """Test the matrix holds the dummy columns created by transform, in the same order."""
+        df_train = d.create_df_7()
+        df_test = d.create_df_8()
+
+        x = OneHotEncodingTransformer(columns=["a", "b", "c"], verbose=False)
+        x.fit(df_train)
+
+        with pytest.warns(UserWarning, match="unseen categories"):
+            matrix = x.transform_sparse(df_test)
+
+        with pytest.warns(UserWarning, match="unseen categories"):
+            df_transformed = x.transform(df_test)
+
+        dummy_columns = [c for c in df_transformed.columns if c not in df_test.columns]
+
+        assert sparse.isspmatrix_csr(matrix), "output is not a CSR matrix"
+        assert matrix.dtype == np.int8, "matrix does not have type dtype"
+
+        np.testing.assert_array_equal(
+            matrix.toarray(),
+            df_transformed[dummy_columns].to_numpy(),
+            err_msg="sparse matrix differs from dummy columns",
+        )
+
+    def test_polars_matches_pandas(self):
+        """Test polars inputs give the same matrix as pandas inputs."""
+        df = d.create_df_7()
+
+        x = OneHotEncodingTransformer(columns=["a", "b", "c"]).fit(df)
+
+        matrix = x.transform_sparse(df)
+        matrix_polars = x.transform_sparse(pl.from_pandas(df))
+
+        np.testing.assert_array_equal(
+            matrix_polars.toarray(),
+            matrix.toarray(),
+            err_msg="polars sparse matrix differs from pandas",
+        )
+
+    def test_nulls_error(self):
+        """Test that transform_sparse raises an error if a column to transform has nulls."""
+        x = OneHotEncodingTransformer(columns=["b"])
+        x.fit(d.create_df_1())
+
+        with pytest.raises(
+            ValueError,
+            match="OneHotEncodingTransformer: column b has nulls - replace before proceeding",
+        ):
+            x.transform_sparse(d.create_df_2())
@@ -1,4 +1,6 @@
+import numpy as np
 import pandas as pd
+import polars as pl
 import pytest
 import test_aide as ta
 
@@ -93,6 +95,74 @@ class TestFit(GenericFitTests, WeightColumnFitMixinTests):
             msg="mappings attribute",
         )
 
+    @pytest.mark.parametrize("weights_column", [None, "e"])
+    def test_learnt_values_polars(self, weights_column):
+        """Test that the mappings learnt from a polars DataFrame are those learnt from pandas."""
+        df = create_OrdinalEncoderTransformer_test_df()
+
+        x = OrdinalEncoderTransformer(
+            columns=["b", "c", "d", "f"],
+            weights_column=weights_column,
+        )
+        x.fit(df, df["a"])
+
+        df_polars = pl.from_pandas(df)
+
+        x_polars = OrdinalEncoderTransformer(
+            columns=["b", "c", "d", "f"],
+            weights_column=weights_column,
+        )
+        x_polars.fit(df_polars, df_polars["a"])
+
+        assert x_polars.mappings == x.mappings, "polars mappings differ from pandas"
+
+    @pytest.mark.parametrize("library", ["pandas", "polars"])
+    def test_tied_means_ranked_by_level(self, library):
+        """Test levels with the same mean response are ranked in sorted order of the levels, and
+        that null levels are not mapped."""
+        df = pd.DataFrame(
+            {
+                "b": ["z", "y", "x", "w", "w", None],
+                "y": [2.0, 1.0, 2.0, 0.0, 2.0, 5.0],
+            },
+        )
+        if library == "polars":
+            df = pl.from_pandas(df)
+
+        x = OrdinalEncoderTransformer(columns="b")
+        x.fit(df, df["y"])
+
+        assert x.mappings == {
+            "b": {"w": 1, "y": 2, "x": 3, "z": 4},
+        }, "tied levels not ranked in sorted order"
+
+    @pytest.mark.parametrize("weights_column", [None, "w"])
+    def test_learnt_values_match_sorted_means(self, weights_column):
+        """Test the ranks learnt for many levels are the positions of the levels when sorted by
+        their (weighted) mean response."""
+        rng = np.random.default_rng(0)
+
+        df = pd.DataFrame(
+            {
+                "b": rng.integers(0, 500, 5000),
+                "w": rng.random(5000),
+                "y": rng.integers(0, 3, 5000).astype(float),
+            },
+        )
+
+        x = OrdinalEncoderTransformer(columns="b", weights_column=weights_column)
+        x.fit(df, df["y"])
+
+        weights = 1 if weights_column is None else df["w"]
+        grouped = (
+            df.assign(y=df["y"] * weights, w=weights).groupby("b")[["y", "w"]].sum()
+        )
+        means = (grouped["y"] / grouped["w"]).sort_values(kind="mergesort")
+
+        assert x.mappings["b"] == dict(
+            zip(means.index, range(1, len(means) + 1)),
+        ), "ranks not the order of the sorted mean responses"
+
     def test_response_column_nulls_error(self):
         """Test that an exception is raised if nulls are present in response_column."""
         df = d.create_df_4()
@@ -176,6 +246,67 @@ class TestTransform(GenericTransformTests):
             msg_tag="Unexpected values in OrdinalEncoderTransformer.transform",
         )
 
+    def test_expected_output_polars(self):
+        """Test that the output for a polars DataFrame, including a categorical column, is
+        expected."""
+        df = pl.from_pandas(create_OrdinalEncoderTransformer_test_df())
+
+        x = OrdinalEncoderTransformer(columns=["b", "c", "f"])
+
+        x.mappings = {
+            "b": {"a": 1, "b": 2, "c": 3, "d": 4, "e": 5, "f": 6},
+            "c": {"a": 6, "b": 5, "c": 4, "d": 3, "e": 2, "f": 1},
+            "f": {False: 1, True: 2},
+        }
+
+        df_transformed = x.transform(df)
+
+        expected = df.with_columns(
+            pl.Series("b", [1, 2, 3, 4, 5, 6]),
+            pl.Series("c", [6, 5, 4, 3, 2, 1]),
+            pl.Series("f", [1, 1, 1, 2, 2, 2]),
+        )
+
+        pl.testing.assert_frame_equal(df_transformed, expected)
+
+    def test_categorical_column_encoded(self):
+        """Test a pandas categorical column is encoded as integers, looking up only its categories."""
+        df = create_OrdinalEncoderTransformer_test_df()
+        df["c"] = df["c"].cat.add_categories(["unobserved"])
+
+        x = OrdinalEncoderTransformer(columns="c")
+
+        x.mappings = {"c": {"a": 6, "b": 5, "c": 4, "d": 3, "e": 2, "f": 1}}
+
+        df_transformed = x.transform(df)
+
+        assert df_transformed["c"].tolist() == [
+            6,
+            5,
+            4,
+            3,
+            2,
+            1,
+        ], "categorical column not encoded"
+
+    @pytest.mark.parametrize("library", ["pandas", "polars"])
+    @pytest.mark.parametrize("value", ["unseen", None])
+    def test_unmapped_levels_error(self, library, value):
+        """Test an exception is raised if a column has nulls or levels not in the mapping."""
+        df = pd.DataFrame({"b": ["a", value]})
+        if library == "polars":
+            df = pl.from_pandas(df)
+
+        x = OrdinalEncoderTransformer(columns="b")
+
+        x.mappings = {"b": {"a": 1}}
+
+        with pytest.raises(
+            ValueError,
+            match="OrdinalEncoderTransformer: nulls would be introduced into column b from levels not present in mapping",
+        ):
+            x.transform(df)
+
 
 class TestOtherBaseBehaviour(OtherBaseBehaviourTests):
     """
@@ -4,13 +4,18 @@ from __future__ import annotations
 
 import datetime
 import warnings
+from typing import TYPE_CHECKING
 
+import narwhals as nw
 import numpy as np
 import pandas as pd
 
 from tubular.base import BaseTransformer
 from tubular.mixins import DropOriginalMixin, NewColumnNameMixin, TwoColumnMixin
 
+if TYPE_CHECKING:
+    from narwhals.typing import FrameT
+
 
 class BaseGenericDateTransformer(
     NewColumnNameMixin,
@@ -81,9 +86,21 @@ class BaseGenericDateTransformer(
         if not datetime_only:
             allowed_types = [*allowed_types, date_type]
 
+        # polars (and other narwhals backends) carry date/datetime in the schema,
+        # pandas stores dates as objects so these have to be inferred
+        schema = (
+            None if isinstance(X, pd.DataFrame) else nw.from_native(X).collect_schema()
+        )
+
         for col in self.columns:
-            is_datetime = pd.api.types.is_datetime64_any_dtype(X[col])
-            is_date = pd.api.types.infer_dtype(X[col]) == date_type
+            if schema is None:
+                is_datetime = pd.api.types.is_datetime64_any_dtype(X[col])
+                is_date = pd.api.types.infer_dtype(X[col]) == date_type
+
+            else:
+                is_datetime = schema[col] == nw.Datetime
+                is_date = schema[col] == nw.Date
+
             if is_datetime:
                 type_dict[col] = datetime_type
 
@@ -743,6 +760,244 @@ class SeriesDtMethodTransformer(BaseDatetimeTransformer):
         return X
 
 
+class SeriesDtMethodBatchTransformer(BaseDatetimeTransformer):
+    """Tranformer that applies several pandas.Series.dt methods to a single column in one pass.
+
+    This is equivalent to stacking a SeriesDtMethodTransformer per method on the same column,
+    but the column is copied and validated once, the .dt accessor is built once and all of the
+    outputs are added to X as a single block.
+
+    For polars inputs the methods are translated to narwhals expressions and evaluated in a single
+    with_columns call. Only the attribute style methods in NARWHALS_DT_METHODS (called without
+    kwargs) can be used with polars inputs.
+
+    Parameters
+    ----------
+    methods : list of tuples
+        List of (pd_method_name, new_column_name) or (pd_method_name, new_column_name, pd_method_kwargs)
+        tuples. pd_method_name is the name of the pandas.Series.dt method to call, new_column_name the
+        name of the column its output is assigned to and pd_method_kwargs an optional dict of keyword
+        arguments to call the method with.
+
+    columns : str or list
+        Column to apply the transformer to. If a list is passed it must be of len 1.
+
+    drop_original: bool
+        Indicates whether to drop self.column post transform
+
+    **kwargs
+        Arbitrary keyword arguments passed onto BaseTransformer.__init__().
+
+    Attributes
+    ----------
+    methods : list of tuples
+        List of (pd_method_name, new_column_name[, pd_method_kwargs]) tuples, as passed at init.
+
+    column : str
+        Name of column to apply transformer to. This attribute is not for use in any method,
+        use 'columns instead. Here only as a fix to allow string representation of transformer.
+
+    drop_original: bool
+        Indicates whether to drop self.column post transform
+
+    polars_compatible : bool
+        class attribute, indicates whether transformer has been converted to polars/pandas agnostic narwhals framework
+
+    """
+
+    polars_compatible = True
+
+    # pandas .dt attribute names and their narwhals .dt expression equivalents
+    NARWHALS_DT_METHODS = {
+        "year": "year",
+        "month": "month",
+        "day": "day",
+        "hour": "hour",
+        "minute": "minute",
+        "second": "second",
+        "microsecond": "microsecond",
+        "nanosecond": "nanosecond",
+        "dayofyear": "ordinal_day",
+        "day_of_year": "ordinal_day",
+        "date": "date",
+    }
+
+    def __init__(
+        self,
+        methods: list[tuple[str, str] | tuple[str, str, dict[str, object] | None]],
+        columns: str | list[str],
+        drop_original: bool = False,
+        **kwargs: dict[str, bool],
+    ) -> None:
+        super().__init__(
+            columns=columns,
+            drop_original=drop_original,
+            new_column_name="dummy",
+            **kwargs,
+        )
+
+        if len(self.columns) > 1:
+            msg = rf"{self.classname()}: column should be a str or list of len 1, got {self.columns}"
+            raise ValueError(
+                msg,
+            )
+
+        if type(methods) is not list or len(methods) == 0:
+            msg = f"{self.classname()}: methods should be a non-empty list of tuples"
+            raise TypeError(msg)
+
+        ser = pd.Series(
+            [datetime.datetime(2020, 12, 21, tzinfo=datetime.timezone.utc)],
+        )
+
+        self._methods = []
+
+        for i, method in enumerate(methods):
+            if type(method) not in [tuple, list] or len(method) not in [2, 3]:
+                msg = f"{self.classname()}: methods should contain (pd_method_name, new_column_name) or (pd_method_name, new_column_name, pd_method_kwargs) tuples, got {method} in position {i}"
+                raise TypeError(msg)
+
+            pd_method_name, new_column_name = method[0], method[1]
+            pd_method_kwargs = method[2] if len(method) == 3 else None
+
+            if type(pd_method_name) is not str:
+                msg = f"{self.classname()}: unexpected type ({type(pd_method_name)}) for pd_method_name in position {i}, expecting str"
+                raise TypeError(msg)
+
+            if type(new_column_name) is not str:
+                msg = f"{self.classname()}: unexpected type ({type(new_column_name)}) for new_column_name in position {i}, expecting str"
+                raise TypeError(msg)
+
+            if pd_method_kwargs is None:
+                pd_method_kwargs = {}
+            else:
+                if type(pd_method_kwargs) is not dict:
+                    msg = f"{self.classname()}: pd_method_kwargs should be a dict but got type {type(pd_method_kwargs)} in position {i}"
+                    raise TypeError(msg)
+
+                for j, k in enumerate(pd_method_kwargs.keys()):
+                    if type(k) is not str:
+                        msg = f"{self.classname()}: unexpected type ({type(k)}) for pd_method_kwargs key in position {j} of method {i}, must be str"
+                        raise TypeError(msg)
+
+            try:
+                getattr(ser.dt, pd_method_name)
+
+            except Exception as err:
+                msg = f'{self.classname()}: error accessing "dt.{pd_method_name}" method on pd.Series object - pd_method_name should be a pd.Series.dt method'
+                raise AttributeError(msg) from err
+
+            self._methods.append(
+                (
+                    pd_method_name,
+                    new_column_name,
+                    pd_method_kwargs,
+                    callable(getattr(ser.dt, pd_method_name)),
+                ),
+            )
+
+        new_column_names = [method[1] for method in self._methods]
+
+        if len(set(new_column_names)) != len(new_column_names):
+            msg = f"{self.classname()}: new column names in methods should be unique, got {new_column_names}"
+            raise ValueError(msg)
+
+        self.methods = methods
+
+        # This attribute is not for use in any method, use 'columns' instead.
+        # Here only as a fix to allow string representation of transformer.
+        self.column = self.columns[0]
+
+    def _transform_pandas(self, X: pd.DataFrame) -> pd.DataFrame:
+        """Apply all methods to a pandas DataFrame, sharing one .dt accessor."""
+
+        dt = X[self.columns[0]].dt
+
+        outputs = {}
+        for pd_method_name, new_column_name, pd_method_kwargs, is_callable in self._methods:
+            output = getattr(dt, pd_method_name)
+
+            outputs[new_column_name] = (
+                output(**pd_method_kwargs) if is_callable else output
+            )
+
+        columns_order = list(X.columns) + [
+            c for c in outputs if c not in X.columns
+        ]
+
+        X = pd.concat(
+            [
+                X.drop(columns=[c for c in outputs if c in X.columns]),
+                pd.DataFrame(outputs, index=X.index),
+            ],
+            axis=1,
+        )
+
+        # only reorder if existing columns were overwritten, to keep their position
+        if list(X.columns) != columns_order:
+            X = X[columns_order]
+
+        return X
+
+    def _transform_narwhals(self, X: FrameT) -> FrameT:
+        """Apply all methods to a narwhals frame, as one set of expressions."""
+
+        unsupported = [
+            method[0]
+            for method in self._methods
+            if method[0] not in self.NARWHALS_DT_METHODS or method[2]
+        ]
+
+        if unsupported:
+            msg = f"{self.classname()}: methods {unsupported} are only supported for pandas inputs, non-pandas inputs support {list(self.NARWHALS_DT_METHODS)} without pd_method_kwargs"
+            raise ValueError(msg)
+
+        column = nw.col(self.columns[0])
+
+        return X.with_columns(
+            [
+                getattr(column.dt, self.NARWHALS_DT_METHODS[pd_method_name])().alias(
+                    new_column_name,
+                )
+                for pd_method_name, new_column_name, _, _ in self._methods
+            ],
+        )
+
+    def transform(self, X: FrameT) -> FrameT:
+        """Transform specific column on input X using each of the given pandas.Series.dt methods and
+        assign the outputs to new columns in X.
+
+        Parameters
+        ----------
+        X : pd/pl.DataFrame
+            Data to transform.
+
+        Returns
+        -------
+        X : pd/pl.DataFrame
+            Input X with additional columns (new_column_name in each element of self.methods) added.
+            These contain the output of running each pd.Series.dt method.
+
+        """
+        X = super().transform(X)
+
+        if isinstance(X, pd.DataFrame):
+            X = nw.from_native(self._transform_pandas(X))
+
+        else:
+            X = self._transform_narwhals(nw.from_native(X))
+
+        # Drop original columns if self.drop_original is True
+        X = DropOriginalMixin.drop_original_column(
+            self,
+            X,
+            self.drop_original,
+            self.columns,
+        )
+
+        return X.to_native()
+
+
 class BetweenDatesTransformer(BaseGenericDateTransformer):
     """Transformer to generate a boolean column indicating if one date is between two others.
 
@@ -2,19 +2,25 @@
 
 from __future__ import annotations
 
+import time
 import warnings
 from typing import TYPE_CHECKING
 
 import narwhals as nw
+import narwhals.selectors as ncs
 import numpy as np
 import pandas as pd
+import polars as pl
+from sklearn.base import clone
+from sklearn.linear_model import BayesianRidge
+from sklearn.utils.parallel import Parallel, delayed
 
 from tubular.base import BaseTransformer
 from tubular.mixins import WeightColumnMixin
 
 if TYPE_CHECKING:
-    import pandas as pd
     from narwhals.typing import FrameT
+    from sklearn.base import RegressorMixin
 
 
 class BaseImputer(BaseTransformer):
@@ -23,9 +29,16 @@ class BaseImputer(BaseTransformer):
 
     Other imputers in this module should inherit from this class.
 
+    Imputers that support a group_by argument also learn a group_impute_values_ table during fit,
+    in which case transform fills nulls with the value for the row's group, falling back to
+    impute_values_ for groups that were not seen in fit.
+
     Attributes
     ----------
 
+    group_by : None or list
+        Columns to calculate impute values within groups of, None if impute values are not grouped.
+
     polars_compatible : bool
         class attribute, indicates whether transformer has been converted to polars/pandas agnostic narwhals framework
 
@@ -35,6 +48,81 @@ class BaseImputer(BaseTransformer):
 
     FITS = False
 
+    group_by = None
+
+    def check_and_set_group_by(self, group_by: str | list[str] | None) -> None:
+        """Helper method that validates and sets the group_by attribute.
+
+        Parameters
+        ----------
+        group_by : None or str or list
+            Column(s) to calculate impute values within groups of. If a str is passed this is
+            put into a list.
+
+        """
+        if isinstance(group_by, str):
+            group_by = [group_by]
+
+        if group_by is not None:
+            if (
+                not isinstance(group_by, list)
+                or len(group_by) == 0
+                or not all(isinstance(g, str) for g in group_by)
+            ):
+                msg = f"{self.classname()}: group_by should be a str, a non-empty list of str or None"
+                raise TypeError(msg)
+
+            imputed_group_by = [g for g in group_by if g in self.columns]
+
+            if imputed_group_by:
+                msg = f"{self.classname()}: group_by columns cannot also be imputed, got {imputed_group_by}"
+                raise ValueError(msg)
+
+        self.group_by = group_by
+
+    @nw.narwhalify
+    def _check_group_by_columns(self, X: FrameT) -> None:
+        """Check all group_by columns are present in X."""
+        for g in self.group_by:
+            if g not in X.columns:
+                msg = f"{self.classname()}: group_by column {g} is not in X"
+                raise ValueError(msg)
+
+    def _non_null_groups(self) -> nw.Expr:
+        """Expression which is True for rows where none of the group_by columns are null.
+
+        Null groups are not given their own impute values, these rows fall back to impute_values_.
+        """
+        return nw.all_horizontal(*[~nw.col(g).is_null() for g in self.group_by])
+
+    def _combine_group_impute_values(
+        self,
+        X: FrameT,
+        group_impute_values: dict[str, FrameT],
+    ) -> FrameT:
+        """Combine impute values calculated by group for each column into a single table, with one row
+        per (non-null) group in X. Groups without a value for a column are left null.
+
+        Parameters
+        ----------
+        X : FrameT
+            Data the impute values were calculated from.
+
+        group_impute_values : dict
+            Frames of group_by columns and the impute value for each group, keyed by column name.
+
+        """
+        combined = X.select(self.group_by).filter(self._non_null_groups()).unique()
+
+        for c, values in group_impute_values.items():
+            combined = combined.join(
+                values.select(*self.group_by, c),
+                on=self.group_by,
+                how="left",
+            )
+
+        return combined.sort(self.group_by)
+
     @nw.narwhalify
     def transform(self, X: FrameT) -> FrameT:
         """Impute missing values with median values calculated from fit method.
@@ -54,9 +142,50 @@ class BaseImputer(BaseTransformer):
 
         X = nw.from_native(super().transform(X))
 
-        new_col_expressions = [
-            nw.col(c).fill_null(self.impute_values_[c]) for c in self.columns
-        ]
+        if self.group_by is None:
+            new_col_expressions = [
+                nw.col(c).fill_null(self.impute_values_[c]) for c in self.columns
+            ]
+
+        else:
+            self.check_is_fitted(["group_impute_values_"])
+            self._check_group_by_columns(X)
+
+            group_impute_values = nw.from_native(self.group_impute_values_)
+
+            # allow fitting and transforming with different dataframe libraries
+            native_namespace = nw.get_native_namespace(X)
+            if nw.get_native_namespace(group_impute_values) is not native_namespace:
+                # pl.from_pandas converts NaN to null, so groups without a value stay null
+                # and fall back to the overall impute value in either library
+                group_impute_values = (
+                    nw.from_native(
+                        pl.from_pandas(group_impute_values.to_native()),
+                        eager_only=True,
+                    )
+                    if native_namespace is pl
+                    else nw.from_dict(
+                        group_impute_values.to_dict(as_series=False),
+                        native_namespace=native_namespace,
+                    )
+                )
+
+            # a single left join looks up the group values for every row, in the order of X.
+            # Unseen or null groups get nulls and so fall back to the overall impute value
+            group_values = X.select(self.group_by).join(
+                group_impute_values,
+                on=self.group_by,
+                how="left",
+            )
+
+            new_col_expressions = [
+                nw.when(nw.col(c).is_null())
+                .then(group_values[c])
+                .otherwise(nw.col(c))
+                .fill_null(self.impute_values_[c])
+                .alias(c)
+                for c in self.columns
+            ]
 
         return X.with_columns(
             new_col_expressions,
@@ -85,7 +214,7 @@ class ArbitraryImputer(BaseImputer):
         class attribute, indicates whether transformer has been converted to polars/pandas agnostic narwhals framework
     """
 
-    polars_compatible = False
+    polars_compatible = True
 
     FITS = False
 
@@ -111,45 +240,104 @@ class ArbitraryImputer(BaseImputer):
         for c in self.columns:
             self.impute_values_[c] = self.impute_value
 
-    def transform(self, X: pd.DataFrame) -> pd.DataFrame:
+    @nw.narwhalify
+    def transform(self, X: FrameT) -> FrameT:
         """Impute missing values with the supplied impute_value.
         If columns is None all columns in X will be imputed.
 
         Parameters
         ----------
-        X : pd.DataFrame
+        X : pd/pl.DataFrame
             Data containing columns to impute.
 
         Returns
         -------
-        X : pd.DataFrame
+        X : pd/pl.DataFrame
             Transformed input X with nulls imputed with the specified impute_value, for the specified columns.
 
         Additions
         ---------
         * Preserving the datatypes of columns
-        * Finding the target column dtype and cast imputer values as same dtype
+        * Casting the impute value once to each target column dtype, so a single typed
+          fill_null keeps column dtypes without casting columns back afterwards
         """
         self.check_is_fitted(["impute_value"])
-        self.columns_check(X)
-        for c in self.columns:
-            if (
-                "category" in X[c].dtype.name
-                and self.impute_value not in X[c].cat.categories
-            ):
-                X[c] = X[c].cat.add_categories(
-                    self.impute_value,
-                )  # add new category
 
-        # Calling the BaseImputer's transform method to impute the values
-        X_transformed = super().transform(X)
+        X = nw.from_native(BaseTransformer.transform(self, X))
+
+        schema = X.collect_schema()
+
+        # pandas categoricals only accept values that are already a category, polars
+        # categoricals have no fixed set of categories so need no extension
+        native_X = X.to_native()
+        columns = self.columns
+        if isinstance(native_X, pd.DataFrame):
+            new_categories = {
+                c: native_X[c].cat.add_categories(self.impute_value)
+                for c in self.columns
+                if schema[c] == nw.Categorical
+                and self.impute_value not in native_X[c].cat.categories
+            }
+
+            # pandas object columns hold any values, so are filled with the impute value
+            # as it is rather than cast to a string as for String columns. Unlike fillna,
+            # where keeps the object dtype
+            filled_object_columns = {
+                c: native_X[c].where(native_X[c].notna(), self.impute_values_[c])
+                for c in self.columns
+                if native_X[c].dtype == object
+            }
+
+            if new_categories or filled_object_columns:
+                X = nw.from_native(
+                    native_X.assign(**new_categories, **filled_object_columns),
+                )
 
-        # casting imputer value as same dtype as original column
-        for c in self.columns:
-            dtype = X[c].dtype  # get the dtype of original column
-            X_transformed[c] = X_transformed[c].astype(dtype)
+            columns = [c for c in self.columns if c not in filled_object_columns]
 
-        return X_transformed
+        # cast each impute value once per dtype it is filled into, rather than
+        # casting whole columns back to their original dtype after filling
+        native_namespace = nw.get_native_namespace(X)
+        typed_impute_values = {}
+
+        for c in columns:
+            key = (self.impute_values_[c], schema[c])
+
+            # dtypes narwhals does not know (e.g. pandas float16) or object dtypes cannot
+            # be cast to, but are filled without changing the dtype
+            if schema[c] in (nw.Unknown, nw.Object):
+                typed_impute_values[key] = self.impute_values_[c]
+
+            elif key not in typed_impute_values:
+                typed_impute_value = (
+                    nw.new_series(
+                        c,
+                        [self.impute_values_[c]],
+                        native_namespace=native_namespace,
+                    )
+                    .cast(schema[c])
+                    .item()
+                )
+
+                # casting can silently change a number, e.g. truncating 2.7 to 2 for an
+                # integer column, so the cast value must equal the impute value
+                if (
+                    schema[c].is_numeric()
+                    and typed_impute_value != self.impute_values_[c]
+                ):
+                    msg = f"{self.classname()}: impute value {self.impute_values_[c]} cannot be filled into column {c} ({schema[c]}) without changing its value"
+                    raise TypeError(msg)
+
+                typed_impute_values[key] = typed_impute_value
+
+        return X.with_columns(
+            [
+                nw.col(c).fill_null(
+                    typed_impute_values[(self.impute_values_[c], schema[c])],
+                )
+                for c in columns
+            ],
+        )
 
 
 class MedianImputer(BaseImputer, WeightColumnMixin):
@@ -164,6 +352,10 @@ class MedianImputer(BaseImputer, WeightColumnMixin):
     weights_column: None or str, default=None
         Column containing weights
 
+    group_by : None or str or list, default = None
+        Column(s) to calculate median values within groups of. Nulls are then imputed with the
+        median for the row's group, or the overall median if the group was not seen in fit (or is null).
+
     **kwargs
         Arbitrary keyword arguments passed onto BaseTransformer.init method.
 
@@ -173,12 +365,16 @@ class MedianImputer(BaseImputer, WeightColumnMixin):
         Created during fit method. Dictionary of float / int (median) values of columns
         in the columns attribute. Keys of impute_values_ give the column names.
 
+    group_impute_values_ : pd/pl.DataFrame
+        Created during fit method if group_by is not None. Table of the median values of columns in
+        the columns attribute (one column each) for each combination of the group_by columns.
+
     polars_compatible : bool
         class attribute, indicates whether transformer has been converted to polars/pandas agnostic narwhals framework
 
     """
 
-    polars_compatible = False
+    polars_compatible = True
 
     FITS = True
 
@@ -186,57 +382,117 @@ class MedianImputer(BaseImputer, WeightColumnMixin):
         self,
         columns: str | list[str],
         weights_column: str | None = None,
+        group_by: str | list[str] | None = None,
         **kwargs: dict[str, bool],
     ) -> None:
         super().__init__(columns=columns, **kwargs)
 
         WeightColumnMixin.check_and_set_weight(self, weights_column)
+        self.check_and_set_group_by(group_by)
 
-    def fit(self, X: pd.DataFrame, y: pd.Series | None = None) -> pd.DataFrame:
+    @nw.narwhalify
+    def fit(self, X: FrameT, y: nw.Series | None = None) -> MedianImputer:
         """Calculate median values to impute with from X.
 
         Parameters
         ----------
-        X : pd.DataFrame
+        X : pd/pl.DataFrame
             Data to "learn" the median values from.
 
-        y : None or pd.DataFrame or pd.Series, default = None
+        y : None or pd/pl.Series, default = None
             Not required.
 
         """
         super().fit(X, y)
 
+        if self.group_by is not None:
+            self._check_group_by_columns(X)
+
         self.impute_values_ = {}
 
         if self.weights_column is not None:
             WeightColumnMixin.check_weights_column(self, X, self.weights_column)
 
             for c in self.columns:
-                # filter out null rows so their weight doesn't influence calc
-                filtered = X[X[c].notna()]
+                # only the value and weight columns are needed, filter out null rows so
+                # their weight doesn't influence calc, then sort by column to be imputed
+                # (order of weight column shouldn't matter for median)
+                filtered = (
+                    X.select(c, self.weights_column)
+                    .filter(~nw.col(c).is_null())
+                    .sort(c)
+                )
 
                 # below algorithm only works for >1 non null values
                 if len(filtered) <= 0:
                     median = np.nan
 
                 else:
-                    # first sort df by column to be imputed (order of weight column shouldn't matter for median)
-                    filtered = filtered.sort_values(c)
-
-                    # next calculate cumulative weight sums
-                    cumsum = filtered[self.weights_column].cumsum()
-
-                    # find midpoint
-                    cutoff = filtered[self.weights_column].sum() / 2.0
-
-                    # find first value >= this point
-                    median = filtered[c][cumsum >= cutoff].iloc[0]
+                    # find first value where cumulative weight sum is >= midpoint
+                    median = filtered.filter(
+                        nw.col(self.weights_column).cum_sum()
+                        >= nw.col(self.weights_column).sum() / 2.0,
+                    ).item(row=0, column=c)
 
                 self.impute_values_[c] = median
 
         else:
+            # median is the linearly interpolated 0.5 quantile, all columns are
+            # calculated in a single select
+            medians = X.select(
+                nw.col(*self.columns).quantile(0.5, interpolation="linear"),
+            )
+
             for c in self.columns:
-                self.impute_values_[c] = X[c].median()
+                self.impute_values_[c] = medians.item(row=0, column=c)
+
+        if self.group_by is not None:
+            X_groups = X.filter(self._non_null_groups())
+
+            if self.weights_column is not None:
+                weights = nw.col(self.weights_column)
+
+                group_medians = {}
+
+                for c in self.columns:
+                    # as above, but with the cumulative weight sum restarting in each group.
+                    # After sorting by group, the weight before the group is the minimum
+                    # of the weight sum before each row in the group
+                    group_medians[c] = (
+                        X_groups.select(*self.group_by, c, self.weights_column)
+                        .filter(~nw.col(c).is_null())
+                        .sort([*self.group_by, c])
+                        .with_columns(weights.cum_sum().alias("_cumulative_weight"))
+                        .with_columns(
+                            (nw.col("_cumulative_weight") - weights).alias(
+                                "_preceding_weight",
+                            ),
+                        )
+                        .filter(
+                            nw.col("_cumulative_weight")
+                            - nw.col("_preceding_weight").min().over(*self.group_by)
+                            >= weights.sum().over(*self.group_by) / 2.0,
+                        )
+                        .group_by(self.group_by)
+                        .agg(nw.col(c).min())
+                    )
+
+                group_impute_values = self._combine_group_impute_values(
+                    X,
+                    group_medians,
+                )
+
+            else:
+                # all columns are calculated in a single group_by
+                group_impute_values = (
+                    X_groups.group_by(self.group_by)
+                    .agg(
+                        nw.col(*self.columns).quantile(0.5, interpolation="linear"),
+                    )
+                    .sort(self.group_by)
+                )
+
+            self.group_impute_values_ = group_impute_values.to_native()
 
         return self
 
@@ -253,6 +509,10 @@ class MeanImputer(WeightColumnMixin, BaseImputer):
     weights_column : None or str, default = None
         Column containing weights.
 
+    group_by : None or str or list, default = None
+        Column(s) to calculate mean values within groups of. Nulls are then imputed with the
+        mean for the row's group, or the overall mean if the group was not seen in fit (or is null).
+
     **kwargs
         Arbitrary keyword arguments passed onto BaseTransformer.init method.
 
@@ -262,12 +522,16 @@ class MeanImputer(WeightColumnMixin, BaseImputer):
         Created during fit method. Dictionary of float / int (mean) values of columns
         in the columns attribute. Keys of impute_values_ give the column names.
 
+    group_impute_values_ : pd/pl.DataFrame
+        Created during fit method if group_by is not None. Table of the mean values of columns in
+        the columns attribute (one column each) for each combination of the group_by columns.
+
     polars_compatible : bool
         class attribute, indicates whether transformer has been converted to polars/pandas agnostic narwhals framework
 
     """
 
-    polars_compatible = False
+    polars_compatible = True
 
     FITS = True
 
@@ -275,49 +539,110 @@ class MeanImputer(WeightColumnMixin, BaseImputer):
         self,
         columns: str | list[str] | None = None,
         weights_column: str | None = None,
+        group_by: str | list[str] | None = None,
         **kwargs: dict[str, bool],
     ) -> None:
         super().__init__(columns=columns, **kwargs)
 
         WeightColumnMixin.check_and_set_weight(self, weights_column)
+        self.check_and_set_group_by(group_by)
 
-    def fit(self, X: pd.DataFrame, y: pd.Series | None = None) -> pd.DataFrame:
+    @nw.narwhalify
+    def fit(self, X: FrameT, y: nw.Series | None = None) -> MeanImputer:
         """Calculate mean values to impute with from X.
 
         Parameters
         ----------
-        X : pd.DataFrame
+        X : pd/pl.DataFrame
             Data to "learn" the mean values from.
 
-        y : None or pd.DataFrame or pd.Series, default = None
+        y : None or pd/pl.Series, default = None
             Not required.
 
         """
         super().fit(X, y)
 
+        if self.group_by is not None:
+            self._check_group_by_columns(X)
+
         self.impute_values_ = {}
 
         if self.weights_column is not None:
             WeightColumnMixin.check_weights_column(self, X, self.weights_column)
 
-            for c in self.columns:
-                # filter out null rows so they don't count towards total weight
-                filtered = X[X[c].notna()]
+            weights = nw.col(self.weights_column)
+
+            # weighted mean is total of weighted col over total weight, where null rows
+            # are excluded from the total weight. Nulls are skipped when summing
+            # the weighted col so no filtering of X is needed
+            mean_expressions = [
+                (
+                    (nw.col(c) * weights).sum()
+                    / weights.filter(~nw.col(c).is_null()).sum()
+                ).alias(c)
+                for c in self.columns
+            ]
+
+        else:
+            mean_expressions = [nw.col(*self.columns).mean()]
+
+        # calculate means for all columns in a single select
+        means = X.select(mean_expressions)
 
-                # calculate total weight and total of weighted col
-                total_weight = filtered[self.weights_column].sum()
-                total_weighted_col = (
-                    filtered[c].mul(filtered[self.weights_column]).sum()
+        for c in self.columns:
+            self.impute_values_[c] = means.item(row=0, column=c)
+
+        if self.group_by is not None:
+            X_groups = X.filter(self._non_null_groups())
+
+            if self.weights_column is not None:
+                # group_by aggregations need to be simple, so calculate the weighted col and
+                # weight of non null rows first then sum these within each group
+                group_totals = (
+                    X_groups.with_columns(
+                        *[
+                            (nw.col(c) * weights).alias(f"{c}_weighted_total")
+                            for c in self.columns
+                        ],
+                        *[
+                            nw.when(~nw.col(c).is_null())
+                            .then(weights)
+                            .otherwise(0)
+                            .alias(f"{c}_total_weight")
+                            for c in self.columns
+                        ],
+                    )
+                    .group_by(self.group_by)
+                    .agg(
+                        nw.col(
+                            *[f"{c}_weighted_total" for c in self.columns],
+                            *[f"{c}_total_weight" for c in self.columns],
+                        ).sum(),
+                    )
                 )
 
-                # find weighted mean and add to dict
-                weighted_mean = total_weighted_col / total_weight
+                # groups with no non null values are left null
+                group_impute_values = group_totals.select(
+                    *self.group_by,
+                    *[
+                        nw.when(nw.col(f"{c}_total_weight") > 0)
+                        .then(
+                            nw.col(f"{c}_weighted_total") / nw.col(f"{c}_total_weight"),
+                        )
+                        .alias(c)
+                        for c in self.columns
+                    ],
+                )
 
-                self.impute_values_[c] = weighted_mean
+            else:
+                # all columns are calculated in a single group_by
+                group_impute_values = X_groups.group_by(self.group_by).agg(
+                    nw.col(*self.columns).mean(),
+                )
 
-        else:
-            for c in self.columns:
-                self.impute_values_[c] = X[c].mean()
+            self.group_impute_values_ = group_impute_values.sort(
+                self.group_by,
+            ).to_native()
 
         return self
 
@@ -337,6 +662,10 @@ class ModeImputer(BaseImputer, WeightColumnMixin):
         Name of weights columns to use if mode should be in terms of sum of weights
         not count of rows.
 
+    group_by : None or str or list, default = None
+        Column(s) to calculate mode values within groups of. Nulls are then imputed with the
+        mode for the row's group, or the overall mode if the group was not seen in fit (or is null).
+
     **kwargs
         Arbitrary keyword arguments passed onto BaseTransformer.init method.
 
@@ -346,12 +675,16 @@ class ModeImputer(BaseImputer, WeightColumnMixin):
         Created during fit method. Dictionary of float / int (mode) values of columns
         in the columns attribute. Keys of impute_values_ give the column names.
 
+    group_impute_values_ : pd/pl.DataFrame
+        Created during fit method if group_by is not None. Table of the mode values of columns in
+        the columns attribute (one column each) for each combination of the group_by columns.
+
     polars_compatible : bool
         class attribute, indicates whether transformer has been converted to polars/pandas agnostic narwhals framework
 
     """
 
-    polars_compatible = False
+    polars_compatible = True
 
     FITS = True
 
@@ -359,59 +692,96 @@ class ModeImputer(BaseImputer, WeightColumnMixin):
         self,
         columns: str | list[str] | None = None,
         weights_column: str | None = None,
+        group_by: str | list[str] | None = None,
         **kwargs: dict[str, bool],
     ) -> None:
         super().__init__(columns=columns, **kwargs)
 
         WeightColumnMixin.check_and_set_weight(self, weights_column)
+        self.check_and_set_group_by(group_by)
 
-    def fit(self, X: pd.DataFrame, y: pd.Series | None = None) -> pd.DataFrame:
+    @nw.narwhalify
+    def fit(self, X: FrameT, y: nw.Series | None = None) -> ModeImputer:
         """Calculate mode values to impute with from X.
 
         Parameters
         ----------
-        X : pd.DataFrame
+        X : pd/pl.DataFrame
             Data to "learn" the mode values from.
 
-        y : None or pd.DataFrame or pd.Series, default = None
+        y : None or pd/pl.Series, default = None
             Not required.
 
         """
         super().fit(X, y)
 
+        if self.group_by is not None:
+            self._check_group_by_columns(X)
+
         self.impute_values_ = {}
 
         if self.weights_column is None:
-            for c in self.columns:
-                mode_value = X[c].mode(dropna=True)
+            level_weights = [nw.len().alias("_level_weight")]
+            selected_columns = []
 
-                if len(mode_value) == 0:
-                    self.impute_values_[c] = np.nan
+        else:
+            WeightColumnMixin.check_weights_column(self, X, self.weights_column)
 
-                    warnings.warn(
-                        f"ModeImputer: The Mode of column {c} is NaN.",
-                        stacklevel=2,
-                    )
+            level_weights = [nw.col(self.weights_column).sum().alias("_level_weight")]
+            selected_columns = [self.weights_column]
 
-                else:
-                    self.impute_values_[c] = mode_value[0]
+        for c in self.columns:
+            # total count / weight of each non null level of the column
+            grouped = (
+                X.select(c, *selected_columns)
+                .filter(~nw.col(c).is_null())
+                .group_by(c)
+                .agg(level_weights)
+            )
 
-        else:
-            WeightColumnMixin.check_weights_column(self, X, self.weights_column)
+            if len(grouped) == 0:
+                warnings.warn(
+                    f"ModeImputer: The Mode of column {c} is NaN.",
+                    stacklevel=2,
+                )
 
-            for c in self.columns:
-                grouped = X.groupby(c)[self.weights_column].sum()
+                self.impute_values_[c] = np.nan
 
-                if grouped.isna().all():
-                    warnings.warn(
-                        f"ModeImputer: The Mode of column {c} is NaN.",
-                        stacklevel=2,
+            else:
+                # take the first level (in sorted order) if there is more than one mode
+                self.impute_values_[c] = (
+                    grouped.filter(
+                        nw.col("_level_weight") == nw.col("_level_weight").max(),
                     )
+                    .sort(c)
+                    .item(row=0, column=c)
+                )
 
-                    self.impute_values_[c] = np.nan
+        if self.group_by is not None:
+            X_groups = X.filter(self._non_null_groups())
 
-                else:
-                    self.impute_values_[c] = grouped.idxmax()
+            group_modes = {}
+
+            for c in self.columns:
+                # as above, but finding the level(s) with the largest count / weight in
+                # each group and keeping the first in sorted order
+                group_modes[c] = (
+                    X_groups.select(*self.group_by, c, *selected_columns)
+                    .filter(~nw.col(c).is_null())
+                    .group_by(*self.group_by, c)
+                    .agg(level_weights)
+                    .filter(
+                        nw.col("_level_weight")
+                        == nw.col("_level_weight").max().over(*self.group_by),
+                    )
+                    .sort([*self.group_by, c])
+                    .unique(subset=self.group_by, keep="first", maintain_order=True)
+                )
+
+            self.group_impute_values_ = self._combine_group_impute_values(
+                X,
+                group_modes,
+            ).to_native()
 
         return self
 
@@ -469,38 +839,314 @@ class NearestMeanResponseImputer(BaseImputer):
             msg = f"{self.classname()}: y has {n_nulls} null values"
             raise ValueError(msg)
 
+        # count nulls in all columns in a single select
+        null_counts = X.select(nw.col(*self.columns).is_null().sum())
+
+        for c in self.columns:
+            if null_counts.item(row=0, column=c) == 0:
+                msg = f"{self.classname()}: Column {c} has no missing values, cannot use this transformer."
+                raise ValueError(msg)
+
         self.impute_values_ = {}
 
         X_y = nw.from_native(self._combine_X_y(X, y))
         response_column = "_temporary_response"
 
+        response = nw.col(response_column)
+
         for c in self.columns:
-            c_nulls = X.select(nw.col(c).is_null())[c]
+            # one group_by gives the mean response for each level and for the null
+            # level, then the level with the closest mean response is taken with a
+            # sort, ties going to the first level in sorted order
+            closest_level = (
+                X_y.lazy()
+                .select(c, response_column)
+                .group_by(c, drop_null_keys=False)
+                .agg(response.mean())
+                .with_columns(
+                    (response - response.filter(nw.col(c).is_null()).mean())
+                    .abs()
+                    .alias("_abs_diff_response"),
+                )
+                .filter(~nw.col(c).is_null())
+                .sort(["_abs_diff_response", c])
+                .head(1)
+                .collect()
+            )
 
-            if c_nulls.sum() == 0:
-                msg = f"{self.classname()}: Column {c} has no missing values, cannot use this transformer."
-                raise ValueError(msg)
+            self.impute_values_[c] = closest_level.item(row=0, column=c)
 
-            mean_response_by_levels = (
-                X_y.filter(~c_nulls).group_by(c).agg(nw.col(response_column).mean())
-            )
+        return self
+
+
+class IterativeImputer(BaseImputer):
+    """Class to impute missing values with predictions from regression models of each column on the other
+    columns, in the style of MICE (multiple imputation by chained equations).
+
+    Nulls are first filled with the mean of each column. Then in each iteration a copy of the estimator is
+    fit for every column, on the rows where that column is not null, and used to predict the values for the
+    rows where it is null. This repeats until the largest change in the predictions is within tol times the
+    largest absolute non null value, or max_iter iterations have run.
+
+    All models in an iteration are fit on the imputed values from the previous iteration, so they can be
+    fit in parallel processes with n_jobs and the results do not depend on n_jobs.
 
-            mean_response_nulls = X_y.filter(c_nulls)[response_column].mean()
+    Parameters
+    ----------
+    columns : str or list
+        Numeric columns to impute, each is also used as a predictor for the others. At least 2 columns are
+        required.
+
+    estimator : None or sklearn regressor, default = None
+        Regressor to fit for each column, cloned before fitting. If None then
+        sklearn.linear_model.BayesianRidge() is used.
+
+    max_iter : int, default = 10
+        Maximum number of imputation iterations to run in fit. Transform runs n_iter_ iterations.
+
+    tol : float, default = 1e-3
+        Tolerance for early stopping, relative to the largest absolute non null value in the columns.
+
+    n_jobs : None or int, default = None
+        Number of processes to fit the column models of each iteration in, passed to joblib. None means 1.
+
+    **kwargs
+        Arbitrary keyword arguments passed onto BaseTransformer.init method.
+
+    Attributes
+    ----------
+    impute_values_ : dict
+        Created during fit method. Mean of each column in the columns attribute, used to fill nulls before
+        the first iteration.
+
+    estimators_ : dict
+        Created during fit method. Fitted regressor for each column from the last iteration.
+
+    n_iter_ : int
+        Created during fit method. Number of iterations run.
+
+    iteration_times_ : list
+        Created during fit method. Time in seconds that each iteration took.
+
+    polars_compatible : bool
+        class attribute, indicates whether transformer has been converted to polars/pandas agnostic narwhals framework
+
+    """
+
+    polars_compatible = True
+
+    FITS = True
+
+    def __init__(
+        self,
+        columns: str | list[str],
+        estimator: RegressorMixin | None = None,
+        max_iter: int = 10,
+        tol: float = 1e-3,
+        n_jobs: int | None = None,
+        **kwargs: dict[str, bool],
+    ) -> None:
+        super().__init__(columns=columns, **kwargs)
+
+        if len(self.columns) < 2:
+            msg = f"{self.classname()}: at least 2 columns are required, so there are other columns to predict from"
+            raise ValueError(msg)
+
+        if estimator is not None and not (
+            hasattr(estimator, "fit") and hasattr(estimator, "predict")
+        ):
+            msg = f"{self.classname()}: estimator should be None or have fit and predict methods"
+            raise TypeError(msg)
+
+        if not isinstance(max_iter, int) or isinstance(max_iter, bool) or max_iter < 1:
+            msg = f"{self.classname()}: max_iter should be a positive int"
+            raise ValueError(msg)
+
+        if not isinstance(tol, (int, float)) or isinstance(tol, bool) or tol < 0:
+            msg = f"{self.classname()}: tol should be a non-negative float"
+            raise ValueError(msg)
+
+        if n_jobs is not None and not isinstance(n_jobs, int):
+            msg = f"{self.classname()}: n_jobs should be None or an int"
+            raise TypeError(msg)
+
+        self.estimator = estimator
+        self.max_iter = max_iter
+        self.tol = tol
+        self.n_jobs = n_jobs
+
+    def _get_data(self, X: FrameT) -> tuple[np.ndarray, np.ndarray]:
+        """Extract columns as a float array with nulls as nan, and a mask of the non null values."""
+        non_numeric_columns = [
+            c for c in self.columns if c not in X.select(ncs.numeric()).columns
+        ]
+
+        if non_numeric_columns:
+            msg = f"{self.classname()}: The following columns are not numeric in X; {non_numeric_columns}"
+            raise TypeError(msg)
+
+        data = X.select(nw.col(*self.columns).cast(nw.Float64)).to_numpy()
+
+        return data, ~np.isnan(data)
+
+    @nw.narwhalify
+    def fit(self, X: FrameT, y: nw.Series | None = None) -> IterativeImputer:
+        """Fit regression models to impute each column from the others.
+
+        Parameters
+        ----------
+        X : pd/pl.DataFrame
+            Data to fit the transformer on.
+
+        y : None
+            Not required.
+
+        """
+        super().fit(X, y)
+
+        data, observed = self._get_data(X)
+
+        all_null_columns = [
+            c for i, c in enumerate(self.columns) if not observed[:, i].any()
+        ]
+
+        if all_null_columns:
+            msg = f"{self.classname()}: columns {all_null_columns} have no non null values"
+            raise ValueError(msg)
+
+        means = np.nanmean(data, axis=0)
+
+        self.impute_values_ = {c: means[i] for i, c in enumerate(self.columns)}
+
+        data = np.where(observed, data, means)
+
+        threshold = self.tol * np.abs(data[observed]).max()
+
+        estimator = BayesianRidge() if self.estimator is None else self.estimator
 
-            mean_response_by_levels = mean_response_by_levels.with_columns(
-                (nw.col(response_column) - mean_response_nulls)
-                .abs()
-                .alias("abs_diff_response"),
+        parallel = Parallel(n_jobs=self.n_jobs)
+
+        self.iteration_times_ = []
+
+        for iteration in range(self.max_iter):
+            start = time.perf_counter()
+
+            results = parallel(
+                delayed(_fit_column_estimator)(clone(estimator), data, observed, i)
+                for i in range(len(self.columns))
             )
 
-            # take first value having the minimum difference in terms of average response
-            self.impute_values_[c] = mean_response_by_levels.filter(
-                mean_response_by_levels["abs_diff_response"]
-                == mean_response_by_levels["abs_diff_response"].min(),
-            )[c].item(index=0)
+            new_data = data.copy()
+
+            for i, (_, predictions) in enumerate(results):
+                new_data[~observed[:, i], i] = predictions
+
+            change = np.abs(new_data - data).max()
+
+            data = new_data
+
+            self.estimators_ = {
+                c: column_estimator
+                for c, (column_estimator, _) in zip(self.columns, results)
+            }
+
+            self.iteration_times_.append(time.perf_counter() - start)
+
+            if self.verbose:
+                print(
+                    f"{self.classname()}: iteration {iteration + 1} took {self.iteration_times_[-1]:.3f}s, max change {change}",
+                )
+
+            if change <= threshold:
+                break
+
+        self.n_iter_ = len(self.iteration_times_)
 
         return self
 
+    @nw.narwhalify
+    def transform(self, X: FrameT) -> FrameT:
+        """Impute missing values with predictions from the fitted models.
+
+        Nulls are filled with the column means then n_iter_ iterations of predictions from the fitted
+        models are run, only for rows containing nulls. Imputed columns are returned as Float64.
+
+        Parameters
+        ----------
+        X : pd/pl.DataFrame
+            Data to impute.
+
+        Returns
+        -------
+        X : pd/pl.DataFrame
+            Transformed input X with nulls imputed for the specified columns.
+
+        """
+        self.check_is_fitted(["estimators_"])
+
+        X = nw.from_native(BaseTransformer.transform(self, X))
+
+        data, observed = self._get_data(X)
+
+        # only rows with nulls need predicting
+        rows_with_nulls = ~observed.all(axis=1)
+        subset = np.where(
+            observed[rows_with_nulls],
+            data[rows_with_nulls],
+            [self.impute_values_[c] for c in self.columns],
+        )
+        subset_observed = observed[rows_with_nulls]
+
+        if subset.shape[0] > 0:
+            for _ in range(self.n_iter_):
+                new_subset = subset.copy()
+
+                for i, c in enumerate(self.columns):
+                    missing = ~subset_observed[:, i]
+
+                    if missing.any():
+                        new_subset[missing, i] = self.estimators_[c].predict(
+                            np.delete(subset[missing], i, axis=1),
+                        )
+
+                subset = new_subset
+
+        data[rows_with_nulls] = subset
+
+        native_namespace = nw.get_native_namespace(X)
+
+        return X.with_columns(
+            *[
+                nw.new_series(
+                    c,
+                    data[:, i],
+                    nw.Float64,
+                    native_namespace=native_namespace,
+                )
+                for i, c in enumerate(self.columns)
+            ],
+        )
+
+
+def _fit_column_estimator(
+    estimator: RegressorMixin,
+    data: np.ndarray,
+    observed: np.ndarray,
+    column_index: int,
+) -> tuple[RegressorMixin, np.ndarray]:
+    """Fit estimator to predict a column of data from the other columns, on rows where the column was observed,
+    and predict the column for the rows where it was not. Module level so it can be run in other processes.
+    """
+    predictors = np.delete(data, column_index, axis=1)
+    column_observed = observed[:, column_index]
+
+    estimator.fit(predictors[column_observed], data[column_observed, column_index])
+
+    if column_observed.all():
+        return estimator, np.empty(0)
+
+    return estimator, estimator.predict(predictors[~column_observed])
+
 
 class NullIndicator(BaseTransformer):
     """Class to create a binary indicator column for null values.
@@ -511,6 +1157,11 @@ class NullIndicator(BaseTransformer):
         Columns to produce indicator columns for, if the default of None is supplied all columns in X are used
         when the transform method is called.
 
+    packed_column_name : None or str, default = None
+        If supplied, rather than one boolean column per column, a single UInt64 column with this name is
+        added, where bit i is set if columns[i] is null. At most 64 columns can be packed. Use the
+        unpack_null_indicators method to recover the boolean columns.
+
     Attributes
     ----------
 
@@ -521,13 +1172,27 @@ class NullIndicator(BaseTransformer):
 
     polars_compatible = True
 
+    MAX_PACKED_COLUMNS = 64
+
     def __init__(
         self,
         columns: str | list[str] | None = None,
+        packed_column_name: str | None = None,
         **kwargs: dict[str, bool],
     ) -> None:
         super().__init__(columns=columns, **kwargs)
 
+        if packed_column_name is not None:
+            if not isinstance(packed_column_name, str):
+                msg = f"{self.classname()}: packed_column_name should be a str or None"
+                raise TypeError(msg)
+
+            if len(self.columns) > self.MAX_PACKED_COLUMNS:
+                msg = f"{self.classname()}: at most {self.MAX_PACKED_COLUMNS} columns can be packed into packed_column_name, got {len(self.columns)}"
+                raise ValueError(msg)
+
+        self.packed_column_name = packed_column_name
+
     @nw.narwhalify
     def transform(self, X: FrameT) -> FrameT:
         """Create new columns indicating the position of null values for each variable in self.columns.
@@ -540,9 +1205,49 @@ class NullIndicator(BaseTransformer):
         """
         X = nw.from_native(super().transform(X))
 
-        for c in self.columns:
-            X = X.with_columns(
-                (nw.col(c).is_null()).cast(nw.Boolean).alias(f"{c}_nulls"),
+        if self.packed_column_name is not None:
+            # distinct bits, so summing is the same as a bitwise or
+            return X.with_columns(
+                nw.sum_horizontal(
+                    *[
+                        nw.col(c).is_null().cast(nw.UInt64) * nw.lit(1 << i, nw.UInt64)
+                        for i, c in enumerate(self.columns)
+                    ],
+                ).alias(self.packed_column_name),
             )
 
-        return X
+        # add all indicators in a single with_columns
+        return X.with_columns(
+            *[
+                nw.col(c).is_null().cast(nw.Boolean).alias(f"{c}_nulls")
+                for c in self.columns
+            ],
+        )
+
+    @nw.narwhalify
+    def unpack_null_indicators(self, X: FrameT) -> FrameT:
+        """Replace the packed indicator column created in transform with one boolean column per variable
+        in self.columns, giving the same output as transform with packed_column_name=None.
+
+        Parameters
+        ----------
+        X : FrameT
+            Output of transform, containing packed_column_name.
+
+        """
+        if self.packed_column_name is None:
+            msg = f"{self.classname()}: unpack_null_indicators can only be used when packed_column_name is set"
+            raise ValueError(msg)
+
+        if self.packed_column_name not in X.columns:
+            msg = f"{self.classname()}: packed column {self.packed_column_name} is not in X"
+            raise ValueError(msg)
+
+        packed = nw.col(self.packed_column_name)
+
+        return X.with_columns(
+            *[
+                ((packed // nw.lit(1 << i, nw.UInt64)) % 2 == 1).alias(f"{c}_nulls")
+                for i, c in enumerate(self.columns)
+            ],
+        ).drop(self.packed_column_name)
@@ -2,17 +2,310 @@
 
 from __future__ import annotations
 
+import operator
 import warnings
 from collections import OrderedDict
+from functools import reduce
+from typing import TYPE_CHECKING
 
+import joblib
+import narwhals as nw
 import numpy as np
 import pandas as pd
-from pandas.api.types import is_categorical_dtype
+import polars as pl
 
 from tubular.base import BaseTransformer
+from tubular.mixins import NewColumnNameMixin
 
+if TYPE_CHECKING:
+    from pathlib import Path
 
-class BaseMappingTransformer(BaseTransformer):
+    from narwhals.typing import FrameT
+
+
+def _compile_mapping(mapping: dict) -> tuple[pd.Index, pd.Series]:
+    """Compile a mapping dict into a hashed index of its keys and a typed series of its values,
+    so that values can be looked up for a whole column at once.
+    """
+    return pd.Index(list(mapping.keys()), tupleize_cols=False), pd.Series(
+        list(mapping.values()),
+    )
+
+
+def _to_arrays(values: list) -> dict[str, np.ndarray | bool | None]:
+    """Convert a list of mapping keys or values into arrays which can be memory-mapped.
+
+    Numeric values are held in a numeric array. Strings are held Arrow style, as one array of
+    their utf-8 bytes and an array of offsets to the end of each string. Other or mixed types
+    are held in an object array of the original values. Whether the values were python rather
+    than numpy scalars is recorded, so they can be converted back to the same types.
+    """
+    arrays = {
+        "data": None,
+        "offsets": None,
+        "python": not (values and isinstance(values[0], np.generic)),
+    }
+
+    inferred_type = pd.api.types.infer_dtype(values, skipna=False)
+
+    if inferred_type in ("integer", "floating", "boolean"):
+        arrays["data"] = np.asarray(values)
+
+        # python ints are converted back from the array, so can be held in the smallest dtype
+        if arrays["python"] and arrays["data"].dtype.kind == "i":
+            arrays["data"] = arrays["data"].astype(
+                np.promote_types(
+                    np.min_scalar_type(arrays["data"].min()),
+                    np.min_scalar_type(arrays["data"].max()),
+                ),
+            )
+
+        if arrays["data"].dtype.kind in "biuf":
+            return arrays
+
+    if inferred_type == "string":
+        encoded = [value.encode() for value in values]
+
+        arrays["data"] = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+        arrays["offsets"] = np.cumsum([len(value) for value in encoded], dtype=np.int64)
+
+        return arrays
+
+    arrays["data"] = np.empty(len(values), dtype=object)
+    arrays["data"][:] = values
+
+    return arrays
+
+
+def _from_arrays(
+    arrays: dict[str, np.ndarray | bool | None],
+) -> list | np.ndarray:
+    """Convert arrays from _to_arrays back into the original values, as a list for strings and
+    python scalars or otherwise as the array itself.
+    """
+    if arrays["offsets"] is not None:
+        buffer = arrays["data"].tobytes()
+        starts = [0, *arrays["offsets"][:-1].tolist()]
+
+        return [
+            buffer[start:end].decode()
+            for start, end in zip(starts, arrays["offsets"].tolist())
+        ]
+
+    if arrays["python"]:
+        return arrays["data"].tolist()
+
+    return arrays["data"]
+
+
+def _mapping_to_arrays(mapping: dict) -> dict[str, dict]:
+    """Convert a mapping dict into parallel key and value arrays."""
+    return {
+        "keys": _to_arrays(list(mapping.keys())),
+        "values": _to_arrays(list(mapping.values())),
+    }
+
+
+def _arrays_to_mapping(arrays: dict[str, dict]) -> dict:
+    """Rebuild a mapping dict from the parallel key and value arrays of _mapping_to_arrays."""
+    return dict(zip(_from_arrays(arrays["keys"]), _from_arrays(arrays["values"])))
+
+
+class CompactMappingsMixin:
+    """Mixin to hold a mappings attribute as parallel key and value arrays when serialised rather
+    than as nested dicts.
+
+    In memory mappings is a normal dict of dicts. When pickled each column's mapping is stored
+    as a key array and a value array, with numeric arrays for numbers and utf-8 buffer and offset
+    arrays for strings.
+    These pickle and load far faster than dicts with many levels and can be memory-mapped with
+    joblib.load(path, mmap_mode="r"), see the save and load methods. After loading, transform
+    looks values up directly from the arrays and the mappings dict is only rebuilt, once, if the
+    mappings attribute is accessed.
+
+    The hashed index of the keys and series of the values of each column's mapping are built once,
+    when mappings is set, or on first use for columns added to mappings afterwards or loaded as
+    arrays, rather than on every transform.
+
+    """
+
+    @property
+    def mappings(self) -> dict[str, dict]:
+        """Dict of mappings for each column, rebuilt from the mapping arrays on first access after
+        loading a serialised transformer.
+        """
+        if self.__dict__.get("_mappings") is None:
+            mapping_arrays = self.__dict__.get("_mapping_arrays")
+
+            if mapping_arrays is None:
+                msg = f"'{type(self).__name__}' object has no attribute 'mappings'"
+                raise AttributeError(msg)
+
+            self._mappings = self._mappings_type(
+                (c, _arrays_to_mapping(arrays)) for c, arrays in mapping_arrays.items()
+            )
+
+            # the dict can now be changed, so is used in place of the arrays
+            self._mapping_arrays = None
+            self._mapping_indexes = {}
+
+        return self._mappings
+
+    @mappings.setter
+    def mappings(self, mappings: dict[str, dict]) -> None:
+        self._mappings = mappings
+        self._mapping_arrays = None
+        self._mapping_indexes = {
+            c: _compile_mapping(mapping) for c, mapping in mappings.items()
+        }
+
+    def __getstate__(self) -> dict:
+        state = super().__getstate__().copy()
+
+        mappings = state.pop("_mappings", None)
+        state.pop("_mapping_indexes", None)
+
+        if mappings is not None:
+            state["_mappings_type"] = type(mappings)
+            state["_mapping_arrays"] = {
+                c: _mapping_to_arrays(mapping) for c, mapping in mappings.items()
+            }
+
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        state = state.copy()
+
+        # transformers pickled before mappings were stored as arrays
+        if "mappings" in state:
+            state["_mappings"] = state.pop("mappings")
+
+        state.setdefault("_mappings", None)
+        state.setdefault("_mapping_arrays", None)
+        state["_mapping_indexes"] = {}
+
+        super().__setstate__(state)
+
+    def check_is_fitted(self, attribute: list[str]) -> None:
+        """Check attributes are set, without rebuilding the mappings dict from the mapping arrays."""
+        if self.__dict__.get("_mapping_arrays") is not None:
+            attribute = [a for a in attribute if a != "mappings"]
+
+        super().check_is_fitted(attribute)
+
+    def _compiled_mapping(self, c: str) -> tuple[pd.Index, pd.Series]:
+        """Hashed index of the keys and series of the values of the mapping for column c, built
+        from the mapping arrays if the transformer was loaded from a serialised file.
+
+        These are built once per column and kept until mappings is set again.
+        """
+        if c not in self._mapping_indexes:
+            mapping_arrays = self.__dict__.get("_mapping_arrays")
+
+            self._mapping_indexes[c] = (
+                _compile_mapping(self.mappings[c])
+                if mapping_arrays is None
+                else (
+                    pd.Index(
+                        _from_arrays(mapping_arrays[c]["keys"]),
+                        tupleize_cols=False,
+                    ),
+                    pd.Series(_from_arrays(mapping_arrays[c]["values"])),
+                )
+            )
+
+        return self._mapping_indexes[c]
+
+    @staticmethod
+    def _null_key_position(keys: pd.Index) -> int:
+        """Position of the first null key, None or NaN, which maps all null values, else -1.
+
+        Index lookups treat None and NaN as different keys, so null values are resolved with this
+        rather than by the lookup.
+        """
+        null_positions = np.flatnonzero(keys.isna())
+
+        return int(null_positions[0]) if len(null_positions) else -1
+
+    def _category_positions(self, c: str, values: pd.Series) -> np.ndarray:
+        """Positions of the categories of categorical values in the keys of the mapping for column
+        c, -1 where not mapped. The position of a null key is added last, so taking by the codes of
+        each row, which are -1 for nulls, gives the position for every row.
+        """
+        keys, _ = self._compiled_mapping(c)
+
+        return np.append(
+            keys.get_indexer(values.cat.categories),
+            self._null_key_position(keys),
+        )
+
+    def _mapping_positions(self, c: str, values: pd.Series) -> np.ndarray:
+        """Positions of values in the keys of the mapping for column c, -1 where not mapped.
+
+        For categorical values only the categories are looked up, then taken by the code of each
+        row, rather than hashing every row. Null values of either kind take the position of any
+        null key.
+        """
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            return self._category_positions(c, values).take(values.cat.codes.to_numpy())
+
+        keys, _ = self._compiled_mapping(c)
+
+        positions = keys.get_indexer(values)
+
+        null_position = self._null_key_position(keys)
+
+        if null_position != -1:
+            positions = np.where(values.isna().to_numpy(), null_position, positions)
+
+        return positions
+
+    def _mapped_columns(self) -> list[str]:
+        """Columns with a mapping, found without rebuilding the mappings dict."""
+        mapping_arrays = self.__dict__.get("_mapping_arrays")
+
+        return list(self.mappings if mapping_arrays is None else mapping_arrays)
+
+    def save(self, path: str | Path) -> None:
+        """Serialise the transformer to path with joblib, with mappings stored as arrays.
+
+        Parameters
+        ----------
+        path : str or Path
+            File to write to.
+
+        """
+        joblib.dump(self, path)
+
+    @classmethod
+    def load(cls, path: str | Path, mmap: bool = True) -> CompactMappingsMixin:
+        """Load a transformer saved with the save method.
+
+        Parameters
+        ----------
+        path : str or Path
+            File to load from.
+
+        mmap : bool, default = True
+            Should the mapping arrays be memory-mapped from path rather than read into memory.
+            Arrays of mixed types, which are stored as object arrays, are always read into memory.
+
+        Returns
+        -------
+        transformer
+            The loaded transformer.
+
+        """
+        transformer = joblib.load(path, mmap_mode="r" if mmap else None)
+
+        if not isinstance(transformer, cls):
+            msg = f"{cls.__name__}: {path} does not contain a {cls.__name__}, got {type(transformer)}"
+            raise TypeError(msg)
+
+        return transformer
+
+
+class BaseMappingTransformer(CompactMappingsMixin, BaseTransformer):
     """Base Transformer Extension for mapping transformers.
 
     Parameters
@@ -37,7 +330,7 @@ class BaseMappingTransformer(BaseTransformer):
 
     """
 
-    polars_compatible = False
+    polars_compatible = True
 
     def __init__(self, mappings: dict[str, dict], **kwargs: dict[str, bool]) -> None:
         if isinstance(mappings, dict):
@@ -60,18 +353,18 @@ class BaseMappingTransformer(BaseTransformer):
 
         super().__init__(columns=columns, **kwargs)
 
-    def transform(self, X: pd.DataFrame) -> pd.DataFrame:
+    def transform(self, X: FrameT) -> FrameT:
         """Base mapping transformer transform method.  Checks that the mappings
         dict has been fitted and calls the BaseTransformer transform method.
 
         Parameters
         ----------
-        X : pd.DataFrame
+        X : pd/pl.DataFrame
             Data to apply mappings to.
 
         Returns
         -------
-        X : pd.DataFrame
+        X : pd/pl.DataFrame
             Input X, copied if specified by user.
 
         """
@@ -80,8 +373,9 @@ class BaseMappingTransformer(BaseTransformer):
         return super().transform(X)
 
 
-class BaseMappingTransformMixin(BaseTransformer):
-    """Mixin class to apply standard pd.Series.map transform method.
+class BaseMappingTransformMixin(CompactMappingsMixin, BaseTransformer):
+    """Mixin class to apply a standard mapping transform method, replacing values which have a
+    mapping and leaving other values unchanged.
 
     Transformer uses the mappings attribute which should be a dict of dicts/mappings
     for each required column.
@@ -94,28 +388,171 @@ class BaseMappingTransformMixin(BaseTransformer):
 
     """
 
-    polars_compatible = False
+    polars_compatible = True
 
-    def transform(self, X: pd.DataFrame) -> pd.DataFrame:
+    def _map_categories(self, c: str, values: pd.Series) -> pd.Series:
+        """Apply the mapping for column c to the categories of categorical values, keeping the
+        codes of each row, so the work done depends on the number of levels not rows.
+
+        Categories mapped to the same value are merged and categories mapped to null are removed,
+        only then are the row codes remapped. If the mapping has a null key, null rows take its value.
+        """
+        keys, mapping_values = self._compiled_mapping(c)
+
+        categories = values.cat.categories
+        positions = keys.get_indexer(categories)
+        mapped = positions != -1
+
+        null_position = self._null_key_position(keys)
+        maps_nulls = null_position != -1 and values.isna().any()
+
+        if not mapped.any() and not maps_nulls:
+            return values
+
+        mapping_values = mapping_values.to_numpy(dtype=object)
+
+        new_categories = pd.Index(
+            [
+                *np.where(
+                    mapped,
+                    mapping_values.take(np.maximum(positions, 0)),
+                    categories.to_numpy(dtype=object),
+                ).tolist(),
+                # the value for null rows, which have code -1 so take the last entry
+                *([mapping_values[null_position]] if maps_nulls else []),
+            ],
+            tupleize_cols=False,
+        )
+
+        if not maps_nulls and new_categories.is_unique and not new_categories.hasnans:
+            return values.cat.rename_categories(new_categories)
+
+        new_codes, unique_categories = pd.factorize(new_categories)
+
+        # the new codes of each category and of null rows, -1 for nulls
+        codes = values.cat.codes.to_numpy()
+        category_codes = new_codes if maps_nulls else np.append(new_codes, -1)
+
+        return pd.Series(
+            pd.Categorical.from_codes(
+                category_codes.take(codes),
+                categories=unique_categories,
+                ordered=values.cat.ordered,
+            ),
+            index=values.index,
+            name=values.name,
+        )
+
+    def _map_pandas(self, X: pd.DataFrame) -> pd.DataFrame:
+        """Apply mappings to a pandas DataFrame with one hashed lookup and take per column."""
+        for c in self._mapped_columns():
+            if c not in X.columns:
+                continue
+
+            if isinstance(X[c].dtype, pd.CategoricalDtype):
+                X[c] = self._map_categories(c, X[c])
+                continue
+
+            _, values = self._compiled_mapping(c)
+
+            positions = self._mapping_positions(c, X[c])
+            mapped = positions != -1
+
+            if mapped.any():
+                X[c] = X[c].mask(
+                    mapped,
+                    values.to_numpy().take(np.where(mapped, positions, 0)),
+                )
+
+                # as for replace, object columns which are now all e.g. ints are downcast
+                if X[c].dtype == object:
+                    X[c] = X[c].infer_objects()
+
+        return X
+
+    def _map_narwhals(self, X: FrameT) -> FrameT:
+        """Apply mappings with narwhals replace_strict, with unmapped values in X mapping to themselves.
+
+        Columns can only hold one dtype, so mapped and unmapped values are cast to the mapping dtype if
+        all values are mapped, their common dtype if they match, Float64 if both are numeric or String
+        if both are string or categorical.
+        """
+        native_namespace = nw.get_native_namespace(X)
+        schema = X.collect_schema()
+
+        mapping_expressions = []
+
+        for c in self.mappings:
+            if c not in X.columns:
+                continue
+
+            mapping_values = nw.new_series(
+                c,
+                list(self.mappings[c].values()),
+                native_namespace=native_namespace,
+            )
+
+            uniques = X[c].drop_nulls().unique()
+            unmapped = uniques.filter(~uniques.is_in(list(self.mappings[c].keys())))
+
+            # a series of only nulls has no dtype, so takes that of the column
+            return_dtype = (
+                schema[c]
+                if mapping_values.null_count() == len(mapping_values)
+                else mapping_values.dtype
+            )
+
+            if len(unmapped) > 0 and schema[c] != return_dtype:
+                if schema[c].is_numeric() and return_dtype.is_numeric():
+                    return_dtype = nw.Float64
+                elif schema[c] in (nw.String, nw.Categorical) and return_dtype in (
+                    nw.String,
+                    nw.Categorical,
+                ):
+                    return_dtype = nw.String
+                else:
+                    msg = f"{self.classname()}: mapping values for {c} ({return_dtype}) cannot be combined with the unmapped values of {c} ({schema[c]}) in one column"
+                    raise TypeError(msg)
+
+            mapping_expressions.append(
+                nw.col(c).replace_strict(
+                    [*self.mappings[c].keys(), *unmapped.to_list()],
+                    [
+                        *mapping_values.cast(return_dtype).to_list(),
+                        *unmapped.cast(return_dtype).to_list(),
+                    ],
+                    return_dtype=return_dtype,
+                ),
+            )
+
+        return X.with_columns(mapping_expressions)
+
+    @nw.narwhalify
+    def transform(self, X: FrameT) -> FrameT:
         """Applies the mapping defined in the mappings dict to each column in the columns
         attribute.
 
         Parameters
         ----------
-        X : pd.DataFrame
+        X : pd/pl.DataFrame
             Data with nominal columns to transform.
 
         Returns
         -------
-        X : pd.DataFrame
+        X : pd/pl.DataFrame
             Transformed input X with levels mapped accoriding to mappings dict.
 
         """
         self.check_is_fitted(["mappings"])
 
-        X = super().transform(X)
+        X = nw.from_native(super().transform(X))
+
+        native_X = X.to_native()
 
-        return X.replace(self.mappings)
+        if isinstance(native_X, pd.DataFrame):
+            return self._map_pandas(native_X)
+
+        return self._map_narwhals(X)
 
 
 class MappingTransformer(BaseMappingTransformer, BaseMappingTransformMixin):
@@ -123,11 +560,11 @@ class MappingTransformer(BaseMappingTransformer, BaseMappingTransformMixin):
 
     Note, the MappingTransformer does not require 'self-mappings' to be defined i.e. if you want
     to map a value to itself, you can omit this value from the mappings rather than having to
-    map it to itself. This is because it uses the pandas replace method which only replaces values
-    which have a corresponding mapping.
+    map it to itself. This is because only values which have a corresponding mapping are
+    replaced.
 
     This transformer inherits from BaseMappingTransformMixin as well as the BaseMappingTransformer
-    in order to access the pd.Series.replace transform function.
+    in order to access the mapping transform function.
 
     Parameters
     ----------
@@ -137,6 +574,10 @@ class MappingTransformer(BaseMappingTransformer, BaseMappingTransformMixin):
         example the following dict {'a': {1: 2, 3: 4}, 'b': {'a': 1, 'b': 2}} would specify
         a mapping for column a of 1->2, 3->4 and a mapping for column b of 'a'->1, b->2.
 
+    check_mapping_values : bool, default = True
+        Whether to warn in transform if none, or not all, of the values in a column's mapping
+        are present in X. Set to False to skip finding the unique values of each column.
+
     **kwargs
         Arbitrary keyword arguments passed onto BaseMappingTransformer.init method.
 
@@ -146,18 +587,36 @@ class MappingTransformer(BaseMappingTransformer, BaseMappingTransformMixin):
         Dictionary of mappings for each column individually. The dict passed to mappings in
         init is set to the mappings attribute.
 
+    check_mapping_values : bool
+        Whether to warn about mapping values not present in X in transform.
+
     polars_compatible : bool
         class attribute, indicates whether transformer has been converted to polars/pandas agnostic narwhals framework
 
     """
 
-    polars_compatible = False
+    polars_compatible = True
 
+    def __init__(
+        self,
+        mappings: dict[str, dict],
+        check_mapping_values: bool = True,
+        **kwargs: dict[str, bool],
+    ) -> None:
+        super().__init__(mappings=mappings, **kwargs)
+
+        if not isinstance(check_mapping_values, bool):
+            msg = f"{self.classname()}: check_mapping_values should be a bool"
+            raise TypeError(msg)
+
+        self.check_mapping_values = check_mapping_values
+
+    @nw.narwhalify
     def transform(
         self,
-        X: pd.DataFrame,
+        X: FrameT,
         suppress_dtype_warning: bool = False,
-    ) -> pd.DataFrame:
+    ) -> FrameT:
         """Transform the input data X according to the mappings in the mappings attribute dict.
 
         This method calls the BaseMappingTransformMixin.transform. Note, this transform method is
@@ -165,17 +624,16 @@ class MappingTransformer(BaseMappingTransformer, BaseMappingTransformMixin):
         use the BaseMappingTransformMixin.transform method. Here, if a value does not exist in
         the mapping it is unchanged.
 
-        Due to the way pd.Series.map works, mappings can result in column dtypes changing,
-        sometimes unexpectedly. If the result of the mappings is a dtype that doesn't match
-        the original dtype, or the dtype of the values provided in the mapping a warning
-        will be raised. This normally results from an incomplete mapping being provided,
-        or a mix of dtypes causing pandas to default to the object dtype.
+        Mappings can result in column dtypes changing, sometimes unexpectedly. If the result of
+        the mappings is a dtype that doesn't match the original dtype, or the dtype of the values
+        provided in the mapping a warning will be raised. This normally results from an incomplete
+        mapping being provided, or a mix of dtypes causing pandas to default to the object dtype.
 
         For columns with a 'category' dtype the warning will not be raised.
 
         Parameters
         ----------
-        X : pd.DataFrame
+        X : pd/pl.DataFrame
             Data with nominal columns to transform.
 
         suppress_dtype_warning: Bool, default = False
@@ -183,52 +641,76 @@ class MappingTransformer(BaseMappingTransformer, BaseMappingTransformMixin):
 
         Returns
         -------
-        X : pd.DataFrame
+        X : pd/pl.DataFrame
             Transformed input X with levels mapped accoriding to mappings dict.
 
         """
 
-        X = BaseTransformer.transform(self, X)
+        X = nw.from_native(BaseTransformer.transform(self, X))
 
-        mapped_columns = self.mappings.keys()
-        original_dtypes = X[mapped_columns].dtypes
+        mapped_columns = self._mapped_columns()
+        original_schema = X.collect_schema()
 
-        for col in mapped_columns:
-            values_to_be_mapped = set(self.mappings[col].keys())
-            values_in_df = set(X[col].unique())
+        if self.check_mapping_values:
+            for col in mapped_columns:
+                values_to_be_mapped = set(self._compiled_mapping(col)[0])
+                values_in_df = set(X[col].unique().to_list())
 
-            if len(values_to_be_mapped.intersection(values_in_df)) == 0:
-                warnings.warn(
-                    f"{self.classname()}: No values from mapping for {col} exist in dataframe.",
-                    stacklevel=2,
-                )
+                if len(values_to_be_mapped.intersection(values_in_df)) == 0:
+                    warnings.warn(
+                        f"{self.classname()}: No values from mapping for {col} exist in dataframe.",
+                        stacklevel=2,
+                    )
 
-            if len(values_to_be_mapped.difference(values_in_df)) > 0:
-                warnings.warn(
-                    f"{self.classname()}: There are values in the mapping for {col} that are not present in the dataframe",
-                    stacklevel=2,
-                )
+                if len(values_to_be_mapped.difference(values_in_df)) > 0:
+                    warnings.warn(
+                        f"{self.classname()}: There are values in the mapping for {col} that are not present in the dataframe",
+                        stacklevel=2,
+                    )
+
+        native_X = X.to_native()
+        is_pandas = isinstance(native_X, pd.DataFrame)
 
-        X = BaseMappingTransformMixin.transform(self, X)
+        if is_pandas:
+            original_dtypes = native_X[mapped_columns].dtypes
 
-        mapped_dtypes = X[mapped_columns].dtypes
+        X = nw.from_native(BaseMappingTransformMixin.transform(self, X))
 
         if not suppress_dtype_warning:
+            mapped_schema = X.collect_schema()
+
             for col in mapped_columns:
-                col_mappings = pd.Series(self.mappings[col])
-                mapping_dtype = col_mappings.dtype
+                # pandas dtypes are compared as they are more specific than narwhals dtypes
+                if is_pandas:
+                    original_dtype = original_dtypes[col]
+                    mapped_dtype = X.to_native()[col].dtype
+                    mapping_dtype = self._compiled_mapping(col)[1].dtype
+                    both_categorical = isinstance(
+                        original_dtype,
+                        pd.CategoricalDtype,
+                    ) and isinstance(mapped_dtype, pd.CategoricalDtype)
+
+                else:
+                    original_dtype = original_schema[col]
+                    mapped_dtype = mapped_schema[col]
+                    mapping_dtype = nw.new_series(
+                        col,
+                        list(self.mappings[col].values()),
+                        native_namespace=nw.get_native_namespace(X),
+                    ).dtype
+                    both_categorical = (
+                        original_dtype == nw.Categorical
+                        and mapped_dtype == nw.Categorical
+                    )
 
                 if (
-                    (mapped_dtypes[col] != mapping_dtype)
-                    and (mapped_dtypes[col] != original_dtypes[col])
-                    and not (
-                        is_categorical_dtype(original_dtypes[col])
-                        and is_categorical_dtype(mapped_dtypes[col])
-                    )
+                    (mapped_dtype != mapping_dtype)
+                    and (mapped_dtype != original_dtype)
+                    and not both_categorical
                 ):
                     # Confirm the initial and end dtypes are not categories
                     warnings.warn(
-                        f"{self.classname()}: This mapping changes {col} dtype from {original_dtypes[col]} to {mapped_dtypes[col]}. This is often caused by having multiple dtypes in one column, or by not mapping all values.",
+                        f"{self.classname()}: This mapping changes {col} dtype from {original_dtype} to {mapped_dtype}. This is often caused by having multiple dtypes in one column, or by not mapping all values.",
                         stacklevel=2,
                     )
 
@@ -263,7 +745,7 @@ class BaseCrossColumnMappingTransformer(BaseMappingTransformer):
 
     """
 
-    polars_compatible = False
+    polars_compatible = True
 
     def __init__(
         self,
@@ -279,24 +761,24 @@ class BaseCrossColumnMappingTransformer(BaseMappingTransformer):
 
         self.adjust_column = adjust_column
 
-    def transform(self, X: pd.DataFrame) -> pd.DataFrame:
+    def transform(self, X: FrameT) -> FrameT:
         """Checks X is valid for transform and calls parent transform
 
         Parameters
         ----------
-        X : pd.DataFrame
+        X : pd/pl.DataFrame
             Data to apply adjustments to.
 
         Returns
         -------
-        X : pd.DataFrame
+        X : pd/pl.DataFrame
             Transformed data X with adjustments applied to specified columns.
 
         """
 
         X = super().transform(X)
 
-        if self.adjust_column not in X.columns.to_numpy():
+        if self.adjust_column not in X.columns:
             msg = f"{self.classname()}: variable {self.adjust_column} is not in X"
             raise ValueError(msg)
 
@@ -368,13 +850,17 @@ class CrossColumnMappingTransformer(BaseCrossColumnMappingTransformer):
 
         X = super().transform(X)
 
+        # one lookup per column, later columns taking precedence over earlier ones
         for i in self.columns:
-            for j in self.mappings[i]:
-                X[self.adjust_column] = np.where(
-                    (X[i] == j),
-                    self.mappings[i][j],
-                    X[self.adjust_column],
-                )
+            keys, values = self._compiled_mapping(i)
+
+            positions = keys.get_indexer(X[i])
+
+            X[self.adjust_column] = np.where(
+                positions != -1,
+                values.to_numpy().take(np.maximum(positions, 0)),
+                X[self.adjust_column],
+            )
 
         return X
 
@@ -407,7 +893,7 @@ class BaseCrossColumnNumericTransformer(BaseCrossColumnMappingTransformer):
 
     """
 
-    polars_compatible = False
+    polars_compatible = True
 
     def __init__(
         self,
@@ -423,29 +909,106 @@ class BaseCrossColumnNumericTransformer(BaseCrossColumnMappingTransformer):
                     msg = f"{self.classname()}: mapping values must be numeric"
                     raise TypeError(msg)
 
-    def transform(self, X: pd.DataFrame) -> pd.DataFrame:
+    def transform(self, X: FrameT) -> FrameT:
         """Checks X is valid for transform and calls parent transform
 
         Parameters
         ----------
-        X : pd.DataFrame
+        X : pd/pl.DataFrame
             Data to apply adjustments to.
 
         Returns
         -------
-        X : pd.DataFrame
+        X : pd/pl.DataFrame
             Transformed data X with adjustments applied to specified columns.
 
         """
 
         X = super().transform(X)
 
-        if not pd.api.types.is_numeric_dtype(X[self.adjust_column]):
+        if isinstance(X, pd.DataFrame):
+            is_numeric = pd.api.types.is_numeric_dtype(X[self.adjust_column])
+        else:
+            is_numeric = (
+                nw.from_native(X).collect_schema()[self.adjust_column].is_numeric()
+            )
+
+        if not is_numeric:
             msg = f"{self.classname()}: variable {self.adjust_column} must have numeric dtype."
             raise TypeError(msg)
 
         return X
 
+    def _column_adjustments(
+        self,
+        X: FrameT,
+        default: int,
+    ) -> list[np.ndarray] | list[nw.Expr]:
+        """Look up the adjustment for every row from each column's mapping, with default for values
+        that are not mapped. Adjustments are int if all mapping values are ints, otherwise float.
+
+        Parameters
+        ----------
+        X : nw.DataFrame
+            Data to look up adjustments for.
+
+        default : int
+            Adjustment for values which are not in the mapping, i.e. the identity of the adjustment.
+
+        Returns
+        -------
+        adjustments : list
+            Adjustment arrays for pandas inputs, or narwhals expressions for other inputs, for each
+            column in the columns attribute.
+
+        """
+        # mapping values are int or float, so are all int if every values array is int or empty
+        all_int = all(
+            values.dtype.kind == "i" or len(values) == 0
+            for _, values in (self._compiled_mapping(c) for c in self.columns)
+        )
+        cast_method = int if all_int else float
+
+        native_X = X.to_native()
+
+        if isinstance(native_X, pd.DataFrame):
+            adjustments = []
+
+            for i in self.columns:
+                keys, values = self._compiled_mapping(i)
+
+                positions = keys.get_indexer(native_X[i])
+
+                adjustments.append(
+                    np.where(
+                        positions != -1,
+                        values.to_numpy(dtype=cast_method).take(
+                            np.maximum(positions, 0),
+                        ),
+                        cast_method(default),
+                    ),
+                )
+
+            return adjustments
+
+        adjustments = []
+
+        for i in self.columns:
+            # look up the values present in X, so old values keep the dtype of the column
+            uniques = X[i].drop_nulls().unique().to_list()
+
+            adjustments.append(
+                nw.col(i)
+                .replace_strict(
+                    uniques,
+                    [cast_method(self.mappings[i].get(u, default)) for u in uniques],
+                    return_dtype=nw.Int64 if all_int else nw.Float64,
+                )
+                .fill_null(cast_method(default)),
+            )
+
+        return adjustments
+
 
 class CrossColumnMultiplyTransformer(BaseCrossColumnNumericTransformer):
     """Transformer to apply a multiplicative adjustment to values in one column based on the values of another column.
@@ -482,7 +1045,7 @@ class CrossColumnMultiplyTransformer(BaseCrossColumnNumericTransformer):
 
     """
 
-    polars_compatible = False
+    polars_compatible = True
 
     def __init__(
         self,
@@ -492,32 +1055,40 @@ class CrossColumnMultiplyTransformer(BaseCrossColumnNumericTransformer):
     ) -> None:
         super().__init__(mappings=mappings, adjust_column=adjust_column, **kwargs)
 
-    def transform(self, X: pd.DataFrame) -> pd.DataFrame:
+    @nw.narwhalify
+    def transform(self, X: FrameT) -> FrameT:
         """Transforms values in given column using the values provided in the adjustments dictionary.
 
         Parameters
         ----------
-        X : pd.DataFrame
+        X : pd/pl.DataFrame
             Data to apply adjustments to.
 
         Returns
         -------
-        X : pd.DataFrame
+        X : pd/pl.DataFrame
             Transformed data X with adjustments applied to specified columns.
 
         """
 
-        X = super().transform(X)
+        X = nw.from_native(super().transform(X))
 
-        for i in self.columns:
-            for j in self.mappings[i]:
-                X[self.adjust_column] = np.where(
-                    (X[i] == j),
-                    X[self.adjust_column] * self.mappings[i][j],
-                    X[self.adjust_column],
-                )
+        # the product of the adjustments for each column is applied in one operation
+        adjustment = reduce(
+            operator.mul,
+            self._column_adjustments(X, default=1),
+        )
 
-        return X
+        native_X = X.to_native()
+
+        if isinstance(native_X, pd.DataFrame):
+            native_X[self.adjust_column] = native_X[self.adjust_column] * adjustment
+
+            return native_X
+
+        return X.with_columns(
+            (nw.col(self.adjust_column) * adjustment).alias(self.adjust_column),
+        )
 
 
 class CrossColumnAddTransformer(BaseCrossColumnNumericTransformer):
@@ -555,7 +1126,7 @@ class CrossColumnAddTransformer(BaseCrossColumnNumericTransformer):
 
     """
 
-    polars_compatible = False
+    polars_compatible = True
 
     def __init__(
         self,
@@ -565,29 +1136,247 @@ class CrossColumnAddTransformer(BaseCrossColumnNumericTransformer):
     ) -> None:
         super().__init__(mappings=mappings, adjust_column=adjust_column, **kwargs)
 
-    def transform(self, X: pd.DataFrame) -> pd.DataFrame:
+    @nw.narwhalify
+    def transform(self, X: FrameT) -> FrameT:
         """Transforms values in given column using the values provided in the adjustments dictionary.
 
         Parameters
         ----------
-        X : pd.DataFrame
+        X : pd/pl.DataFrame
             Data to apply adjustments to.
 
         Returns
         -------
-        X : pd.DataFrame
+        X : pd/pl.DataFrame
             Transformed data X with adjustments applied to specified columns.
 
         """
 
-        X = super().transform(X)
+        X = nw.from_native(super().transform(X))
 
-        for i in self.columns:
-            for j in self.mappings[i]:
-                X[self.adjust_column] = np.where(
-                    (X[i] == j),
-                    X[self.adjust_column] + self.mappings[i][j],
-                    X[self.adjust_column],
+        # the sum of the adjustments for each column is applied in one operation
+        adjustment = reduce(
+            operator.add,
+            self._column_adjustments(X, default=0),
+        )
+
+        native_X = X.to_native()
+
+        if isinstance(native_X, pd.DataFrame):
+            native_X[self.adjust_column] = native_X[self.adjust_column] + adjustment
+
+            return native_X
+
+        return X.with_columns(
+            (nw.col(self.adjust_column) + adjustment).alias(self.adjust_column),
+        )
+
+
+class MultiKeyMappingTransformer(NewColumnNameMixin, BaseTransformer):
+    """Transformer to look up values from a table keyed by a combination of columns, for example
+    a rating table keyed by (region, age_band, vehicle_group).
+
+    The table is held as a columnar DataFrame rather than nested dicts and is applied in transform
+    with a single left hash join on the key columns, so large tables are cheap to store, pickle and
+    apply. Rows of X whose keys are not in the table, or have a null key, get the default value.
+
+    Parameters
+    ----------
+    columns : list
+        Key columns in X, matched in order against the key columns of the same names in
+        mapping_table.
+
+    mapping_table : pd.DataFrame, pl.DataFrame or dict
+        Table of values to look up. Either a DataFrame containing the key columns and
+        value_column, with at most one row per combination of keys, or a dict with tuples of key
+        values (in the order of columns) as keys, e.g. {('north', '18-25'): 1.2}. A dict is
+        converted to a pandas DataFrame.
+
+    value_column : str
+        Column of mapping_table holding the values to look up.
+
+    new_column_name : str, default = None
+        Name of the column of looked up values added to X. Defaults to value_column.
+
+    default : Any, default = None
+        Value for rows of X whose keys are not in mapping_table. If None misses are null.
+
+    **kwargs
+        Arbitrary keyword arguments passed onto BaseTransformer.init method.
+
+    Attributes
+    ----------
+    mapping_table : pd.DataFrame or pl.DataFrame
+        Table of key columns and values to look up.
+
+    value_column : str
+        Column of mapping_table holding the values to look up.
+
+    new_column_name : str
+        Name of the column of looked up values added to X.
+
+    default : Any
+        Value for rows of X whose keys are not in mapping_table.
+
+    polars_compatible : bool
+        class attribute, indicates whether transformer has been converted to polars/pandas agnostic narwhals framework
+
+    """
+
+    polars_compatible = True
+
+    def __init__(
+        self,
+        columns: list[str],
+        mapping_table: FrameT | dict[tuple, object],
+        value_column: str,
+        new_column_name: str | None = None,
+        default: object = None,
+        **kwargs: dict[str, bool],
+    ) -> None:
+        super().__init__(columns=columns, **kwargs)
+
+        if not isinstance(value_column, str):
+            msg = f"{self.classname()}: value_column should be str"
+            raise TypeError(msg)
+
+        if value_column in self.columns:
+            msg = f"{self.classname()}: value_column ({value_column}) should not be one of the key columns"
+            raise ValueError(msg)
+
+        if isinstance(mapping_table, dict):
+            mapping_table = self._table_from_dict(mapping_table, value_column)
+
+        if not isinstance(mapping_table, (pd.DataFrame, pl.DataFrame)):
+            msg = f"{self.classname()}: mapping_table should be a pd.DataFrame, pl.DataFrame or dict with tuple keys, got {type(mapping_table)}"
+            raise TypeError(msg)
+
+        table = nw.from_native(mapping_table, eager_only=True)
+
+        missing_columns = [
+            c for c in [*self.columns, value_column] if c not in table.columns
+        ]
+        if missing_columns:
+            msg = f"{self.classname()}: columns {missing_columns} are not in mapping_table"
+            raise ValueError(msg)
+
+        if table.select(self.columns).is_duplicated().any():
+            msg = f"{self.classname()}: mapping_table has more than one row for some combinations of {self.columns}"
+            raise ValueError(msg)
+
+        self.mapping_table = mapping_table
+        self.value_column = value_column
+        self.check_and_set_new_column_name(
+            value_column if new_column_name is None else new_column_name,
+        )
+        self.default = default
+
+    def _table_from_dict(
+        self,
+        mapping_table: dict[tuple, object],
+        value_column: str,
+    ) -> pd.DataFrame:
+        """Convert a dict of key tuples to values into a columnar pandas DataFrame."""
+        for key in mapping_table:
+            if not (isinstance(key, tuple) and len(key) == len(self.columns)):
+                msg = f"{self.classname()}: keys of mapping_table should be tuples of length {len(self.columns)}, got {key}"
+                raise ValueError(msg)
+
+        table = pd.DataFrame(list(mapping_table.keys()), columns=self.columns)
+        table[value_column] = list(mapping_table.values())
+
+        return table
+
+    def _aligned_table(self, X: nw.DataFrame) -> nw.DataFrame:
+        """Return the key and value columns of mapping_table in the backend of X, with key dtypes
+        matching X and rows with null keys removed as they never match.
+        """
+        table = nw.from_native(self.mapping_table, eager_only=True).select(
+            *self.columns,
+            self.value_column,
+        )
+
+        native_namespace = nw.get_native_namespace(X)
+        if nw.get_native_namespace(table) is not native_namespace:
+            # pl.from_pandas converts NaN to null, so null values stay null in either library
+            table = (
+                nw.from_native(pl.from_pandas(table.to_native()), eager_only=True)
+                if native_namespace is pl
+                else nw.from_dict(
+                    {c: table[c].to_numpy() for c in table.columns},
+                    native_namespace=native_namespace,
+                )
+            )
+
+        schema = X.collect_schema()
+        key_dtypes = {
+            c: nw.String if schema[c] in (nw.Categorical, nw.Enum) else schema[c]
+            for c in self.columns
+        }
+
+        table = table.drop_nulls(subset=self.columns)
+        table_schema = table.collect_schema()
+
+        aligned = table.with_columns(
+            nw.col(c).cast(dtype) for c, dtype in key_dtypes.items()
+        )
+
+        # a cast that changes keys, such as 1.5 to 1 for an int column, would match the wrong rows
+        for c, dtype in key_dtypes.items():
+            if (
+                dtype != nw.String
+                and dtype != table_schema[c]
+                and (aligned[c].cast(table_schema[c]) != table[c]).any()
+            ):
+                msg = (
+                    f"{self.classname()}: keys of mapping_table column {c} ({table_schema[c]}) "
+                    f"cannot be cast to the dtype of X ({dtype}) without changing their values"
                 )
+                raise ValueError(msg)
 
-        return X
+        return aligned
+
+    @nw.narwhalify
+    def transform(self, X: FrameT) -> FrameT:
+        """Add new_column_name to X with the values of mapping_table for the keys in each row,
+        looked up with a single left join on the key columns.
+
+        Parameters
+        ----------
+        X : pd/pl.DataFrame
+            Data with the key columns to look up.
+
+        Returns
+        -------
+        X : pd/pl.DataFrame
+            Input X with new_column_name added.
+
+        """
+        X = nw.from_native(BaseTransformer.transform(self, X))
+
+        table = self._aligned_table(X)
+
+        # categorical keys are joined as strings, as categories of X and the table can differ
+        schema = X.collect_schema()
+        keys = X.select(
+            nw.col(c).cast(nw.String) if schema[c] in (nw.Categorical, nw.Enum) else c
+            for c in self.columns
+        )
+
+        if self.default is not None:
+            table = table.with_columns(nw.lit(value=True).alias("__matched"))
+
+        # a left join keeps the rows of X in order, unmatched rows are null in the table columns
+        looked_up = keys.join(table, on=self.columns, how="left")
+
+        values = looked_up[self.value_column]
+
+        if self.default is not None:
+            values = looked_up.select(
+                nw.when(~nw.col("__matched").is_null())
+                .then(nw.col(self.value_column))
+                .otherwise(nw.lit(self.default))
+                .alias(self.value_column),
+            )[self.value_column]
+
+        return X.with_columns(values.alias(self.new_column_name))
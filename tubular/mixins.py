@@ -86,6 +86,10 @@ class DropOriginalMixin:
         """
 
         if drop_original:
+            # narwhals frames are immutable, so callers must use the returned frame
+            if isinstance(X, (nw.DataFrame, nw.LazyFrame)):
+                return X.drop(columns)
+
             for col in columns:
                 del X[col]
 
@@ -138,7 +142,7 @@ class WeightColumnMixin:
         class attribute, indicates whether transformer has been converted to polars/pandas agnostic narwhals framework
     """
 
-    polars_compatible = False
+    polars_compatible = True
 
     @nw.narwhalify
     def check_weights_column(self, X: FrameT, weights_column: str) -> None:
@@ -165,8 +169,11 @@ class WeightColumnMixin:
             msg = f"{self.classname()}: weight column must be positive"
             raise ValueError(msg)
 
-        # check weight non-null
-        if X[weights_column].is_null().sum() != 0:
+        # check weight non-null, polars keeps NaN distinct from null so check both
+        if (
+            X[weights_column].is_null().sum() != 0
+            or np.isnan(X[weights_column].to_numpy().astype(float)).any()
+        ):
             msg = f"{self.classname()}: weight column must be non-null"
             raise ValueError(msg)
 
@@ -1,19 +1,26 @@
 """This module contains transformers that apply encodings to nominal columns."""
+
 from __future__ import annotations
 
 import warnings
-from typing import Literal
+from typing import TYPE_CHECKING, Literal
 
+import narwhals as nw
 import numpy as np
 import pandas as pd
-from sklearn.preprocessing import OneHotEncoder
+from scipy import sparse
 
 from tubular.base import BaseTransformer
-from tubular.mapping import BaseMappingTransformMixin
+from tubular.mapping import BaseMappingTransformMixin, CompactMappingsMixin
 from tubular.mixins import DropOriginalMixin, SeparatorColumnMixin, WeightColumnMixin
 
+if TYPE_CHECKING:
+    from collections.abc import Collection, Iterable
+
+    from narwhals.typing import FrameT
 
-class BaseNominalTransformer(BaseTransformer):
+
+class BaseNominalTransformer(CompactMappingsMixin, BaseTransformer):
     """
     Base Transformer extension for nominal transformers.
 
@@ -43,7 +50,7 @@ class BaseNominalTransformer(BaseTransformer):
         self.check_is_fitted(["mappings"])
 
         for c in self.columns:
-            mappable_rows = X[c].isin(list(self.mappings[c])).sum()
+            mappable_rows = (self._mapping_positions(c, X[c]) != -1).sum()
 
             if mappable_rows < X.shape[0]:
                 msg = f"{self.classname()}: nulls would be introduced into column {c} from levels not present in mapping"
@@ -142,14 +149,19 @@ class NominalToIntegerTransformer(BaseNominalTransformer, BaseMappingTransformMi
         """
         BaseNominalTransformer.fit(self, X, y)
 
-        self.mappings = {}
+        mappings = {}
 
         for c in self.columns:
             col_values = X[c].unique()
 
-            self.mappings[c] = {
-                k: i for i, k in enumerate(col_values, self.start_encoding)
-            }
+            mappings[c] = dict(
+                zip(
+                    col_values,
+                    range(self.start_encoding, self.start_encoding + len(col_values)),
+                ),
+            )
+
+        self.mappings = mappings
 
         return self
 
@@ -157,9 +169,8 @@ class NominalToIntegerTransformer(BaseNominalTransformer, BaseMappingTransformMi
         """Transform method to apply integer encoding stored in the mappings attribute to
         each column in the columns attribute.
 
-        This method calls the check_mappable_rows method from BaseNominalTransformer to check that
-        all rows can be mapped then transform from BaseMappingTransformMixin to apply the
-        standard pd.Series.map method.
+        The position of each value in the levels of the mapping is looked up once, which both
+        checks that all rows can be mapped and gives the integer to take for each row.
 
         Parameters
         ----------
@@ -172,10 +183,22 @@ class NominalToIntegerTransformer(BaseNominalTransformer, BaseMappingTransformMi
             Transformed input X with levels mapped according to mappings dict.
 
         """
+        X = BaseTransformer.transform(self, X)
+
+        self.check_is_fitted(["mappings"])
+
+        for c in self.columns:
+            _, values = self._compiled_mapping(c)
+
+            positions = self._mapping_positions(c, X[c])
+
+            if (positions == -1).any():
+                msg = f"{self.classname()}: nulls would be introduced into column {c} from levels not present in mapping"
+                raise ValueError(msg)
 
-        X = super().transform(X)
+            X[c] = values.to_numpy().take(positions)
 
-        return BaseMappingTransformMixin.transform(self, X)
+        return X
 
     def inverse_transform(self, X: pd.DataFrame) -> pd.DataFrame:
         """Converts integer values back to categorical / nominal values. Does the inverse of the transform method.
@@ -195,29 +218,44 @@ class NominalToIntegerTransformer(BaseNominalTransformer, BaseMappingTransformMi
 
         self.check_is_fitted(["mappings"])
 
-        self.inverse_mapping_ = {}
+        if "inverse_mapping_" not in self.__dict__:
+            self.inverse_mapping_ = {}
+            self._inverse_indexes = {}
 
         for c in self.columns:
-            # calculate the reverse mapping
-            self.inverse_mapping_[c] = {v: k for k, v in self.mappings[c].items()}
+            keys, values = self._compiled_mapping(c)
 
-            mappable_rows = (
-                X[c].isin([k for k, v in self.inverse_mapping_[c].items()]).sum()
-            )
+            # the inverse lookup is built from the compiled mapping, so only once per mapping
+            inverse = self._inverse_indexes.get(c)
+
+            if inverse is None or inverse[0] is not values:
+                # where levels share an integer the last one is used, as when inverting the dict
+                last = ~values.duplicated(keep="last").to_numpy()
+
+                # the position of an integer in the index is the position of its level in keys
+                inverse = (values, pd.Index(values[last]), keys[last])
+
+                self._inverse_indexes[c] = inverse
+                self.inverse_mapping_[c] = dict(
+                    zip(values[last].tolist(), keys[last].tolist()),
+                )
 
-            X[c] = X[c].replace(self.inverse_mapping_[c])
+            _, integers, keys = inverse
 
-            if (X.shape[0] - mappable_rows) > 0:
+            positions = integers.get_indexer(X[c])
+
+            if (positions == -1).any():
                 raise ValueError(
                     f"{self.classname()}: nulls introduced from levels not present in mapping for column: "
                     + c,
                 )
 
+            X[c] = keys.take(positions).to_numpy()
+
         return X
 
 
 class GroupRareLevelsTransformer(BaseTransformer, WeightColumnMixin):
-
     """Transformer to group together rare levels of nominal variables into a new level,
     labelled 'rare' (by default).
 
@@ -261,9 +299,9 @@ class GroupRareLevelsTransformer(BaseTransformer, WeightColumnMixin):
         Cut off percentage (either in terms of number of rows or sum of weight) for a given
         nominal level to be considered rare.
 
-    non_rare_levels : dict
+    non_rare_levels : dict[str, frozenset]
         Created in fit. A dict of non-rare levels (i.e. levels with more than cut_off_percent weight or rows)
-        that is used to identify rare levels in transform.
+        that is used to identify rare levels in transform. A null level is stored as None.
 
     rare_level_name : any
         Must be of the same type as columns.
@@ -285,16 +323,17 @@ class GroupRareLevelsTransformer(BaseTransformer, WeightColumnMixin):
     unseen_levels_to_rare : bool
         If True, unseen levels in new data will be passed to rare, if set to false they will be left unchanged.
 
-    training_data_levels : dict[set]
+    training_data_levels : dict[str, frozenset]
         Dictionary containing the set of values present in the training data for each column in self.columns. It
-        will only exist in if unseen_levels_to_rare is set to False.
+        will only exist in if unseen_levels_to_rare is set to False. Neither this nor non_rare_levels is changed
+        by transform.
 
     polars_compatible : bool
         class attribute, indicates whether transformer has been converted to polars/pandas agnostic narwhals framework
 
     """
 
-    polars_compatible = False
+    polars_compatible = True
 
     FITS = True
 
@@ -336,7 +375,12 @@ class GroupRareLevelsTransformer(BaseTransformer, WeightColumnMixin):
 
         self.unseen_levels_to_rare = unseen_levels_to_rare
 
-    def fit(self, X: pd.DataFrame, y: pd.Series | None = None) -> pd.DataFrame:
+    @nw.narwhalify
+    def fit(
+        self,
+        X: FrameT,
+        y: nw.Series | None = None,
+    ) -> GroupRareLevelsTransformer:
         """Records non-rare levels for categorical variables.
 
         When transform is called, only levels records in non_rare_levels during fit will remain
@@ -347,10 +391,10 @@ class GroupRareLevelsTransformer(BaseTransformer, WeightColumnMixin):
 
         Parameters
         ----------
-        X : pd.DataFrame
+        X : pd/pl.DataFrame
             Data to identify non-rare levels from.
 
-        y : None or pd.DataFrame or pd.Series, default = None
+        y : None or pd/pl.Series, default = None
             Optional argument only required for the transformer to work with sklearn pipelines.
 
         """
@@ -359,10 +403,16 @@ class GroupRareLevelsTransformer(BaseTransformer, WeightColumnMixin):
         if self.weights_column is not None:
             WeightColumnMixin.check_weights_column(self, X, self.weights_column)
 
+        schema = X.schema
+
+        rare_level_dtype = nw.new_series(
+            "rare_level_name",
+            [self.rare_level_name],
+            native_namespace=nw.get_native_namespace(X),
+        ).dtype
+
         for c in self.columns:
-            if (X[c].dtype.name != "category") and (
-                pd.Series(self.rare_level_name).dtype != X[c].dtypes
-            ):
+            if schema[c] != nw.Categorical and schema[c] != rare_level_dtype:
                 msg = f"{self.classname()}: rare_level_name must be of the same type of the columns"
                 raise ValueError(msg)
 
@@ -371,131 +421,191 @@ class GroupRareLevelsTransformer(BaseTransformer, WeightColumnMixin):
         if self.record_rare_levels:
             self.rare_levels_record_ = {}
 
-        if self.weights_column is None:
-            for c in self.columns:
-                col_percents = X[c].value_counts(dropna=False) / X.shape[0]
+        if not self.unseen_levels_to_rare:
+            self.training_data_levels = {}
 
-                self.non_rare_levels[c] = list(
-                    col_percents.loc[col_percents >= self.cut_off_percent].index.values,
+        for c in self.columns:
+            # total count / weight of each level of the column, including null, from which
+            # the non-rare, rare and training data levels all follow
+            if self.weights_column is None:
+                # value_counts is quicker than group_by, but includes unobserved pandas
+                # categories and counts None and np.nan separately, so the (far fewer)
+                # counts are regrouped to combine nulls
+                grouped = (
+                    X[c]
+                    .value_counts(name="_level_weight")
+                    .filter(nw.col("_level_weight") > 0)
+                    .group_by(c)
+                    .agg(nw.col("_level_weight").sum())
                 )
 
-                self.non_rare_levels[c] = sorted(self.non_rare_levels[c], key=str)
+            else:
+                grouped = (
+                    X.select(c, self.weights_column)
+                    .group_by(c)
+                    .agg(nw.col(self.weights_column).sum().alias("_level_weight"))
+                )
 
-                if self.record_rare_levels:
-                    self.rare_levels_record_[c] = list(
-                        col_percents.loc[
-                            col_percents < self.cut_off_percent
-                        ].index.values,
-                    )
+            levels = grouped[c].to_list()
+            weights = grouped["_level_weight"].to_numpy()
+            non_rare = weights / weights.sum() >= self.cut_off_percent
 
-                    self.rare_levels_record_[c] = sorted(
-                        self.rare_levels_record_[c],
-                        key=str,
-                    )
+            self.non_rare_levels[c] = self._frozen_levels(
+                level for level, keep in zip(levels, non_rare) if keep
+            )
 
-        else:
-            for c in self.columns:
-                cols_w_percents = X.groupby(c)[self.weights_column].sum()
-
-                # nulls are excluded from pandas groupby; https://github.com/pandas-dev/pandas/issues/3729
-                # so add them back in
-                if cols_w_percents.sum() < X[self.weights_column].sum():
-                    cols_w_percents[np.nan] = X.loc[
-                        X[c].isna(),
-                        self.weights_column,
-                    ].sum()
-
-                cols_w_percents = cols_w_percents / X[self.weights_column].sum()
-
-                self.non_rare_levels[c] = list(
-                    cols_w_percents.loc[
-                        cols_w_percents >= self.cut_off_percent
-                    ].index.values,
+            if self.record_rare_levels:
+                self.rare_levels_record_[c] = sorted(
+                    self._frozen_levels(
+                        level for level, keep in zip(levels, non_rare) if not keep
+                    ),
+                    key=str,
                 )
 
-                self.non_rare_levels[c] = sorted(self.non_rare_levels[c], key=str)
+            if not self.unseen_levels_to_rare:
+                self.training_data_levels[c] = self._frozen_levels(levels)
 
-                if self.record_rare_levels:
-                    self.rare_levels_record_[c] = list(
-                        cols_w_percents.loc[
-                            cols_w_percents < self.cut_off_percent
-                        ].index.values,
-                    )
+        return self
 
-                    self.rare_levels_record_[c] = sorted(
-                        self.rare_levels_record_[c],
-                        key=str,
-                    )
+    @staticmethod
+    def _frozen_levels(levels: Iterable) -> frozenset:
+        """Store levels as a frozenset, with any null level as None so that it is found by
+        membership tests whichever null it was in X."""
+        return frozenset(None if pd.isna(level) else level for level in levels)
+
+    @staticmethod
+    def _in_levels(values: pd.Series | pd.Index, levels: Collection) -> np.ndarray:
+        """Whether each of values is in levels, with nulls in values matching any null level -
+        isin alone does not match None to np.nan."""
+        levels = pd.Index(list(levels))
+
+        return np.asarray(values.isin(levels)) | (
+            np.asarray(values.isna()) & levels.hasnans
+        )
+
+    def _grouped(self, values: pd.Series | pd.Index, c: str) -> np.ndarray:
+        """Whether each of values from column c is grouped into the rare level, i.e. is not a
+        non-rare level and, if unseen_levels_to_rare is False, was seen in fit."""
+        grouped = ~self._in_levels(values, self.non_rare_levels[c])
 
         if not self.unseen_levels_to_rare:
-            self.training_data_levels = {}
-            for c in self.columns:
-                self.training_data_levels[c] = set(X[c])
+            grouped &= self._in_levels(values, self.training_data_levels[c])
 
-        return self
+        return grouped
 
-    def transform(self, X: pd.DataFrame) -> pd.DataFrame:
+    def _group_categorical(self, X_c: pd.Series, c: str) -> pd.Series:
+        """Group rare levels of categorical column c by remapping its categories rather than
+        its rows. Grouped categories are dropped and the rare level added as the last category.
+        """
+        categories = X_c.cat.categories
+
+        # final entry is for nulls, which have code -1
+        grouped = np.append(
+            self._grouped(categories, c),
+            self._grouped(pd.Index([None]), c),
+        )
+
+        retained = categories[~grouped[:-1] & ~categories.isin([self.rare_level_name])]
+        new_categories = retained.append(pd.Index([self.rare_level_name]))
+
+        code_map = np.where(
+            grouped,
+            len(retained),
+            np.append(new_categories.get_indexer(categories), -1),
+        )
+
+        return pd.Series(
+            pd.Categorical.from_codes(
+                code_map[X_c.cat.codes],
+                dtype=pd.CategoricalDtype(new_categories),
+            ),
+            index=X_c.index,
+            name=X_c.name,
+        )
+
+    @staticmethod
+    def _in_levels_expr(values: nw.Expr, levels: Collection) -> nw.Expr:
+        """Whether each of values is in levels, with nulls matching any null level."""
+        non_null_levels = [level for level in levels if not pd.isna(level)]
+
+        # polars gives null rather than False for null values
+        in_levels = values.is_in(non_null_levels).fill_null(False)
+
+        if len(non_null_levels) < len(levels):
+            in_levels = in_levels | values.is_null()
+
+        return in_levels
+
+    def _group_expr(self, c: str, dtype: nw.dtypes.DType) -> nw.Expr:
+        """Expression grouping rare levels of column c, keeping non-rare levels and, if
+        unseen_levels_to_rare is False, levels not seen in fit."""
+        values = nw.col(c)
+
+        # polars categoricals have no fixed categories, so are grouped as strings and cast
+        # back rather than re-encoding the column against the rare level
+        if dtype == nw.Categorical:
+            values = values.cast(nw.String)
+
+        kept = self._in_levels_expr(values, self.non_rare_levels[c])
+
+        if not self.unseen_levels_to_rare:
+            kept = kept | ~self._in_levels_expr(values, self.training_data_levels[c])
+
+        grouped = nw.when(kept).then(values).otherwise(nw.lit(self.rare_level_name))
+
+        if dtype == nw.Categorical:
+            grouped = grouped.cast(nw.Categorical)
+
+        return grouped.alias(c)
+
+    @nw.narwhalify
+    def transform(self, X: FrameT) -> FrameT:
         """Grouped rare levels together into a new 'rare' level.
 
         Parameters
         ----------
-        X : pd.DataFrame
+        X : pd/pl.DataFrame
             Data to with catgeorical variables to apply rare level grouping to.
 
         Returns
         -------
-        X : pd.DataFrame
+        X : pd/pl.DataFrame
             Transformed input X with rare levels grouped for into a new rare level.
 
         """
-        X = BaseTransformer.transform(self, X)
+        X = nw.from_native(BaseTransformer.transform(self, X))
 
         self.check_is_fitted(["non_rare_levels"])
 
-        if not self.unseen_levels_to_rare:
-            for c in self.columns:
-                unseen_vals = set(X[c]) - set(self.training_data_levels[c])
-                for unseen_val in unseen_vals:
-                    self.non_rare_levels[c].append(unseen_val)
-
-        for c in self.columns:
-            # for categorical dtypes have to set new category for the impute values first
-            # and convert back to the categorical type, other it will convert to object
-            if "category" in X[c].dtype.name:
-                categories_before = X[c].dtype.categories
-
-                if self.rare_level_name not in X[c].cat.categories:
-                    X[c] = X[c].cat.add_categories(self.rare_level_name)
-
-                X[c] = pd.Series(
-                    data=np.where(
-                        X[c].isin(self.non_rare_levels[c]),
-                        X[c],
-                        self.rare_level_name,
-                    ),
-                    index=X.index,
-                )
-
-                remaining_categories = [
-                    category
-                    for category in categories_before
-                    if category in self.non_rare_levels[c]
-                ]
+        schema = X.schema
 
-                X[c] = pd.Categorical(
-                    X[c],
-                    categories=remaining_categories + [self.rare_level_name],
-                )
+        # pandas categoricals are grouped by remapping their categories rather than rows
+        native_X = X.to_native()
+        if isinstance(native_X, pd.DataFrame):
+            pandas_categorical_columns = [
+                c for c in self.columns if schema[c] == nw.Categorical
+            ]
 
-            else:
-                # using np.where converts np.NaN to str value if only one row of data frame is passed
-                # instead, using pd.where(), if condition true, keep original value, else replace with self.rare_level_name
-                X[c] = X[c].where(
-                    X[c].isin(self.non_rare_levels[c]),
-                    self.rare_level_name,
+            if pandas_categorical_columns:
+                X = nw.from_native(
+                    native_X.assign(
+                        **{
+                            c: self._group_categorical(native_X[c], c)
+                            for c in pandas_categorical_columns
+                        },
+                    ),
                 )
 
-        return X
+        else:
+            pandas_categorical_columns = []
+
+        return X.with_columns(
+            [
+                self._group_expr(c, schema[c])
+                for c in self.columns
+                if c not in pandas_categorical_columns
+            ],
+        )
 
 
 class MeanResponseTransformer(BaseNominalTransformer, WeightColumnMixin):
@@ -517,6 +627,9 @@ class MeanResponseTransformer(BaseNominalTransformer, WeightColumnMixin):
 
     The same weights and prior are applied to each response level in the multi-level case.
 
+    In fit the response is one-hot encoded once and the statistics for every response level are
+    calculated in a single group_by of each column.
+
     Parameters
     ----------
     columns : None or str or list, default = None
@@ -545,6 +658,36 @@ class MeanResponseTransformer(BaseNominalTransformer, WeightColumnMixin):
     return_type: Literal['float32', 'float64']
         What type to cast return column as, consider exploring float32 to save memory. Defaults to float32.
 
+    cv : int or None, default = None
+        Number of folds for out-of-fold encoding in fit_transform. If set, fit_transform encodes the rows
+        of each fold with the mappings learnt from the other folds, so the encoding of a row does not
+        use its own response. The mappings used by transform are still learnt from all of the data.
+
+    random_state : int or None, default = None
+        Seed to randomly assign rows to folds when cv is set. If None the folds are contiguous blocks
+        of rows.
+
+    smoothing : str or None, default = None
+        How to shrink the mean response of each level, which is otherwise regularised with prior.
+        All options are calculated from one aggregation per column of the sum and sum of squares of
+        the response, and the weight, of each level.
+
+        - 'm_estimate': (sum + m * global mean) / (weight + m), with m = smoothing_strength.
+        - 'empirical_bayes': shrink towards the global mean by weight * tau^2 / (weight * tau^2 +
+          sigma^2), where tau^2 is the variance of the level means around the global mean and
+          sigma^2 the variance of y within levels, pooled over all levels. These are one-way random
+          effects estimates, so levels with little weight, such as single rows, are shrunk more.
+        - 'hierarchical': m-estimate towards the encoding of the level of parent_column, itself an
+          m-estimate towards the global mean. Levels seen with more than one parent level are shrunk
+          towards the weighted mean of their parents' encodings.
+
+    smoothing_strength : int or float, default = 1.0
+        Weight, m, given to the mean being shrunk towards for 'm_estimate' and 'hierarchical' smoothing.
+
+    parent_column : str or None, default = None
+        Column with the parent level of each level, only and always required for 'hierarchical'
+        smoothing. It must not contain nulls and is not needed in transform.
+
     **kwargs
         Arbitrary keyword arguments passed onto BaseTransformer.init method.
 
@@ -576,9 +719,9 @@ class MeanResponseTransformer(BaseNominalTransformer, WeightColumnMixin):
         Only created in the multi-level case. A list of the new columns produced by encoded the columns in self.columns
         against multiple response levels, of the form {column}_{level}.
 
-    transformer_dict : dict
-        Only created in the mutli-level case. A dictionary of the form level : transformer containing the mean response
-        transformers for each level to be encoded against.
+    global_mean : float or dict
+        Created in fit. The (weighted) mean response, or in the multi-level case a dict of the mean of the
+        indicator of each response level, which the prior regularises encodings towards.
 
     unseen_levels_encoding_dict: dict
         Dict containing the values (based on chosen unseen_level_handling) derived from the encoded columns to use when handling unseen levels in data passed to transform method.
@@ -586,6 +729,21 @@ class MeanResponseTransformer(BaseNominalTransformer, WeightColumnMixin):
     return_type: Literal['float32', 'float64']
         What type to cast return column as. Defaults to float32.
 
+    cv : int or None
+        Number of folds for out-of-fold encoding in fit_transform.
+
+    random_state : int or None
+        Seed used to assign rows to folds when cv is set.
+
+    smoothing : str or None
+        How the mean response of each level is shrunk, if not with prior.
+
+    smoothing_strength : int or float
+        Weight given to the mean being shrunk towards for 'm_estimate' and 'hierarchical' smoothing.
+
+    parent_column : str or None
+        Column with the parent level of each level for 'hierarchical' smoothing.
+
     cast_method: Literal[np.float32, np,float64]
         Store the casting method associated to return_type
 
@@ -594,7 +752,7 @@ class MeanResponseTransformer(BaseNominalTransformer, WeightColumnMixin):
 
     """
 
-    polars_compatible = False
+    polars_compatible = True
 
     FITS = True
 
@@ -606,6 +764,12 @@ class MeanResponseTransformer(BaseNominalTransformer, WeightColumnMixin):
         level: str | list | None = None,
         unseen_level_handling: str | float | None = None,
         return_type: Literal["float32", "float64"] = "float32",
+        cv: int | None = None,
+        random_state: int | None = None,
+        smoothing: Literal["m_estimate", "empirical_bayes", "hierarchical"]
+        | None = None,
+        smoothing_strength: float = 1.0,
+        parent_column: str | None = None,
         **kwargs: dict[str, bool],
     ) -> None:
         if type(prior) is not int:
@@ -631,10 +795,47 @@ class MeanResponseTransformer(BaseNominalTransformer, WeightColumnMixin):
             msg = f"{self.classname()}: return_type should be one of: 'float64', 'float32'"
             raise ValueError(msg)
 
+        if cv is not None and (type(cv) is not int or cv < 2):
+            msg = f"{self.classname()}: cv should be None or an int greater than 1"
+            raise ValueError(msg)
+
+        if random_state is not None and type(random_state) is not int:
+            msg = f"{self.classname()}: random_state should be None or an int"
+            raise TypeError(msg)
+
+        if smoothing not in [None, "m_estimate", "empirical_bayes", "hierarchical"]:
+            msg = f"{self.classname()}: smoothing should be None or one of: 'm_estimate', 'empirical_bayes', 'hierarchical'"
+            raise ValueError(msg)
+
+        if smoothing is not None and prior != 0:
+            msg = f"{self.classname()}: prior is only used when smoothing is None"
+            raise ValueError(msg)
+
+        if type(smoothing_strength) not in [int, float] or not smoothing_strength >= 0:
+            msg = f"{self.classname()}: smoothing_strength should be a non-negative int or float"
+            raise ValueError(msg)
+
+        if (smoothing == "hierarchical") != (parent_column is not None):
+            msg = f"{self.classname()}: parent_column should be set if and only if smoothing is 'hierarchical'"
+            raise ValueError(msg)
+
+        if parent_column is not None and not isinstance(parent_column, str):
+            msg = f"{self.classname()}: parent_column should be a str"
+            raise TypeError(msg)
+
+        if smoothing == "hierarchical" and cv is not None:
+            msg = f"{self.classname()}: cv is not supported with hierarchical smoothing"
+            raise ValueError(msg)
+
         WeightColumnMixin.check_and_set_weight(self, weights_column)
 
         self.prior = prior
         self.level = level
+        self.cv = cv
+        self.random_state = random_state
+        self.smoothing = smoothing
+        self.smoothing_strength = smoothing_strength
+        self.parent_column = parent_column
         self.unseen_level_handling = unseen_level_handling
         self.return_type = return_type
         if return_type == "float64":
@@ -645,221 +846,934 @@ class MeanResponseTransformer(BaseNominalTransformer, WeightColumnMixin):
 
         BaseNominalTransformer.__init__(self, columns=columns, **kwargs)
 
+        if parent_column is not None and parent_column in self.columns:
+            msg = f"{self.classname()}: parent_column ({parent_column}) should not be one of the columns to encode"
+            raise ValueError(msg)
+
     def _prior_regularisation(
         self,
-        target_means: pd.Series,
-        cat_freq: str,
-    ) -> pd.Series:
+        target_means: pd.Series | np.ndarray,
+        cat_freq: pd.Series | np.ndarray,
+        global_mean: float | np.ndarray | None = None,
+    ) -> pd.Series | np.ndarray:
         """Regularise encoding values by pushing encodings of infrequent categories towards the global mean.  If prior is zero this will return target_means unaltered.
 
+        Works elementwise, so target_means can be a 2d array of the means of several responses for
+        each level, with a column vector of level sizes and a global mean for each response.
+
         Parameters
         ----------
-        target_means : pd.Series
+        target_means : pd.Series or np.ndarray
             Series containing group means for levels of column in data
 
-        cat_freq : str
+        cat_freq : pd.Series or np.ndarray
             Series containing group sizes for levels of column in data
 
+        global_mean : float, np.ndarray or None, default = None
+            Global mean of the response, or of each response. Defaults to the global_mean attribute.
+
         Returns
         -------
-        regularised : pd.Series
+        regularised : pd.Series or np.ndarray
             Series of regularised encoding values
         """
-        self.check_is_fitted(["global_mean"])
+        if global_mean is None:
+            self.check_is_fitted(["global_mean"])
+            global_mean = self.global_mean
 
-        return (
-            target_means.multiply(cat_freq, axis="index")
-            + self.global_mean * self.prior
-        ).divide(cat_freq + self.prior, axis="index")
+        return (target_means * cat_freq + global_mean * self.prior) / (
+            cat_freq + self.prior
+        )
 
-    def _fit_binary_response(
+    def _smoothed_encodings(
         self,
-        X: pd.DataFrame,
-        y: pd.Series,
-        columns: list[str],
-    ) -> None:
-        """Function to learn the MRE mappings for a given binary or continuous response.
+        sums: np.ndarray,
+        weights: np.ndarray,
+        global_means: np.ndarray,
+        within_variances: np.ndarray | None = None,
+        between_variances: np.ndarray | None = None,
+        parent_means: np.ndarray | None = None,
+    ) -> np.ndarray:
+        """Encodings from the (weighted) sum of the response and the weight of each level, shrunk as
+        set by smoothing.
+
+        All arguments are broadcast elementwise, so every level and response level of a column is
+        encoded at once. within_variances and between_variances, from _empirical_bayes_variances,
+        are only used by 'empirical_bayes' smoothing and parent_means only by 'hierarchical'
+        smoothing.
+        """
+        m = self.smoothing_strength
 
-        Parameters
-        ----------
-        X : pd.DataFrame
-            Data to with catgeorical variable columns to transform.
+        with np.errstate(divide="ignore", invalid="ignore"):
+            means = sums / weights
 
-        y : pd.Series
-            Binary or contionuous response variable to encode against.
+            if self.smoothing is None:
+                return self._prior_regularisation(means, weights, global_means)
 
-        columns : list(str)
-            Post transform names of columns to be encoded. In the binary or continous case
-            this is just self.columns. In the multi-level case this should be of the form
-            {column_in_original_data}_{response_level}, where response_level is the level
-            being encoded against in this call of _fit_binary_response.
+            if self.smoothing == "m_estimate":
+                return (sums + m * global_means) / (weights + m)
+
+            if self.smoothing == "hierarchical":
+                return (sums + m * parent_means) / (weights + m)
+
+            between = weights * between_variances
+
+            shrinkage = np.where(
+                between + within_variances > 0,
+                between / (between + within_variances),
+                1.0,
+            )
+
+        return global_means + shrinkage * (means - global_means)
+
+    @staticmethod
+    def _empirical_bayes_variances(
+        sums: np.ndarray,
+        squares: np.ndarray,
+        weights: np.ndarray,
+        global_means: np.ndarray,
+        global_variances: np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Variance of the response within levels, pooled over the levels, and variance of the level
+        means around the global mean, for 'empirical_bayes' smoothing.
+
+        These are the one-way random effects (ANOVA) estimates from the (weighted) sums, sums of
+        squares and weights of each level, with a row per level. Levels without weight are ignored.
+        If there are no more rows than levels, e.g. every level is a single row, the within level
+        variance cannot be estimated so the variance of the response is used instead.
+
+        Returns both with a single row, to broadcast against the statistics of each level.
         """
-        if self.weights_column is not None:
-            WeightColumnMixin.check_weights_column(self, X, self.weights_column)
+        observed = weights[:, 0] > 0
+        sums, squares, weights = sums[observed], squares[observed], weights[observed]
 
-        response_null_count = y.isna().sum()
+        n_levels = weights.shape[0]
+        total_weight = weights.sum()
 
-        if response_null_count > 0:
-            msg = f"{self.classname()}: y has {response_null_count} null values"
-            raise ValueError(msg)
+        means = sums / weights
 
-        X_y = self._combine_X_y(X, y)
-        response_column = "_temporary_response"
+        within_squares = (squares - sums * means).sum(axis=0, keepdims=True)
+        between_squares = (weights * (means - global_means) ** 2).sum(
+            axis=0,
+            keepdims=True,
+        )
 
-        if self.weights_column is None:
-            self.global_mean = X_y[response_column].mean()
+        within_variances = np.maximum(
+            within_squares / (total_weight - n_levels)
+            if total_weight > n_levels
+            else global_variances,
+            0,
+        )
 
-        else:
-            X_y["weighted_response"] = X_y[response_column].multiply(
-                X_y[self.weights_column],
+        # total weight less the weight lost to estimating the global mean from the levels
+        effective_weight = total_weight - (weights**2).sum() / total_weight
+
+        between_variances = (
+            np.maximum(
+                (between_squares - (n_levels - 1) * within_variances)
+                / effective_weight,
+                0,
             )
+            if effective_weight > 0
+            else np.zeros_like(within_variances)
+        )
+
+        return within_variances, between_variances
 
-            self.global_mean = (
-                X_y["weighted_response"].sum() / X_y[self.weights_column].sum()
+    def _moments(
+        self,
+        statistics: nw.DataFrame,
+        response_columns: list[str],
+        square_columns: list[str],
+        suffix: str = "",
+    ) -> tuple[np.ndarray, np.ndarray | None, np.ndarray]:
+        """Sums of the response columns, sums of the squares of the response if needed, and
+        weight, as arrays with a row per row of statistics."""
+        weight_column = "_count" if self.weights_column is None else "_weight"
+
+        sums = (
+            statistics.select(f"{r}{suffix}" for r in response_columns)
+            .to_numpy()
+            .astype(np.float64)
+        )
+
+        if not square_columns:
+            squares = None
+        elif square_columns == response_columns:
+            squares = sums
+        else:
+            squares = (
+                statistics.select(f"{r}{suffix}" for r in square_columns)
+                .to_numpy()
+                .astype(np.float64)
             )
 
-        for c in columns:
-            if self.weights_column is None:
-                group_means = X_y.groupby(c, observed=True)[response_column].mean()
+        weights = statistics[f"{weight_column}{suffix}"].to_numpy().astype(np.float64)
 
-                group_counts = X_y.groupby(c, observed=True)[response_column].size()
+        return sums, squares, weights[:, None]
 
-                self.mappings[c] = self._prior_regularisation(
-                    group_means,
-                    group_counts,
-                ).to_dict()
+    def _hierarchical_statistics(
+        self,
+        X_y: nw.DataFrame,
+        c: str,
+        response_columns: list[str],
+        global_means: np.ndarray,
+    ) -> tuple[nw.DataFrame, np.ndarray]:
+        """Statistics for each level of column c, and the mean of the encodings of its parent levels
+        weighted by the weight of the level under each parent, from one group_by of c and
+        parent_column.
+
+        The encoding of each parent level is an m-estimate towards the global mean.
+        """
+        weight_column = "_count" if self.weights_column is None else "_weight"
+        total_columns = [*response_columns, weight_column]
 
-            else:
-                groupby_sum = X_y.groupby([c], observed=True)[
-                    ["weighted_response", self.weights_column]
-                ].sum()
+        statistics = self._response_statistics(
+            X_y,
+            [c, self.parent_column],
+            response_columns,
+        )
 
-                group_weight = groupby_sum[self.weights_column]
+        statistics = statistics.join(
+            statistics.group_by(self.parent_column).agg(
+                nw.col(r).sum().alias(f"{r}_parent") for r in total_columns
+            ),
+            on=self.parent_column,
+            how="left",
+        )
 
-                group_means = groupby_sum["weighted_response"] / group_weight
+        parent_sums, _, parent_weights = self._moments(
+            statistics,
+            response_columns,
+            [],
+            suffix="_parent",
+        )
+        _, _, weights = self._moments(statistics, response_columns, [])
 
-                self.mappings[c] = self._prior_regularisation(
-                    group_means,
-                    group_weight,
-                ).to_dict()
+        m = self.smoothing_strength
 
-            # to_dict changes types
-            for key in self.mappings[c]:
-                self.mappings[c][key] = self.cast_method(self.mappings[c][key])
+        parent_encodings = (parent_sums + m * global_means) / (parent_weights + m)
 
-    def fit(self, X: pd.DataFrame, y: pd.Series) -> pd.DataFrame:
-        """Identify mapping of categorical levels to mean response values.
+        native_namespace = nw.get_native_namespace(statistics)
 
-        If the user specified the weights_column arg in when initialising the transformer
-        the weighted mean response will be calculated using that column.
+        statistics = (
+            statistics.with_columns(
+                nw.new_series(
+                    f"_parent_encoding_{i}",
+                    parent_encodings[:, i] * weights[:, 0],
+                    nw.Float64,
+                    native_namespace=native_namespace,
+                )
+                for i in range(len(response_columns))
+            )
+            .group_by(c)
+            .agg(
+                nw.col(
+                    *dict.fromkeys([*total_columns, "_count"]),
+                    *[f"_parent_encoding_{i}" for i in range(len(response_columns))],
+                ).sum(),
+            )
+        )
 
-        In the multi-level case this method learns which response levels are present and
-        are to be encoded against.
+        _, _, weights = self._moments(statistics, response_columns, [])
 
-        Parameters
-        ----------
-        X : pd.DataFrame
-            Data to with catgeorical variable columns to transform and also containing response_column
-            column.
+        with np.errstate(divide="ignore", invalid="ignore"):
+            parent_means = (
+                statistics.select(
+                    f"_parent_encoding_{i}" for i in range(len(response_columns))
+                ).to_numpy()
+                / weights
+            )
 
-        y : pd.Series
-            Response variable or target.
+        return statistics, parent_means
+
+    def _weight_total(self) -> nw.Expr:
+        """Expression for the total weight of rows, named as in _response_statistics."""
+        if self.weights_column is None:
+            return nw.len().alias("_count")
+
+        return nw.col(self.weights_column).sum().alias("_weight")
+
+    def _response_statistics(
+        self,
+        X_y: nw.DataFrame,
+        keys: str | list[str],
+        response_columns: list[str],
+    ) -> nw.DataFrame:
+        """Sum of each (weighted) response column, number of rows and, if weights_column is set,
+        total weight for each combination of non-null keys, from a single group_by.
+
+        If weights_column is set the response columns of X_y should already be multiplied by the
+        weights. response_columns can include columns of squared responses.
+        """
+        weight = (
+            []
+            if self.weights_column is None
+            else [nw.col(self.weights_column).sum().alias("_weight")]
+        )
+
+        return X_y.group_by(keys, drop_null_keys=True).agg(
+            *[nw.col(r).sum() for r in response_columns],
+            *weight,
+            nw.len().alias("_count"),
+        )
+
+    def _unseen_level_encoding(
+        self,
+        encodings: np.ndarray,
+        counts: np.ndarray,
+    ) -> np.float32 | np.float64:
+        """Value to encode unseen levels with, from the encoding and number of rows of each level.
 
+        Mean and Median are over the encoded rows, so each level is weighted by its number of rows.
         """
-        BaseNominalTransformer.fit(self, X, y)
+        if isinstance(self.unseen_level_handling, (int, float)):
+            return self.cast_method(self.unseen_level_handling)
 
-        self.mappings = {}
-        self.unseen_levels_encoding_dict = {}
-        X_temp = X.copy()
+        if len(encodings) == 0:
+            return self.cast_method(np.nan)
 
-        if self.level:
-            if self.level == "all":
-                self.response_levels = y.unique()
+        if self.unseen_level_handling == "Mean":
+            return self.cast_method(np.average(encodings, weights=counts))
 
-            else:
-                if isinstance(self.level, str):
-                    self.level = [self.level]
+        if self.unseen_level_handling == "Median":
+            order = np.argsort(encodings, kind="stable")
+            row_ends = np.cumsum(counts[order])
+            # levels holding the middle row, or the two middle rows for an even number of rows
+            middle = np.searchsorted(
+                row_ends,
+                [(row_ends[-1] - 1) // 2 + 1, row_ends[-1] // 2 + 1],
+            )
+            return self.cast_method(encodings[order].take(middle).mean())
 
-                if any(level not in list(y.unique()) for level in self.level):
-                    msg = "Levels contains a level to encode against that is not present in the response."
-                    raise ValueError(msg)
+        if self.unseen_level_handling == "Lowest":
+            return self.cast_method(encodings.min())
 
-                self.response_levels = self.level
+        return self.cast_method(encodings.max())
 
-            self.transformer_dict = {}
-            mapped_columns = []
+    def _response_frame(
+        self,
+        X: nw.DataFrame,
+        y: nw.Series,
+        columns: list[str],
+        response_levels: list | None,
+    ) -> tuple[nw.DataFrame, list[str], list[str]]:
+        """Frame of columns and the (weighted) response, or a (weighted) indicator of each
+        response level in the multi-level case, to sum over the levels of each column.
 
-            for level in self.response_levels:
-                mapping_columns_for_this_level = [
-                    column + "_" + level for column in self.columns
-                ]
+        For 'empirical_bayes' smoothing the (weighted) squared response is also needed. In the
+        multi-level case these are the indicators themselves.
 
-                for column in self.columns:
-                    X_temp[column + "_" + level] = X[column].copy()
+        Returns the frame and the names of its response and squared response columns.
+        """
+        if self.weights_column is not None:
+            WeightColumnMixin.check_weights_column(self, X, self.weights_column)
 
-                # keep nans to preserve null check functionality of binary response MRE transformer
-                y_temp = y.apply(
-                    lambda x, level=level: x == level if not pd.isna(x) else np.nan,
-                )
+        response_null_count = y.is_null().sum()
 
-                self.transformer_dict[level] = self._fit_binary_response(
-                    X_temp,
-                    y_temp,
-                    mapping_columns_for_this_level,
-                )
+        if response_null_count > 0:
+            msg = f"{self.classname()}: y has {response_null_count} null values"
+            raise ValueError(msg)
 
-                mapped_columns += mapping_columns_for_this_level
+        weights = [] if self.weights_column is None else [self.weights_column]
 
-            self.mapped_columns = list(set(mapped_columns) - set(self.columns))
-            self.encoded_feature_columns = self.mapped_columns
+        if self.parent_column is not None:
+            if self.parent_column not in X.columns:
+                msg = f"{self.classname()}: parent_column ({self.parent_column}) is not in X"
+                raise ValueError(msg)
 
-        else:
-            self._fit_binary_response(X, y, self.columns)
-            self.encoded_feature_columns = self.columns
+            if X[self.parent_column].is_null().any():
+                msg = f"{self.classname()}: parent_column ({self.parent_column}) contains nulls"
+                raise ValueError(msg)
 
-        if isinstance(self.unseen_level_handling, (int, float)):
-            for c in self.encoded_feature_columns:
-                self.unseen_levels_encoding_dict[c] = self.cast_method(
-                    self.unseen_level_handling,
+        parent = [] if self.parent_column is None else [self.parent_column]
+
+        X_y = nw.from_native(
+            self._combine_X_y(X.select(*columns, *weights, *parent), y),
+        )
+        response = nw.col("_temporary_response")
+        weight = None if self.weights_column is None else nw.col(self.weights_column)
+
+        if response_levels is None:
+            response_columns = ["_temporary_response"]
+            square_columns = []
+
+            if self.smoothing == "empirical_bayes":
+                square_columns = ["_temporary_response_squared"]
+
+                squared = response * response
+                X_y = X_y.with_columns(
+                    (squared if weight is None else squared * weight).alias(
+                        "_temporary_response_squared",
+                    ),
                 )
 
+            if weight is not None:
+                X_y = X_y.with_columns(response * weight)
+
         else:
-            for c in self.encoded_feature_columns:
-                X_temp[c] = X_temp[c].map(self.mappings[c]).astype(self.return_type)
+            response_columns = [
+                f"_temporary_response_{i}" for i in range(len(response_levels))
+            ]
+
+            # replace the response by the position of its level once, so the one-hot encoding
+            # compares integers rather than response values
+            positions = dict(zip(response_levels, range(len(response_levels))))
+            y_levels = y.unique().to_list()
+
+            X_y = X_y.with_columns(
+                response.replace_strict(
+                    y_levels,
+                    [positions.get(level, -1) for level in y_levels],
+                    return_dtype=nw.Int64,
+                ),
+            )
 
-                if self.unseen_level_handling == "Mean":
-                    self.unseen_levels_encoding_dict[c] = X_temp[c].mean()
+            # without weights the indicators only need to be Int8, they are summed as Int64
+            if weight is None:
+                indicators = [(response == i).cast(nw.Int8) for i in positions.values()]
+            else:
+                indicators = [
+                    (response == i).cast(nw.Float64) * weight
+                    for i in positions.values()
+                ]
 
-                if self.unseen_level_handling == "Median":
-                    self.unseen_levels_encoding_dict[c] = X_temp[c].median()
+            X_y = X_y.with_columns(
+                indicator.alias(r) for indicator, r in zip(indicators, response_columns)
+            )
 
-                if self.unseen_level_handling == "Lowest":
-                    self.unseen_levels_encoding_dict[c] = X_temp[c].min()
+            square_columns = (
+                response_columns if self.smoothing == "empirical_bayes" else []
+            )
 
-                if self.unseen_level_handling == "Highest":
-                    self.unseen_levels_encoding_dict[c] = X_temp[c].max()
+        return X_y, response_columns, square_columns
 
-        return self
+    def _fit_response_levels(
+        self,
+        X: nw.DataFrame,
+        y: nw.Series,
+        columns: list[str],
+        response_levels: list | None,
+    ) -> None:
+        """Learn the mean response mappings of every column for a binary or continuous response, or
+        for each level of a categorical response.
 
-    def map_imputation_values(self, X: pd.DataFrame) -> pd.DataFrame:
-        """maps columns defined by self.columns in X according the the corresponding mapping dictionary contained in self.mappings
+        In the multi-level case the response is one-hot encoded once, then the sums for all response
+        levels are calculated in the same group_by of each column, and the prior regularisation or
+        smoothing is applied to all levels of the column and response at once.
 
         Parameters
         ----------
-        X : pd.DataFrame
-            Data to with catgeorical variable columns to transform.
+        X : nw.DataFrame
+            Data with categorical variable columns to encode.
 
-        Returns
-        -------
-        X : pd.DataFrame
-            input dataframe with mappings applied
+        y : nw.Series
+            Response variable to encode against.
+
+        columns : list(str)
+            Columns to be encoded.
+
+        response_levels : list or None
+            Levels of y to encode against, or None for a binary or continuous response.
+
+        """
+        X_y, response_columns, square_columns = self._response_frame(
+            X,
+            y,
+            columns,
+            response_levels,
+        )
+
+        sum_columns = list(dict.fromkeys([*response_columns, *square_columns]))
+
+        global_sums, global_squares, total_weight = self._moments(
+            X_y.select(nw.col(*sum_columns).sum(), self._weight_total()),
+            response_columns,
+            square_columns,
+        )
+
+        global_means = global_sums / total_weight
+
+        global_variances = (
+            None
+            if global_squares is None
+            else global_squares / total_weight - global_means**2
+        )
+
+        if response_levels is None:
+            self.global_mean = global_means[0, 0]
+        else:
+            self.global_mean = dict(zip(response_levels, global_means[0]))
+
+        for c in columns:
+            parent_means = None
+
+            if self.smoothing == "hierarchical":
+                statistics, parent_means = self._hierarchical_statistics(
+                    X_y,
+                    c,
+                    response_columns,
+                    global_means,
+                )
+            else:
+                statistics = self._response_statistics(X_y, c, sum_columns)
+
+            levels = statistics[c].to_list()
+            counts = statistics["_count"].to_numpy()
+
+            sums, squares, weights = self._moments(
+                statistics,
+                response_columns,
+                square_columns,
+            )
+
+            within_variances, between_variances = (
+                self._empirical_bayes_variances(
+                    sums,
+                    squares,
+                    weights,
+                    global_means,
+                    global_variances,
+                )
+                if self.smoothing == "empirical_bayes"
+                else (None, None)
+            )
+
+            encodings = self._smoothed_encodings(
+                sums,
+                weights,
+                global_means,
+                within_variances=within_variances,
+                between_variances=between_variances,
+                parent_means=parent_means,
+            ).astype(self.return_type)
+
+            if response_levels is None:
+                mapped_columns = [c]
+            else:
+                mapped_columns = [c + "_" + level for level in response_levels]
+
+            for i, mapped_column in enumerate(mapped_columns):
+                self.mappings[mapped_column] = dict(zip(levels, encodings[:, i]))
+
+                if self.unseen_level_handling is not None:
+                    self.unseen_levels_encoding_dict[mapped_column] = (
+                        self._unseen_level_encoding(encodings[:, i], counts)
+                    )
+
+    @nw.narwhalify
+    def _fit_binary_response(
+        self,
+        X: FrameT,
+        y: nw.Series,
+        columns: list[str],
+    ) -> None:
+        """Function to learn the MRE mappings for a given binary or continuous response.
+
+        Parameters
+        ----------
+        X : pd/pl.DataFrame
+            Data to with catgeorical variable columns to transform.
+
+        y : pd/pl.Series
+            Binary or contionuous response variable to encode against.
+
+        columns : list(str)
+            Columns to be encoded.
         """
+        self._fit_response_levels(X, y, columns, None)
+
+    @nw.narwhalify
+    def fit(self, X: FrameT, y: nw.Series) -> MeanResponseTransformer:
+        """Identify mapping of categorical levels to mean response values.
+
+        If the user specified the weights_column arg in when initialising the transformer
+        the weighted mean response will be calculated using that column.
+
+        In the multi-level case this method learns which response levels are present and
+        are to be encoded against.
+
+        Parameters
+        ----------
+        X : pd/pl.DataFrame
+            Data to with catgeorical variable columns to transform and also containing response_column
+            column.
+
+        y : pd/pl.Series
+            Response variable or target.
+
+        """
+        BaseNominalTransformer.fit(self, X, y)
+
+        self.mappings = {}
+        self.unseen_levels_encoding_dict = {}
+
+        if self.level:
+            if self.level == "all":
+                self.response_levels = (
+                    y.drop_nulls().unique(maintain_order=True).to_list()
+                )
+
+            else:
+                if isinstance(self.level, str):
+                    self.level = [self.level]
+
+                if any(level not in y.unique().to_list() for level in self.level):
+                    msg = "Levels contains a level to encode against that is not present in the response."
+                    raise ValueError(msg)
+
+                self.response_levels = self.level
+
+            self._fit_response_levels(X, y, self.columns, self.response_levels)
+
+            self.mapped_columns = [
+                column + "_" + level
+                for level in self.response_levels
+                for column in self.columns
+                if column + "_" + level not in self.columns
+            ]
+            self.encoded_feature_columns = self.mapped_columns
+
+        else:
+            self._fit_response_levels(X, y, self.columns, None)
+            self.encoded_feature_columns = self.columns
+
+        return self
+
+    def _out_of_fold_encodings(
+        self,
+        X_y: nw.DataFrame,
+        c: str,
+        response_columns: list[str],
+        square_columns: list[str],
+        fold_global_means: np.ndarray,
+        fold_global_variances: np.ndarray | None,
+    ) -> tuple[nw.DataFrame, np.ndarray]:
+        """Encodings of each level of column c for each fold, from the statistics of the other
+        folds. These are the totals for the level less the statistics of the fold, so all folds
+        come from one group_by of the level and fold.
+
+        Returns the levels and folds, and the encoding of each against each response column.
+        Where a level only appears in one fold the fold is encoded with the global mean of the
+        other folds.
+        """
+        sum_columns = list(dict.fromkeys([*response_columns, *square_columns]))
+
+        statistics = self._response_statistics(X_y, [c, "_fold"], sum_columns)
+
+        folds = statistics["_fold"].to_numpy()
+
+        # position of the level of each row of statistics, with nulls as a level of their own
+        levels, _ = pd.factorize(statistics[c].to_numpy(), use_na_sentinel=False)
+
+        # statistics of every level in each fold, zero where the level is not in the fold, so the
+        # statistics of the other folds are the totals over folds less those of the fold
+        other_moments = []
+        for moment in self._moments(statistics, response_columns, square_columns):
+            if moment is None:
+                other_moments.append(None)
+                continue
+
+            fold_moment = np.zeros((self.cv, levels.max() + 1, moment.shape[1]))
+            fold_moment[folds, levels] = moment
+
+            other_moments.append(fold_moment.sum(axis=0) - fold_moment)
+
+        other_sums, other_squares, other_weights = other_moments
+
+        within_variances = between_variances = None
+
+        if self.smoothing == "empirical_bayes":
+            # each fold is smoothed as if fit on the other folds, with all levels seen in them
+            fold_variances = [
+                self._empirical_bayes_variances(
+                    other_sums[fold],
+                    other_squares[fold],
+                    other_weights[fold],
+                    fold_global_means[fold : fold + 1],
+                    fold_global_variances[fold : fold + 1],
+                )
+                for fold in range(self.cv)
+            ]
+
+            within_variances, between_variances = (
+                np.concatenate(variances)[folds] for variances in zip(*fold_variances)
+            )
+
+        global_means = fold_global_means[folds]
+        other_weight = other_weights[folds, levels]
+
+        encodings = self._smoothed_encodings(
+            other_sums[folds, levels],
+            other_weight,
+            global_means,
+            within_variances=within_variances,
+            between_variances=between_variances,
+        )
+
+        encodings = np.where(other_weight > 0, encodings, global_means)
+
+        return statistics.select(c, "_fold"), encodings.astype(self.return_type)
+
+    @nw.narwhalify
+    def _out_of_fold_transform(self, X: FrameT, y: nw.Series) -> FrameT:
+        """Encode X with out-of-fold mean responses, where the rows of each of cv folds are
+        encoded with the mappings that would be learnt from the other folds.
+
+        The statistics for every fold come from a single group_by of each column and fold.
+        """
+        response_levels = self.response_levels if self.level else None
+
+        X_y, response_columns, square_columns = self._response_frame(
+            X,
+            y,
+            self.columns,
+            response_levels,
+        )
+
+        n_rows = X_y.shape[0]
+
+        if n_rows < self.cv:
+            msg = f"{self.classname()}: X has fewer rows ({n_rows}) than cv folds ({self.cv})"
+            raise ValueError(msg)
+
+        folds = np.arange(n_rows) * self.cv // n_rows
+
+        if self.random_state is not None:
+            folds = np.random.default_rng(self.random_state).permutation(folds)
+
+        native_namespace = nw.get_native_namespace(X_y)
+
+        X_y = X_y.with_columns(
+            nw.new_series("_fold", folds, nw.Int64, native_namespace=native_namespace),
+        )
+
+        sum_columns = list(dict.fromkeys([*response_columns, *square_columns]))
+
+        fold_sums, fold_squares, fold_weights = self._moments(
+            X_y.group_by("_fold")
+            .agg(nw.col(*sum_columns).sum(), self._weight_total())
+            .sort("_fold"),
+            response_columns,
+            square_columns,
+        )
+
+        # global mean and variance of the rows outside each fold
+        other_weights = fold_weights.sum() - fold_weights
+
+        fold_global_means = (fold_sums.sum(axis=0) - fold_sums) / other_weights
+
+        fold_global_variances = (
+            None
+            if fold_squares is None
+            else (fold_squares.sum(axis=0) - fold_squares) / other_weights
+            - fold_global_means**2
+        )
+
+        return_dtype = nw.Float64 if self.return_type == "float64" else nw.Float32
+
+        encoded_columns = {}
+
         for c in self.columns:
-            X[c] = X[c].map(self.mappings[c]).astype(self.return_type)
+            if self.unseen_level_handling is None and X_y[c].is_null().any():
+                msg = f"{self.classname()}: nulls would be introduced into column {c} from levels not present in mapping"
+                raise ValueError(msg)
+
+            levels_folds, encodings = self._out_of_fold_encodings(
+                X_y,
+                c,
+                response_columns,
+                square_columns,
+                fold_global_means,
+                fold_global_variances,
+            )
+
+            if self.level:
+                mapped_columns = [c + "_" + level for level in self.response_levels]
+            else:
+                mapped_columns = [c]
+
+            row_encodings = X_y.select(c, "_fold").join(
+                levels_folds.with_columns(
+                    nw.new_series(
+                        f"_encoding_{i}",
+                        encodings[:, i],
+                        return_dtype,
+                        native_namespace=native_namespace,
+                    )
+                    for i in range(len(mapped_columns))
+                ),
+                on=[c, "_fold"],
+                how="left",
+            )
+
+            for i, mapped_column in enumerate(mapped_columns):
+                # only null levels are not matched, encoded as unseen levels
+                encoded = row_encodings[f"_encoding_{i}"]
+
+                if self.unseen_level_handling is not None:
+                    encoded = encoded.fill_null(
+                        float(self.unseen_levels_encoding_dict[mapped_column]),
+                    )
+
+                encoded_columns[mapped_column] = nw.new_series(
+                    mapped_column,
+                    encoded.to_numpy(),
+                    return_dtype,
+                    native_namespace=native_namespace,
+                )
+
+        X = nw.from_native(BaseTransformer.transform(self, X))
+
+        if self.level:
+            X = X.with_columns(
+                encoded_columns[c + "_" + level]
+                for level in self.response_levels
+                for c in self.columns
+            ).drop(self.columns)
+
+        else:
+            X = X.with_columns(encoded_columns.values())
 
         return X
 
-    def transform(self, X: pd.DataFrame) -> pd.DataFrame:
+    def fit_transform(
+        self,
+        X: FrameT,
+        y: nw.Series,
+        **fit_params: dict,
+    ) -> FrameT:
+        """Fit to X and y, then transform X.
+
+        If cv is set the rows of X are encoded out-of-fold, with the mean responses of the other
+        cv folds, rather than with the mappings learnt from all of X and y which are used by
+        transform.
+
+        Parameters
+        ----------
+        X : pd/pl.DataFrame
+            Data with categorical variable columns to encode.
+
+        y : pd/pl.Series
+            Response variable or target.
+
+        **fit_params
+            Additional keyword arguments passed to fit.
+
+        Returns
+        -------
+        X : pd/pl.DataFrame
+            Encoded X.
+
+        """
+        if self.cv is None:
+            return super().fit_transform(X, y, **fit_params)
+
+        self.fit(X, y, **fit_params)
+
+        return self._out_of_fold_transform(X, y)
+
+    def map_imputation_values(self, X: pd.DataFrame) -> pd.DataFrame:
+        """maps columns defined by self.columns in X according the the corresponding mapping dictionary contained in self.mappings
+
+        Parameters
+        ----------
+        X : pd.DataFrame
+            Data to with catgeorical variable columns to transform.
+
+        Returns
+        -------
+        X : pd.DataFrame
+            input dataframe with mappings applied
+        """
+        for c in self.columns:
+            _, values = self._compiled_mapping(c)
+
+            # position -1, for levels not in the mapping, takes the null added at the end
+            encodings = np.append(values.to_numpy(), np.nan).astype(self.return_type)
+
+            if isinstance(X[c].dtype, pd.CategoricalDtype):
+                # encode each category once, then take the encoding of each row by its code
+                X[c] = encodings.take(self._category_positions(c, X[c])).take(
+                    X[c].cat.codes.to_numpy(),
+                )
+
+            else:
+                X[c] = encodings.take(self._mapping_positions(c, X[c]))
+
+        return X
+
+    def _transform_narwhals(self, X: FrameT) -> FrameT:
+        """Apply the mean response encodings with narwhals replace_strict expressions, adding
+        the columns encoded against every response level in one with_columns call.
+        """
+        X = nw.from_native(BaseTransformer.transform(self, X))
+
+        self.check_is_fitted(["mappings"])
+
+        return_dtype = nw.Float64 if self.return_type == "float64" else nw.Float32
+
+        schema = X.collect_schema()
+
+        # categorical levels are looked up as strings, so categories need not be remapped
+        values = {
+            c: nw.col(c).cast(nw.String) if schema[c] == nw.Categorical else nw.col(c)
+            for c in self.columns
+        }
+
+        uniques = {
+            c: X.select(values[c]).get_column(c).drop_nulls().unique()
+            for c in self.columns
+        }
+
+        if self.level:
+            mapped_columns = [
+                (c, c + "_" + level)
+                for level in self.response_levels
+                for c in self.columns
+            ]
+        else:
+            mapped_columns = [(c, c) for c in self.columns]
+
+        encoding_expressions = []
+
+        for c, mapped_column in mapped_columns:
+            mapping = self.mappings[mapped_column]
+
+            unseen = uniques[c].filter(~uniques[c].is_in(list(mapping))).to_list()
+
+            if self.unseen_level_handling is None:
+                if unseen or X[c].is_null().any():
+                    msg = f"{self.classname()}: nulls would be introduced into column {c} from levels not present in mapping"
+                    raise ValueError(msg)
+
+                unseen_encoding = None
+
+            else:
+                unseen_encoding = float(
+                    self.unseen_levels_encoding_dict[mapped_column],
+                )
+
+            encoding = values[c].replace_strict(
+                [*mapping, *unseen],
+                [*map(float, mapping.values()), *[unseen_encoding] * len(unseen)],
+                return_dtype=return_dtype,
+            )
+
+            if unseen_encoding is not None:
+                encoding = encoding.fill_null(unseen_encoding)
+
+            encoding_expressions.append(encoding.alias(mapped_column))
+
+        X = X.with_columns(encoding_expressions)
+
+        if self.level:
+            X = X.drop(self.columns)
+
+        return X
+
+    @nw.narwhalify
+    def transform(self, X: FrameT) -> FrameT:
         """Transform method to apply mean response encoding stored in the mappings attribute to
         each column in the columns attribute.
 
@@ -872,15 +1786,21 @@ class MeanResponseTransformer(BaseNominalTransformer, WeightColumnMixin):
 
         Parameters
         ----------
-        X : pd.DataFrame
+        X : pd/pl.DataFrame
             Data with nominal columns to transform.
 
         Returns
         -------
-        X : pd.DataFrame
+        X : pd/pl.DataFrame
             Transformed input X with levels mapped accoriding to mappings dict.
 
         """
+        native_X = nw.to_native(X, pass_through=True)
+
+        if not isinstance(native_X, pd.DataFrame):
+            return self._transform_narwhals(X)
+
+        X = native_X
 
         if self.level:
             for response_level in self.response_levels:
@@ -895,7 +1815,7 @@ class MeanResponseTransformer(BaseNominalTransformer, WeightColumnMixin):
             unseen_indices = {}
             for c in self.columns:
                 # finding rows with values not in the keys of mappings dictionary
-                unseen_indices[c] = X[~X[c].isin(self.mappings[c].keys())].index
+                unseen_indices[c] = X[self._mapping_positions(c, X[c]) == -1].index
             # BaseTransformer.transform as we do not want to run check_mappable_rows in BaseNominalTransformer
             X = BaseTransformer.transform(self, X)
         else:
@@ -955,7 +1875,7 @@ class OrdinalEncoderTransformer(
 
     """
 
-    polars_compatible = False
+    polars_compatible = True
 
     FITS = True
 
@@ -969,102 +1889,149 @@ class OrdinalEncoderTransformer(
 
         BaseNominalTransformer.__init__(self, columns=columns, **kwargs)
 
-    def fit(self, X: pd.DataFrame, y: pd.Series) -> pd.DataFrame:
+    @nw.narwhalify
+    def fit(self, X: FrameT, y: nw.Series) -> OrdinalEncoderTransformer:
         """Identify mapping of categorical levels to rank-ordered integer values by target-mean in ascending order.
 
         If the user specified the weights_column arg in when initialising the transformer
         the weighted mean response will be calculated using that column.
 
+        The (weighted) response and total weight of each level come from a single group_by of each
+        column. Levels are then ranked with a stable argsort of their means, so levels with the same
+        mean are ranked in sorted order of the levels.
+
         Parameters
         ----------
-        X : pd.DataFrame
+        X : pd/pl.DataFrame
             Data to with catgeorical variable columns to transform and response_column column
             specified when object was initialised.
 
-        y : pd.Series
+        y : pd/pl.Series
             Response column or target.
 
         """
         BaseNominalTransformer.fit(self, X, y)
 
-        self.mappings = {}
-
         if self.weights_column is not None:
             WeightColumnMixin.check_weights_column(self, X, self.weights_column)
 
-        response_null_count = y.isna().sum()
+        response_null_count = y.is_null().sum()
 
         if response_null_count > 0:
             msg = f"{self.classname()}: y has {response_null_count} null values"
             raise ValueError(msg)
 
-        X_y = self._combine_X_y(X, y)
-        response_column = "_temporary_response"
+        weights = [] if self.weights_column is None else [self.weights_column]
 
-        for c in self.columns:
-            if self.weights_column is None:
-                # get the indexes of the sorted target mean-encoded dict
-                _idx_target_mean = list(
-                    X_y.groupby([c])[response_column]
-                    .mean()
-                    .sort_values(ascending=True, kind="mergesort")
-                    .index,
-                )
+        X_y = nw.from_native(self._combine_X_y(X.select(*self.columns, *weights), y))
+        response = nw.col("_temporary_response")
 
-                # create a dictionary whose keys are the levels of the categorical variable
-                # sorted ascending by their target-mean value
-                # and whose values are ascending ordinal integers
-                ordinal_encoded_dict = {
-                    k: _idx_target_mean.index(k) + 1 for k in _idx_target_mean
-                }
+        if self.weights_column is None:
+            total_weight = nw.len().alias("_weight")
 
-                self.mappings[c] = ordinal_encoded_dict
+        else:
+            X_y = X_y.with_columns(response * nw.col(self.weights_column))
+            total_weight = nw.col(self.weights_column).sum().alias("_weight")
 
-            else:
-                groupby_sum = X_y.groupby([c])[
-                    [response_column, self.weights_column]
-                ].sum()
-
-                # get the indexes of the sorted target mean-encoded dict
-                _idx_target_mean = list(
-                    (groupby_sum[response_column] / groupby_sum[self.weights_column])
-                    .sort_values(ascending=True, kind="mergesort")
-                    .index,
-                )
+        mappings = {}
+
+        for c in self.columns:
+            statistics = (
+                X_y.group_by(c, drop_null_keys=True)
+                .agg(response.sum(), total_weight)
+                .sort(c)
+            )
+
+            means = (
+                statistics["_temporary_response"].to_numpy()
+                / statistics["_weight"].to_numpy()
+            )
 
-                # create a dictionary whose keys are the levels of the categorical variable
-                # sorted ascending by their target-mean value
-                # and whose values are ascending ordinal integers
-                ordinal_encoded_dict = {
-                    k: _idx_target_mean.index(k) + 1 for k in _idx_target_mean
-                }
+            levels = np.array(statistics[c].to_list(), dtype=object)
 
-                self.mappings[c] = ordinal_encoded_dict
+            # ascending ordinal integers for the levels sorted by their (weighted) mean response
+            mappings[c] = dict(
+                zip(
+                    levels[np.argsort(means, kind="stable")].tolist(),
+                    range(1, len(levels) + 1),
+                ),
+            )
+
+        self.mappings = mappings
 
         return self
 
-    def transform(self, X: pd.DataFrame) -> pd.DataFrame:
+    def _transform_narwhals(self, X: nw.DataFrame) -> nw.DataFrame:
+        """Apply the ordinal encodings with narwhals replace_strict expressions."""
+        schema = X.collect_schema()
+
+        encoding_expressions = []
+
+        for c in self.columns:
+            mapping = self.mappings[c]
+
+            # categorical levels are looked up as strings, so categories need not be remapped
+            values = (
+                nw.col(c).cast(nw.String) if schema[c] == nw.Categorical else nw.col(c)
+            )
+
+            uniques = X.select(values).get_column(c).drop_nulls().unique()
+
+            if (~uniques.is_in(list(mapping))).any() or X[c].is_null().any():
+                msg = f"{self.classname()}: nulls would be introduced into column {c} from levels not present in mapping"
+                raise ValueError(msg)
+
+            encoding_expressions.append(
+                values.replace_strict(
+                    list(mapping),
+                    list(mapping.values()),
+                    return_dtype=nw.Int64,
+                ).alias(c),
+            )
+
+        return X.with_columns(encoding_expressions)
+
+    @nw.narwhalify
+    def transform(self, X: FrameT) -> FrameT:
         """Transform method to apply ordinal encoding stored in the mappings attribute to
         each column in the columns attribute. This maps categorical levels to rank-ordered integer values by target-mean in ascending order.
 
-        This method calls the check_mappable_rows method from BaseNominalTransformer to check that
-        all rows can be mapped then transform from BaseMappingTransformMixin to apply the
-        standard pd.Series.map method.
+        For pandas DataFrames the position of each value in the levels of the mapping is looked up
+        once, which both checks that all rows can be mapped and gives the integer to take for each
+        row. For categorical columns only the categories are looked up.
 
         Parameters
         ----------
-        X : pd.DataFrame
+        X : pd/pl.DataFrame
             Data to with catgeorical variable columns to transform.
 
         Returns
         -------
-        X : pd.DataFrame
+        X : pd/pl.DataFrame
             Transformed data with levels mapped to ordinal encoded values for categorical variables.
 
         """
-        X = super().transform(X)
+        X = nw.from_native(BaseTransformer.transform(self, X))
+
+        self.check_is_fitted(["mappings"])
+
+        native_X = X.to_native()
+
+        if not isinstance(native_X, pd.DataFrame):
+            return self._transform_narwhals(X)
+
+        for c in self.columns:
+            _, values = self._compiled_mapping(c)
+
+            positions = self._mapping_positions(c, native_X[c])
+
+            if (positions == -1).any():
+                msg = f"{self.classname()}: nulls would be introduced into column {c} from levels not present in mapping"
+                raise ValueError(msg)
+
+            native_X[c] = values.to_numpy().take(positions)
 
-        return BaseMappingTransformMixin.transform(self, X)
+        return native_X
 
 
 class OneHotEncodingTransformer(
@@ -1074,7 +2041,15 @@ class OneHotEncodingTransformer(
 ):
     """Transformer to convert categorical variables into dummy columns.
 
-    Extends the sklearn OneHotEncoder class to provide easy renaming of dummy columns.
+    The levels of each column, and the names of their dummy columns, are learnt in fit. In transform
+    each row's level is looked up in the fitted levels once, giving an integer code per row, and the
+    dummies are set from the codes. Levels not seen in fit are encoded as all zeroes.
+
+    The number of dummy columns can be bounded by keeping only the most frequent levels, with top_k,
+    or levels above a frequency, with min_frequency. The other levels, and levels not seen in fit,
+    are then encoded in a single other_level indicator column. Both are applied to the counts of
+    each level from the value_counts of each column in fit, so no separate step grouping rare
+    levels is needed.
 
     Parameters
     ----------
@@ -1095,8 +2070,33 @@ class OneHotEncodingTransformer(
     verbose : bool, default = True
         Should warnings/checkmarks get displayed?
 
+    dtype : numpy dtype, default = np.int8
+        Type of the dummy columns.
+
+    sparse_output : bool, default = False
+        Should the dummy columns be added to X as pandas SparseDtype columns with a fill value of 0,
+        so only the 1s are stored? Only available for pandas DataFrames. Use transform_sparse to get
+        the dummies as a scipy CSR matrix instead.
+
+    max_levels : int or None, default = 100
+        Maximum number of levels a column can have, after any pruning with top_k and min_frequency,
+        before fit raises an error. If None there is no limit.
+
+    top_k : int or None, default = None
+        If set only the top_k most frequent levels of each column are given dummy columns. Ties are
+        broken by the order of the levels.
+
+    min_frequency : int, float or None, default = None
+        If set only levels appearing at least this many times, or in at least this proportion of
+        rows if a float between 0 and 1, are given dummy columns.
+
+    other_level : str, default = "other"
+        Level used to name the indicator column for levels without their own dummy column, when
+        top_k or min_frequency is set.
+
     **kwargs
-        Arbitrary keyword arguments passed onto sklearn OneHotEncoder.init method.
+        Arbitrary keyword arguments passed onto BaseTransformer.init method. Arguments of sklearn's
+        OneHotEncoder, which this transformer no longer wraps, raise an error.
 
     Attributes
     ----------
@@ -1106,15 +2106,46 @@ class OneHotEncodingTransformer(
     drop_original : bool
         Should original columns be dropped after creating dummy fields?
 
+    sparse_output : bool
+        Are the dummy columns added as pandas SparseDtype columns?
+
+    max_levels : int or None
+        Maximum number of levels each column can have.
+
+    top_k : int or None
+        Number of most frequent levels given dummy columns, if set.
+
+    min_frequency : int, float or None
+        Minimum count or proportion of rows of levels given dummy columns, if set.
+
+    other_level : str
+        Level naming the indicator column for levels without their own dummy column.
+
+    categories_ : list of np.ndarray
+        Sorted levels of each column given dummy columns, in the order of columns.
+
+    dummy_columns_ : dict
+        Names of the dummy columns created for each column, one per level in categories_ followed by
+        the other_level indicator if top_k or min_frequency is set.
+
     polars_compatible : bool
         class attribute, indicates whether transformer has been converted to polars/pandas agnostic narwhals framework
 
     """
 
-    polars_compatible = False
+    polars_compatible = True
 
     FITS = True
 
+    # arguments of sklearn's OneHotEncoder, which were passed on by kwargs when it was wrapped
+    _removed_encoder_arguments = (
+        "categories",
+        "drop",
+        "handle_unknown",
+        "max_categories",
+        "feature_name_combiner",
+    )
+
     def __init__(
         self,
         columns: str | list[str] | None = None,
@@ -1123,36 +2154,82 @@ class OneHotEncodingTransformer(
         copy: bool | None = None,
         verbose: bool = False,
         dtype: np.int8 = np.int8,
+        sparse_output: bool = False,
+        max_levels: int | None = 100,
+        top_k: int | None = None,
+        min_frequency: float | None = None,
+        other_level: str = "other",
         **kwargs: dict[str, bool],
     ) -> None:
+        removed_arguments = [
+            argument
+            for argument in self._removed_encoder_arguments
+            if argument in kwargs
+        ]
+
+        if removed_arguments:
+            msg = (
+                f"{self.classname()}: {removed_arguments} are arguments of sklearn's OneHotEncoder, "
+                "which is no longer used so they are not supported. Levels are learnt in fit and top_k "
+                "or min_frequency limit the number of levels. Unseen levels are encoded as all "
+                "zeroes, or in the other_level column if top_k or min_frequency is set"
+            )
+            raise TypeError(msg)
+
+        if not isinstance(sparse_output, bool):
+            msg = f"{self.classname()}: sparse_output should be a bool"
+            raise TypeError(msg)
+
+        for name, value in [("max_levels", max_levels), ("top_k", top_k)]:
+            if value is not None and (type(value) is not int or value < 1):
+                msg = f"{self.classname()}: {name} should be None or a positive int"
+                raise ValueError(msg)
+
+        if min_frequency is not None and not (
+            (type(min_frequency) is int and min_frequency >= 1)
+            or (type(min_frequency) is float and 0 < min_frequency < 1)
+        ):
+            msg = f"{self.classname()}: min_frequency should be None, a positive int or a float between 0 and 1"
+            raise ValueError(msg)
+
+        if not isinstance(other_level, str):
+            msg = f"{self.classname()}: other_level should be a str"
+            raise TypeError(msg)
+
+        self.sparse_output = sparse_output
+        self.max_levels = max_levels
+        self.top_k = top_k
+        self.min_frequency = min_frequency
+        self.other_level = other_level
+
         BaseTransformer.__init__(
             self,
             columns=columns,
             verbose=verbose,
             copy=copy,
+            **kwargs,
         )
 
         # Set the dtype attribute
         self.dtype = dtype
 
-        # Create an instance of OneHotEncoder and assign it to _encoder
-        self._encoder = OneHotEncoder(
-            sparse_output=False,
-            handle_unknown="ignore",
-            dtype=dtype,
-            **kwargs,
-        )
-
         self.set_drop_original_column(drop_original)
         self.check_and_set_separator_column(separator)
 
-    def fit(self, X: pd.DataFrame, y: pd.Series | None = None) -> pd.DataFrame:
+    def _null_error(self, c: str) -> ValueError:
+        """Error for nulls in column c, which cannot be encoded."""
+        return ValueError(
+            f"{self.classname()}: column %s has nulls - replace before proceeding" % c,
+        )
+
+    @nw.narwhalify
+    def fit(self, X: FrameT, y: nw.Series | None = None) -> OneHotEncodingTransformer:
         """Gets list of levels for each column to be transformed. This defines which dummy columns
         will be created in transform.
 
         Parameters
         ----------
-        X : pd.DataFrame
+        X : pd.DataFrame or pl.DataFrame
             Data to identify levels from.
 
         y : None
@@ -1161,142 +2238,465 @@ class OneHotEncodingTransformer(
         """
         BaseTransformer.fit(self, X=X, y=y)
 
-        # Check for nulls
-        for c in self.columns:
-            if X[c].isna().sum() > 0:
-                raise ValueError(
-                    f"{self.classname()}: column %s has nulls - replace before proceeding"
-                    % c,
-                )
+        self.categories_ = []
+        self.dummy_columns_ = {}
+        self._level_indexes = {}
 
-        # Check each field has less than 100 categories/levels
         for c in self.columns:
-            levels = X[c].unique().tolist()
+            level_counts = X[c].value_counts()
+
+            # Check for nulls
+            if level_counts[c].is_null().any():
+                raise self._null_error(c)
+
+            # pandas categoricals also count unobserved categories
+            level_counts = level_counts.filter(nw.col("count") > 0)
 
-            if len(levels) > 100:
+            levels = level_counts[c].to_numpy()
+            counts = level_counts["count"].to_numpy()
+
+            order = np.argsort(levels, kind="stable")
+            levels, counts = levels[order], counts[order]
+
+            if self._prunes_levels():
+                keep = self._kept_levels(counts, X.shape[0])
+                levels = levels[keep]
+
+            # Check each field has at most max_levels categories/levels
+            if self.max_levels is not None and len(levels) > self.max_levels:
                 raise ValueError(
-                    f"{self.classname()}: column %s has over 100 unique values - consider another type of encoding"
+                    f"{self.classname()}: column %s has over {self.max_levels} unique values - consider another type of encoding"
                     % c,
                 )
 
-        self._encoder.fit(X[self.columns], y=y)
+            self.categories_.append(levels)
+            self.dummy_columns_[c] = [c + self.separator + str(lvl) for lvl in levels]
+            # lookup table from level to the position of its dummy column
+            self._level_indexes[c] = pd.Index(levels)
 
-        # Set the categories_ attribute to ensure check_is_fitted works
-        self.categories_ = self._encoder.categories_
+            if self._prunes_levels():
+                if self.other_level in self._level_indexes[c]:
+                    msg = f"{self.classname()}: other_level ({self.other_level}) is a level of column {c} with its own dummy column"
+                    raise ValueError(msg)
+
+                self.dummy_columns_[c].append(c + self.separator + self.other_level)
 
         return self
 
-    def _get_feature_names(
-        self,
-        input_features: list[str],
-        **kwargs: dict[str, bool],
-    ) -> list[str]:
-        """Function to access the get_feature_names attribute of the scikit learn attribute. Will return the output columns of the OHE transformer.
+    def _prunes_levels(self) -> bool:
+        """Whether levels are pruned to those given dummy columns, with an other_level indicator."""
+        return self.top_k is not None or self.min_frequency is not None
 
-        In scikit learn 1.0 "get_feature_names" was deprecated and then replaced with "get_feature_names_out" in version 1.2. The logic in this
-        function will call the correct attribute, or raise an error if it can't be found.
+    def _kept_levels(self, counts: np.ndarray, n_rows: int) -> np.ndarray:
+        """Boolean mask of the levels given dummy columns, from the counts of the sorted levels
+        of a column."""
+        keep = np.ones(len(counts), dtype=bool)
 
-        Parameters
-        ----------
-        input_features : list[str]
-            Input columns being transformed by the OHE transformer.
+        if self.min_frequency is not None:
+            min_count = (
+                self.min_frequency
+                if type(self.min_frequency) is int
+                else self.min_frequency * n_rows
+            )
+            keep &= counts >= min_count
+
+        if self.top_k is not None:
+            # stable sort of the sorted levels, so ties are broken by level
+            most_frequent = np.argsort(-counts, kind="stable")[: self.top_k]
+            in_top_k = np.zeros(len(counts), dtype=bool)
+            in_top_k[most_frequent] = True
 
-        kwargs : dict
-            Keyword arguments to be passed on to the scikit learn attribute.
+            keep &= in_top_k
+
+        return keep
+
+    def _level_codes(self, X: nw.DataFrame, c: str) -> np.ndarray:
+        """Position of the level of each row of column c in its fitted levels, or -1 for levels
+        not seen in fit. If levels were pruned in fit, levels without a dummy column are instead
+        given the position of the other_level indicator.
+
+        Nulls, which are never fitted levels, are also -1, so checking for nulls and warning about
+        unseen levels only needs the rows not found in the lookup.
         """
-        if hasattr(self._encoder, "get_feature_names"):
-            input_columns = self._encoder.get_feature_names(
-                input_features=input_features,
-                **kwargs,
+        native = nw.to_native(X[c])
+        level_index = self._level_indexes[c]
+
+        # look up the categories rather than the value of every row
+        if isinstance(native, pd.Series) and isinstance(
+            native.dtype,
+            pd.CategoricalDtype,
+        ):
+            # null rows have code -1, so take the appended -1
+            codes = np.append(level_index.get_indexer(native.cat.categories), -1)[
+                native.cat.codes.to_numpy()
+            ]
+        elif isinstance(native, pd.Series):
+            codes = level_index.get_indexer(native.to_numpy())
+
+        # otherwise look up the unique values and replace each row's value with its code, rather
+        # than converting every row to numpy
+        else:
+            values = X[c]
+
+            if values.dtype == nw.Categorical:
+                values = values.cast(nw.String)
+
+            uniques = values.drop_nulls().unique().to_list()
+
+            codes = (
+                values.replace_strict(
+                    uniques,
+                    level_index.get_indexer(uniques).tolist(),
+                    return_dtype=nw.Int64,
+                )
+                .fill_null(-1)
+                .to_numpy()
             )
 
-        elif hasattr(self._encoder, "get_feature_names_out"):
-            input_columns = self._encoder.get_feature_names_out(
-                input_features=input_features,
-                **kwargs,
+        unseen = codes == -1
+
+        if unseen.any():
+            unseen_values = X[c].filter(
+                nw.new_series(
+                    "unseen",
+                    unseen,
+                    nw.Boolean,
+                    native_namespace=nw.get_native_namespace(X),
+                ),
             )
 
-        else:
-            msg = "Cannot access scikit learn OneHotEncoder get_feature_names method, may be a version issue"
-            raise AttributeError(msg)
+            if unseen_values.is_null().any():
+                raise self._null_error(c)
 
-        return input_columns
+            # unseen levels are expected to be encoded as other_level
+            if self._prunes_levels():
+                return np.where(unseen, len(level_index), codes)
 
-    def transform(self, X: pd.DataFrame) -> pd.DataFrame:
+            unseen_levels = set(unseen_values.unique().to_list())
+
+            warnings.warn(
+                f"{self.classname()}: column {c} has unseen categories: {unseen_levels}",
+                UserWarning,
+                stacklevel=4,
+            )
+
+        return codes
+
+    def _encode(self, X: nw.DataFrame) -> tuple[nw.DataFrame, dict[str, np.ndarray]]:
+        """Find the level codes of each column, in one lookup per column that also checks for
+        nulls and unseen levels.
+
+        Returns X and the codes of each column.
+        """
+        # Check that transformer has been fit before calling transform
+        self.check_is_fitted(["categories_"])
+
+        X = nw.from_native(BaseTransformer.transform(self, X))
+
+        return X, {c: self._level_codes(X, c) for c in self.columns}
+
+    def _sparse_dummies(self, codes: dict[str, np.ndarray]) -> sparse.csr_matrix:
+        """CSR matrix of dummies from the level codes of each column, with a column per dummy."""
+        rows, dummy_positions = [], []
+        offset = 0
+
+        for c in self.columns:
+            seen = np.flatnonzero(codes[c] != -1)
+
+            rows.append(seen)
+            dummy_positions.append(codes[c][seen] + offset)
+
+            offset += len(self.dummy_columns_[c])
+
+        rows = np.concatenate(rows)
+
+        return sparse.csr_matrix(
+            (
+                np.ones(len(rows), dtype=self.dtype),
+                (rows, np.concatenate(dummy_positions)),
+            ),
+            shape=(len(codes[self.columns[0]]), offset),
+        )
+
+    @nw.narwhalify(eager_only=True)
+    def transform_sparse(self, X: FrameT) -> sparse.csr_matrix:
+        """One hot encode categorical fields into a sparse matrix, for models that accept sparse
+        input alongside or instead of X.
+
+        Parameters
+        ----------
+        X : pd.DataFrame or pl.DataFrame
+            Data to apply one hot encoding to.
+
+        Returns
+        -------
+        X_sparse : scipy.sparse.csr_matrix
+            Matrix with a row per row of X and a column per dummy column created by transform, in the
+            same order. Values have type dtype.
+
+        """
+        return self._sparse_dummies(self._encode(X)[1])
+
+    @nw.narwhalify
+    def transform(self, X: FrameT) -> FrameT:
         """Create new dummy columns from categorical fields.
 
         Parameters
         ----------
-        X : pd.DataFrame
+        X : pd.DataFrame or pl.DataFrame
             Data to apply one hot encoding to.
 
         Returns
         -------
-        X_transformed : pd.DataFrame
+        X_transformed : pd.DataFrame or pl.DataFrame
             Transformed input X with dummy columns derived from categorical columns added. If drop_original
             = True then the original categorical columns that the dummies are created from will not be in
-            the output X.
+            the output X. If sparse_output = True the dummy columns are SparseDtype columns.
 
         """
+        X, codes = self._encode(X)
 
-        # Check that transformer has been fit before calling transform
-        self.check_is_fitted(["categories_"])
+        if self.sparse_output and nw.get_native_namespace(X) is not pd:
+            msg = f"{self.classname()}: sparse_output is only supported for pandas DataFrames, use transform_sparse for other inputs"
+            raise ValueError(msg)
 
-        X = BaseTransformer.transform(self, X)
+        dummy_columns = [name for c in self.columns for name in self.dummy_columns_[c]]
+
+        # polars frames without columns have no rows, so count rows before dropping columns
+        n_rows = X.shape[0]
+
+        # Drop original columns if self.drop_original is True
+        X = DropOriginalMixin.drop_original_column(
+            self,
+            X,
+            self.drop_original,
+            self.columns,
+        )
+
+        if self.sparse_output:
+            dummies = pd.DataFrame.sparse.from_spmatrix(
+                self._sparse_dummies(codes),
+                columns=dummy_columns,
+                index=nw.to_native(X).index,
+            )
 
-        # Check for nulls
+            return nw.from_native(
+                pd.concat((nw.to_native(X), dummies), axis=1),
+            )
+
+        # set the 1s of every dummy column at once, in a column-major block so each dummy column is
+        # contiguous
+        block = np.zeros((n_rows, len(dummy_columns)), dtype=self.dtype, order="F")
+
+        offset = 0
         for c in self.columns:
-            if X[c].isna().sum() > 0:
-                raise ValueError(
-                    f"{self.classname()}: column %s has nulls - replace before proceeding"
-                    % c,
-                )
+            seen = np.flatnonzero(codes[c] != -1)
+            block[seen, codes[c][seen] + offset] = 1
 
-        # Print warning for unseen levels
-        for i, c in enumerate(self.columns):
-            unseen_levels = set(X[c].unique().tolist()) - set(self.categories_[i])
-            if len(unseen_levels) > 0:
-                warnings.warn(
-                    f"{self.classname()}: column {c} has unseen categories: {unseen_levels}",
-                    UserWarning,
-                    stacklevel=2,
-                )
+            offset += len(self.dummy_columns_[c])
 
-        # Apply OHE transform
-        X_transformed = self._encoder.transform(X[self.columns])
+        native_namespace = nw.get_native_namespace(X)
 
-        input_columns = self._get_feature_names(input_features=self.columns)
+        # concatenate a single frame of dummies, rather than adding columns one at a time
+        if native_namespace is pd:
+            # the block is not shared, so it does not need copying under copy on write
+            dummies = pd.DataFrame(
+                block,
+                columns=dummy_columns,
+                index=nw.to_native(X).index,
+                copy=False,
+            )
 
-        X_transformed = pd.DataFrame(
-            X_transformed,
-            columns=input_columns,
-            index=X.index,
+            return nw.from_native(
+                pd.concat((nw.to_native(X), dummies), axis=1),
+            )
+
+        dummies = nw.from_dict(
+            {name: block[:, i] for i, name in enumerate(dummy_columns)},
+            native_namespace=native_namespace,
         )
 
-        # Rename dummy fields if separator is specified
-        if self.separator != "_":
-            old_names = [
-                c + "_" + str(lvl)
-                for i, c in enumerate(self.columns)
-                for lvl in self._encoder.categories_[i]
-            ]
-            new_names = [
-                c + self.separator + str(lvl)
-                for i, c in enumerate(self.columns)
-                for lvl in self._encoder.categories_[i]
-            ]
+        return nw.concat([X, dummies], how="horizontal")
+
+
+class HashingEncoderTransformer(BaseTransformer):
+    """Transformer to encode categorical variables with the hashing trick, where each level is
+    mapped to one of a fixed number of buckets by a hash of its value.
+
+    As the buckets are set by the hash there is nothing to learn in fit and nothing is stored per
+    level, so memory use does not grow with the cardinality of the columns. Distinct levels can share
+    a bucket.
+
+    Values are hashed as strings with pandas.util.hash_array, which is deterministic across
+    sessions and machines and gives the same buckets for pandas and polars inputs.
+
+    Parameters
+    ----------
+    columns : str or list of strings
+        Names of columns to encode.
+
+    n_buckets : int, default = 1024
+        Number of buckets to hash levels into.
+
+    alternate_sign : bool, default = False
+        If True each level has a sign, set by a second hash with a different key so it is
+        independent of the bucket, which is used as its value in the matrix returned by
+        transform_sparse, so collisions tend to cancel rather than add.
+
+    **kwargs
+        Arbitrary keyword arguments passed onto BaseTransformer.init method.
+
+    Attributes
+    ----------
+    n_buckets : int
+        Number of buckets to hash levels into.
+
+    alternate_sign : bool
+        Whether levels have a sign in the output of transform_sparse.
+
+    polars_compatible : bool
+        class attribute, indicates whether transformer has been converted to polars/pandas agnostic narwhals framework
+
+    """
+
+    polars_compatible = True
+
+    FITS = False
+
+    # 16 character key for the hash setting the sign of levels, differing from the default key of
+    # pandas.util.hash_array used for the buckets
+    _sign_hash_key = "hashing_sign_key"
+
+    def __init__(
+        self,
+        columns: str | list[str],
+        n_buckets: int = 1024,
+        alternate_sign: bool = False,
+        **kwargs: dict[str, bool],
+    ) -> None:
+        if type(n_buckets) is not int or n_buckets < 1:
+            msg = f"{self.classname()}: n_buckets should be a positive int"
+            raise ValueError(msg)
+
+        if not isinstance(alternate_sign, bool):
+            msg = f"{self.classname()}: alternate_sign should be a bool"
+            raise TypeError(msg)
+
+        self.n_buckets = n_buckets
+        self.alternate_sign = alternate_sign
+
+        super().__init__(columns=columns, **kwargs)
 
-            X_transformed = X_transformed.rename(
-                columns=dict(zip(old_names, new_names)),
+    def _hash_column(
+        self,
+        X: nw.DataFrame,
+        c: str,
+        hash_key: str = "0123456789123456",
+    ) -> np.ndarray:
+        """64-bit hash of the value of column c in each row of X, with the given 16 character
+        hash_key, which defaults to that of pandas.util.hash_array."""
+        if X[c].is_null().any():
+            msg = (
+                f"{self.classname()}: column {c} has nulls - replace before proceeding"
             )
+            raise ValueError(msg)
 
-        # Drop original columns if self.drop_original is True
-        DropOriginalMixin.drop_original_column(
-            self,
-            X,
-            self.drop_original,
-            self.columns,
+        native = nw.to_native(X[c])
+
+        # hash the categories rather than casting every row to str
+        if isinstance(native, pd.Series) and isinstance(
+            native.dtype,
+            pd.CategoricalDtype,
+        ):
+            return pd.util.hash_array(
+                native.cat.categories.astype(str).to_numpy(dtype=object),
+                hash_key=hash_key,
+                categorize=False,
+            )[native.cat.codes.to_numpy()]
+
+        return pd.util.hash_array(
+            X[c].cast(nw.String).to_numpy().astype(object),
+            hash_key=hash_key,
+            categorize=False,
         )
 
-        # Concatenate original and new dummy fields
-        return pd.concat((X, X_transformed), axis=1)
+    @nw.narwhalify
+    def transform(self, X: FrameT) -> FrameT:
+        """Replace the values of each column with the index of their bucket.
+
+        Parameters
+        ----------
+        X : pd.DataFrame or pl.DataFrame
+            Data to encode.
+
+        Returns
+        -------
+        X : pd.DataFrame or pl.DataFrame
+            Input X with columns replaced by Int64 bucket indices, from 0 to n_buckets - 1.
+
+        """
+        X = nw.from_native(super().transform(X))
+
+        native_namespace = nw.get_native_namespace(X)
+
+        return X.with_columns(
+            nw.new_series(
+                c,
+                (self._hash_column(X, c) % self.n_buckets).astype(np.int64),
+                nw.Int64,
+                native_namespace=native_namespace,
+            )
+            for c in self.columns
+        )
+
+    @nw.narwhalify(eager_only=True)
+    def transform_sparse(self, X: FrameT) -> sparse.csr_matrix:
+        """Encode columns as a sparse indicator matrix of their buckets.
+
+        Column i of self.columns occupies matrix columns i * n_buckets to (i + 1) * n_buckets - 1,
+        so levels of different columns do not collide. The matrix is built directly in CSR format
+        from the bucket of each row, with one stored value per row and column.
+
+        Parameters
+        ----------
+        X : pd.DataFrame or pl.DataFrame
+            Data to encode.
+
+        Returns
+        -------
+        X_sparse : scipy.sparse.csr_matrix
+            float64 matrix with a row per row of X and n_buckets columns per column encoded. Entries
+            are 1, or -1 for levels with a negative sign if alternate_sign is True.
+
+        """
+        X = nw.from_native(BaseTransformer.transform(self, X))
+
+        hashes = np.column_stack([self._hash_column(X, c) for c in self.columns])
+
+        indices = (
+            hashes % self.n_buckets + np.arange(len(self.columns)) * self.n_buckets
+        )
+
+        if self.alternate_sign:
+            # a bit of the bucket hash is only independent of the bucket when n_buckets is a power
+            # of two, so the sign comes from a separately keyed hash
+            sign_hashes = np.column_stack(
+                [
+                    self._hash_column(X, c, hash_key=self._sign_hash_key)
+                    for c in self.columns
+                ],
+            )
+            data = np.where(sign_hashes >> np.uint64(63), -1.0, 1.0)
+        else:
+            data = np.ones(hashes.shape)
+
+        n_rows, n_columns = hashes.shape
+
+        return sparse.csr_matrix(
+            (
+                data.ravel(),
+                indices.ravel().astype(np.int64),
+                np.arange(0, n_rows * n_columns + 1, n_columns),
+            ),
+            shape=(n_rows, n_columns * self.n_buckets),
+        )